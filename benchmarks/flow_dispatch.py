@@ -0,0 +1,107 @@
+import asyncio
+import timeit
+import typing as t
+from unittest.mock import Mock
+
+from pyuow import aio
+from pyuow.result import Result
+from pyuow.unit import ConditionalUnit, ErrorUnit, FinalUnit, FlowUnit, RunUnit
+
+STEPS = 40
+NUMBER = 10_000
+REPEAT = 5
+
+
+class Step(RunUnit[Mock, None]):
+    def run(self, context: Mock) -> None:
+        pass
+
+
+class Check(ConditionalUnit[Mock, None]):
+    def condition(self, context: Mock) -> bool:
+        return True
+
+
+class Done(FinalUnit[Mock, None]):
+    def finish(self, context: Mock) -> Result[None]:
+        return Result.empty()
+
+
+class AsyncStep(aio.RunUnit[Mock, None]):
+    async def run(self, context: Mock) -> None:
+        pass
+
+
+class AsyncCheck(aio.ConditionalUnit[Mock, None]):
+    async def condition(self, context: Mock) -> bool:
+        return True
+
+
+class AsyncDone(aio.FinalUnit[Mock, None]):
+    async def finish(self, context: Mock) -> Result[None]:
+        return Result.empty()
+
+
+def sync_flow() -> FlowUnit[Mock, None]:
+    flow: FlowUnit[Mock, None] = Step()
+    for index in range(STEPS - 2):
+        flow = flow >> (
+            Check(on_failure=ErrorUnit(exc=Exception()))
+            if index % 2
+            else Step()
+        )
+    return flow >> Done()
+
+
+def async_flow() -> aio.FlowUnit[Mock, None]:
+    flow: aio.FlowUnit[Mock, None] = AsyncStep()
+    for index in range(STEPS - 2):
+        flow = flow >> (
+            AsyncCheck(on_failure=aio.ErrorUnit(exc=Exception()))
+            if index % 2
+            else AsyncStep()
+        )
+    return flow >> AsyncDone()
+
+
+def measure(fn: t.Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, repeat=REPEAT, number=number))
+
+
+def report(name: str, recursive: float, compiled: float) -> None:
+    print(
+        f"{name}: recursive {recursive / NUMBER * 1e6:.2f}us,"
+        f" compiled {compiled / NUMBER * 1e6:.2f}us,"
+        f" speedup x{recursive / compiled:.2f}"
+    )
+
+
+def main() -> None:
+    context = Mock()
+
+    flow = sync_flow().build()
+    report(
+        "sync",
+        measure(lambda: flow.root(context), NUMBER),
+        measure(lambda: flow(context), NUMBER),
+    )
+
+    async_compiled = async_flow().build()
+
+    async def run_recursive() -> None:
+        for _ in range(NUMBER):
+            await async_compiled.root(context)
+
+    async def run_compiled() -> None:
+        for _ in range(NUMBER):
+            await async_compiled(context)
+
+    report(
+        "async",
+        measure(lambda: asyncio.run(run_recursive()), 1),
+        measure(lambda: asyncio.run(run_compiled()), 1),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from .result import MissingOutError, Result
 from .unit import (
     BaseUnit,
     CannotReassignUnitError,
+    CompiledFlow,
     ConditionalUnit,
     ErrorUnit,
     FinalUnit,
@@ -25,6 +26,7 @@ __all__ = (
     "BaseParams",
     "BaseUnit",
     "CannotReassignUnitError",
+    "CompiledFlow",
     "ConditionalUnit",
     "ErrorUnit",
     "FinalUnit",
@@ -1,17 +1,35 @@
 from ..unit.aio import (
     BaseUnit,
+    CachedUnit,
+    CompiledFlow,
     ConditionalUnit,
+    DataPointGraphUnit,
     ErrorUnit,
     FinalUnit,
     FlowUnit,
+    ParallelUnit,
     RunUnit,
+    ThreadedFlowUnit,
+    ThreadedRunUnit,
+    UnitThreadPool,
+    deadline,
+    remaining_time,
 )
 
 __all__ = (
     "BaseUnit",
+    "CachedUnit",
+    "CompiledFlow",
     "ConditionalUnit",
+    "DataPointGraphUnit",
     "ErrorUnit",
     "FinalUnit",
     "FlowUnit",
+    "ParallelUnit",
     "RunUnit",
+    "ThreadedFlowUnit",
+    "ThreadedRunUnit",
+    "UnitThreadPool",
+    "deadline",
+    "remaining_time",
 )
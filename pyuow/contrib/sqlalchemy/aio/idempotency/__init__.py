@@ -0,0 +1,3 @@
+from .impl import SqlAlchemyIdempotencyStore
+
+__all__ = ("SqlAlchemyIdempotencyStore",)
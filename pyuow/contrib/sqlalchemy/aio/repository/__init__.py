@@ -1,3 +1,4 @@
+from ...repository import BulkUpdateResult
 from .base import (
     BaseSqlAlchemyEntityRepository,
     BaseSqlAlchemyRepositoryFactory,
@@ -10,4 +11,5 @@ __all__ = (
     "BaseSqlAlchemyRepositoryFactory",
     "BaseSqlAlchemyViewRepository",
     "BaseSqlAlchemyViewRepositoryFactory",
+    "BulkUpdateResult",
 )
@@ -1,5 +1,6 @@
 import typing as t
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 
 from .....clock import offset_naive_utcnow
@@ -7,13 +8,23 @@ from ...tables import SoftDeletableEntityTable
 
 try:
     from sqlalchemy import (
+        ARRAY,
         ColumnElement,
+        Table,
+        Update,
+        any_,
+        bindparam,
+        cast,
+        column,
         delete,
         exists,
         insert,
+        inspect,
         select,
         update,
+        values,
     )
+    from sqlalchemy.exc import NoResultFound
     from sqlalchemy.sql.selectable import Select
 except ImportError:  # pragma: no cover
     raise ImportError(
@@ -21,16 +32,25 @@ except ImportError:  # pragma: no cover
         " please install pyuow[sqlalchemy]"
     )
 
+from .....contrib.sqlalchemy.aio.work import VersionConflictError
 from .....contrib.sqlalchemy.aio.work.impl import (
     SqlAlchemyReadOnlyTransactionManager,
+    SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
 )
+from .....contrib.sqlalchemy.repository.base import BulkUpdateResult
+from .....contrib.sqlalchemy.repository.dialects import (
+    ID_ARRAYS,
+    STREAM_ISOLATION,
+    UPDATE_FROM_VALUES,
+)
 from .....contrib.sqlalchemy.tables import (
     AuditedEntityTable,
     EntityTable,
     VersionedEntityTable,
     ViewTable,
 )
+from .....contrib.sqlalchemy.work.buffer import MAX_PARAMETERS
 from .....entity import (
     AuditedEntity,
     Entity,
@@ -44,6 +64,7 @@ from .....repository.aio import (
     BaseViewRepositoryFactory,
 )
 
+ITEM = t.TypeVar("ITEM")
 ENTITY_ID = t.TypeVar("ENTITY_ID", bound=t.Hashable)
 ENTITY_TYPE = t.TypeVar("ENTITY_TYPE", bound=Entity[t.Any])
 ENTITY_TABLE = t.TypeVar("ENTITY_TABLE", bound=EntityTable)
@@ -61,10 +82,16 @@ class BaseSqlAlchemyEntityRepository(
         table: t.Type[ENTITY_TABLE],
         transaction_manager: SqlAlchemyTransactionManager,
         readonly_transaction_manager: SqlAlchemyReadOnlyTransactionManager,
+        *,
+        chunk_size: int = 1000,
     ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
         self._table = table
         self._transaction_manager = transaction_manager
         self._readonly_transaction_manager = readonly_transaction_manager
+        self._chunk_size = chunk_size
 
     @staticmethod
     @abstractmethod
@@ -79,7 +106,7 @@ class BaseSqlAlchemyEntityRepository(
     async def find(self, entity_id: ENTITY_ID) -> t.Optional[ENTITY_TYPE]:
         statement = self.safe_select().where(self._table.id == entity_id)
 
-        async with self._readonly_transaction_manager.transaction() as trx:
+        async with self._reading() as trx:
             result = (await trx.it().execute(statement)).scalar_one_or_none()
 
         return self.to_entity(result) if result else None
@@ -87,17 +114,29 @@ class BaseSqlAlchemyEntityRepository(
     async def find_all(
         self, entity_ids: t.Iterable[ENTITY_ID]
     ) -> t.Iterable[ENTITY_TYPE]:
-        statement = self.safe_select().where(self._table.id.in_(entity_ids))
+        async with self.iter_all(entity_ids) as entities:
+            return [entity async for entity in entities]
 
-        async with self._readonly_transaction_manager.transaction() as trx:
-            result = (await trx.it().execute(statement)).scalars().all()
+    @asynccontextmanager
+    async def iter_all(
+        self,
+        entity_ids: t.Iterable[ENTITY_ID],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.AsyncIterator[t.AsyncIterator[ENTITY_TYPE]]:
+        size = self._chunk_size if chunk_size is None else chunk_size
+        ids = list(dict.fromkeys(entity_ids))
+
+        if size < 1:
+            raise ValueError("chunk_size must be positive")
 
-        return [self.to_entity(record) for record in result]
+        async with self._reading(detached=True) as trx:
+            yield self._iter_chunks(trx, ids, size)
 
     async def get(self, entity_id: ENTITY_ID) -> ENTITY_TYPE:
         statement = self.safe_select().where(self._table.id == entity_id)
 
-        async with self._readonly_transaction_manager.transaction() as trx:
+        async with self._reading() as trx:
             result = (await trx.it().execute(statement)).scalar_one()
 
         return self.to_entity(result)
@@ -109,75 +148,155 @@ class BaseSqlAlchemyEntityRepository(
             .select()
         )
 
-        async with self._readonly_transaction_manager.transaction() as trx:
+        async with self._reading() as trx:
             return (await trx.it().execute(statement)).scalar() or False
 
     async def add(self, entity: ENTITY_TYPE) -> ENTITY_TYPE:
+        record = self.to_record(entity)
         statement = (
-            insert(self._table)
-            .values(**asdict(self.to_record(entity)))
-            .returning(self._table)
+            insert(self._table).values(**asdict(record)).returning(self._table)
         )
 
         async with self._transaction_manager.transaction() as trx:
+            if trx.buffer is not None:
+                trx.buffer.insert(self._table, asdict(record))
+                return self.to_entity(record)
+
             result = (await trx.it().execute(statement)).scalar_one()
 
         return self.to_entity(result)
 
     async def add_all(
-        self, entities: t.Sequence[ENTITY_TYPE]
+        self,
+        entities: t.Sequence[ENTITY_TYPE],
+        *,
+        chunk_size: t.Optional[int] = None,
     ) -> t.Iterable[ENTITY_TYPE]:
-        return [await self.add(entity) for entity in entities]
+        records = [self.to_record(entity) for entity in entities]
+        statement = insert(self._table).returning(
+            self._table, sort_by_parameter_order=True
+        )
+        size = self._chunk_size if chunk_size is None else chunk_size
+        added: t.List[ENTITY_TYPE] = []
 
-    async def update(self, entity: ENTITY_TYPE) -> ENTITY_TYPE:
-        record = self.to_record(entity)
-        conditions = self._exclude_deleted()
+        if size < 1:
+            raise ValueError("chunk_size must be positive")
+        if not records:
+            return added
 
-        if (
-            isinstance(record, AuditedEntityTable)
-            and issubclass(self._table, AuditedEntityTable)
-            and isinstance(entity, AuditedEntity)
-        ):
-            record.updated_date = offset_naive_utcnow()
-            conditions.append(self._table.created_date == entity.created_date)
-            conditions.append(self._table.updated_date == entity.updated_date)
+        async with self._transaction_manager.transaction() as trx:
+            if trx.buffer is not None:
+                for record in records:
+                    trx.buffer.insert(self._table, asdict(record))
+                return [self.to_entity(record) for record in records]
+
+            for chunk in _chunked(records, size):
+                result = await trx.it().execute(
+                    statement, [asdict(record) for record in chunk]
+                )
+                added.extend(self.to_entity(row) for row in result.scalars())
 
-        if (
-            isinstance(record, VersionedEntityTable)
-            and issubclass(self._table, VersionedEntityTable)
-            and isinstance(entity, VersionedEntity)
-        ):
-            record.version = entity.version.next()
-            conditions.append(self._table.version == entity.version)
+        return added
 
+    async def update(self, entity: ENTITY_TYPE) -> ENTITY_TYPE:
+        record, guards = self._prepare_update(entity)
         statement = (
             update(self._table)
             .values(**asdict(record))
-            .where(self._table.id == entity.id, *conditions)
+            .where(*self._guarded(guards))
             .returning(self._table)
         )
 
         async with self._transaction_manager.transaction() as trx:
-            result = (await trx.it().execute(statement)).scalar_one()
+            if trx.buffer is not None:
+                trx.buffer.update(self._table, asdict(record), guards)
+                return self.to_entity(record)
+
+            result = (await trx.it().execute(statement)).scalar_one_or_none()
+
+        if result is None:
+            raise self._not_updated([entity.id])
 
         return self.to_entity(result)
 
     async def update_all(
         self, entities: t.Sequence[ENTITY_TYPE]
     ) -> t.Iterable[ENTITY_TYPE]:
-        return [await self.update(entity) for entity in entities]
+        result = await self.try_update_all(entities)
+
+        if result.conflicts:
+            raise self._not_updated(result.conflicts)
+
+        return result.updated
+
+    async def try_update_all(
+        self,
+        entities: t.Sequence[ENTITY_TYPE],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> BulkUpdateResult[ENTITY_ID, ENTITY_TYPE]:
+        size = self._chunk_size if chunk_size is None else chunk_size
+        prepared = [self._prepare_update(entity) for entity in entities]
+        result: BulkUpdateResult[ENTITY_ID, ENTITY_TYPE] = BulkUpdateResult()
+
+        if size < 1:
+            raise ValueError("chunk_size must be positive")
+        if len({guards["id"] for _, guards in prepared}) < len(prepared):
+            raise ValueError("entities must have unique ids")
+        if not prepared:
+            return result
+
+        async with self._transaction_manager.transaction() as trx:
+            await trx.flush()
+
+            if trx.it().get_bind().dialect.name not in UPDATE_FROM_VALUES:
+                for record, guards in prepared:
+                    statement = (
+                        update(self._table)
+                        .values(**asdict(record))
+                        .where(*self._guarded(guards))
+                        .returning(self._table)
+                    )
+                    updated = (
+                        await trx.it().execute(statement)
+                    ).scalar_one_or_none()
+                    result.add(
+                        guards["id"],
+                        None if updated is None else self.to_entity(updated),
+                    )
+                return result
+
+            record, guards = prepared[0]
+            width = len(asdict(record)) + len(guards) - 1
+            size = min(size, max(1, MAX_PARAMETERS // width))
+            for chunk in _chunked(prepared, size):
+                returned = {
+                    row.id: self._table(**row._mapping)
+                    for row in await trx.it().execute(
+                        self._update_from_values(chunk)
+                    )
+                }
+                for _, guards in chunk:
+                    match = returned.get(guards["id"])
+                    result.add(
+                        guards["id"],
+                        None if match is None else self.to_entity(match),
+                    )
+
+            trx.it().expire_all()
+
+        return result
 
     async def delete(self, entity: ENTITY_TYPE) -> bool:
+        deleted_date = (
+            entity.deleted_date
+            if isinstance(entity, SoftDeletableEntity) and entity.deleted_date
+            else offset_naive_utcnow()
+        )
         statement = (
             (
                 update(self._table)
-                .values(
-                    deleted_date=(
-                        entity.deleted_date
-                        if entity.deleted_date
-                        else offset_naive_utcnow()
-                    )
-                )
+                .values(deleted_date=deleted_date)
                 .where(self._table.id == entity.id)
                 .returning(self._table.id)
             )
@@ -190,16 +309,213 @@ class BaseSqlAlchemyEntityRepository(
         )
 
         async with self._transaction_manager.transaction() as trx:
+            if trx.buffer is not None:
+                if isinstance(entity, SoftDeletableEntity):
+                    trx.buffer.update(
+                        self._table,
+                        {"deleted_date": deleted_date},
+                        {"id": entity.id},
+                    )
+                else:
+                    trx.buffer.delete(self._table, entity.id)
+                return True
+
             identifier = (await trx.it().execute(statement)).scalar_one()
 
         return t.cast(bool, identifier == entity.id)
 
     async def delete_all(self, entities: t.Sequence[ENTITY_TYPE]) -> bool:
-        return all([await self.update(entity) for entity in entities])
+        deleted = await self.try_delete_all(entities)
+        return len(deleted) == len({entity.id for entity in entities})
+
+    async def try_delete_all(
+        self,
+        entities: t.Sequence[ENTITY_TYPE],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.List[ENTITY_ID]:
+        size = self._chunk_size if chunk_size is None else chunk_size
+        ids = list(dict.fromkeys(entity.id for entity in entities))
+        soft = issubclass(self._table, SoftDeletableEntityTable)
+        deleted_date = offset_naive_utcnow()
+        affected: t.Set[t.Any] = set()
+
+        if size < 1:
+            raise ValueError("chunk_size must be positive")
+        if not ids:
+            return []
+
+        async with self._transaction_manager.transaction() as trx:
+            await trx.flush()
+
+            for chunk in _chunked(ids, size):
+                statement = (
+                    update(self._table)
+                    .values(deleted_date=deleted_date)
+                    .where(
+                        self._table.id.in_(chunk),
+                        *self._exclude_deleted(),
+                    )
+                    if soft
+                    else delete(self._table).where(self._table.id.in_(chunk))
+                )
+                result = await trx.it().execute(
+                    statement.returning(self._table.id)
+                )
+                affected.update(result.scalars())
+
+        return [entity_id for entity_id in ids if entity_id in affected]
 
     def safe_select(self) -> Select[t.Any]:
         return select(self._table).where(*self._exclude_deleted())
 
+    def _matching(
+        self, entity_ids: t.Sequence[ENTITY_ID], dialect: str
+    ) -> ColumnElement[bool]:
+        if dialect not in ID_ARRAYS:
+            return self._table.id.in_(entity_ids)
+
+        table = t.cast(Table, self._table.__table__)
+        return table.c.id == any_(
+            bindparam(
+                "entity_ids", list(entity_ids), type_=ARRAY(table.c.id.type)
+            )
+        )
+
+    def _not_updated(self, entity_ids: t.Sequence[t.Any]) -> NoResultFound:
+        if issubclass(self._table, (AuditedEntityTable, VersionedEntityTable)):
+            return VersionConflictError(
+                f"{len(entity_ids)} {self._table.__name__} row(s) were changed "
+                f"or deleted by another transaction: {list(entity_ids)}"
+            )
+        return NoResultFound(
+            f"{len(entity_ids)} {self._table.__name__} row(s) were not "
+            f"found: {list(entity_ids)}"
+        )
+
+    def _prepare_update(
+        self, entity: ENTITY_TYPE
+    ) -> t.Tuple[ENTITY_TABLE, t.Dict[str, t.Any]]:
+        record = self.to_record(entity)
+        guards: t.Dict[str, t.Any] = {"id": entity.id}
+
+        if issubclass(self._table, SoftDeletableEntityTable):
+            guards["deleted_date"] = None
+
+        if (
+            isinstance(record, AuditedEntityTable)
+            and issubclass(self._table, AuditedEntityTable)
+            and isinstance(entity, AuditedEntity)
+        ):
+            record.updated_date = offset_naive_utcnow()
+            guards["created_date"] = entity.created_date
+            guards["updated_date"] = entity.updated_date
+
+        if (
+            isinstance(record, VersionedEntityTable)
+            and issubclass(self._table, VersionedEntityTable)
+            and isinstance(entity, VersionedEntity)
+        ):
+            record.version = entity.version.next()
+            guards["version"] = entity.version
+
+        return record, guards
+
+    def _guarded(
+        self, guards: t.Mapping[str, t.Any]
+    ) -> t.List[ColumnElement[bool]]:
+        columns = inspect(self._table).columns
+        return [
+            columns[name].is_(None)
+            if value is None
+            else columns[name] == value
+            for name, value in guards.items()
+        ]
+
+    def _update_from_values(
+        self, chunk: t.Sequence[t.Tuple[ENTITY_TABLE, t.Dict[str, t.Any]]]
+    ) -> Update:
+        table = t.cast(Table, self._table.__table__)
+        columns = inspect(self._table).columns
+        first, expected = chunk[0]
+        names = list(asdict(first))
+        compared = [
+            name
+            for name, value in expected.items()
+            if value is not None and name != "id"
+        ]
+        nulls = [name for name, value in expected.items() if value is None]
+        data = values(
+            *(column(name, columns[name].type) for name in names),
+            *(
+                column(f"guard_{name}", columns[name].type)
+                for name in compared
+            ),
+            name="pyuow_updates",
+        ).data(
+            [
+                (
+                    *asdict(record).values(),
+                    *(guards[name] for name in compared),
+                )
+                for record, guards in chunk
+            ]
+        )
+
+        def typed(name: str, source: str) -> ColumnElement[t.Any]:
+            return cast(data.c[source], columns[name].type)
+
+        return (
+            update(table)
+            .where(
+                columns["id"] == typed("id", "id"),
+                *(
+                    columns[name] == typed(name, f"guard_{name}")
+                    for name in compared
+                ),
+                *(columns[name].is_(None) for name in nulls),
+            )
+            .values(
+                {
+                    columns[name]: typed(name, name)
+                    for name in names
+                    if name != "id"
+                }
+            )
+            .returning(
+                *(mapped.label(name) for name, mapped in columns.items())
+            )
+        )
+
+    async def _iter_chunks(
+        self,
+        trx: SqlAlchemyTransaction,
+        ids: t.Sequence[ENTITY_ID],
+        size: int,
+    ) -> t.AsyncIterator[ENTITY_TYPE]:
+        dialect = trx.it().get_bind().dialect.name
+        for chunk in _chunked(ids, size):
+            statement = self.safe_select().where(
+                self._matching(chunk, dialect)
+            )
+            result = (await trx.it().execute(statement)).scalars().all()
+            for record in result:
+                yield self.to_entity(record)
+
+    @asynccontextmanager
+    async def _reading(
+        self, *, detached: bool = False
+    ) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        if trx := self._transaction_manager.current():
+            await trx.flush(self._table)
+            yield trx
+        elif detached:
+            async with self._readonly_transaction_manager.detached() as trx:
+                yield trx
+        else:
+            async with self._readonly_transaction_manager.transaction() as trx:
+                yield trx
+
     def _exclude_deleted(self) -> t.List[ColumnElement[bool]]:
         conditions: t.List[ColumnElement[bool]] = []
 
@@ -257,6 +573,30 @@ class BaseSqlAlchemyViewRepository(
 
         return [self.to_view(record) for record in result]
 
+    @asynccontextmanager
+    async def stream_all_by(
+        self, criteria: ColumnElement[bool], *, batch_size: int = 1000
+    ) -> t.AsyncIterator[t.AsyncIterator[VIEW_TYPE]]:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        statement = self.select().where(criteria)
+
+        async with self._readonly_transaction_manager.detached() as trx:
+            isolation = STREAM_ISOLATION.get(trx.it().get_bind().dialect.name)
+            if isolation is not None:
+                await trx.it().connection(
+                    execution_options={"isolation_level": isolation}
+                )
+
+            result = await trx.it().stream_scalars(
+                statement, execution_options={"yield_per": batch_size}
+            )
+            try:
+                yield (self.to_view(record) async for record in result)
+            finally:
+                await result.close()
+
     async def get_by(self, criteria: ColumnElement[bool]) -> VIEW_TYPE:
         statement = self.select().where(criteria)
 
@@ -281,3 +621,10 @@ class BaseSqlAlchemyViewRepositoryFactory(BaseViewRepositoryFactory, ABC):
         readonly_transaction_manager: SqlAlchemyReadOnlyTransactionManager,
     ) -> None:
         self._readonly_transaction_manager = readonly_transaction_manager
+
+
+def _chunked(
+    items: t.Sequence[ITEM], size: int
+) -> t.Iterator[t.Sequence[ITEM]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -1,11 +1,33 @@
+from ...work import (
+    VERSION_CONFLICT_ERRORS,
+    ReplicaBalancing,
+    RollbackOnlyError,
+    VersionConflictError,
+    pin_scope,
+    reset_pin,
+)
 from .impl import (
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
 )
+from .routing import (
+    SqlAlchemyRoutingReadOnlyTransactionManager,
+    ping,
+    postgres_replica_lag,
+)
 
 __all__ = (
+    "VERSION_CONFLICT_ERRORS",
+    "ReplicaBalancing",
+    "RollbackOnlyError",
     "SqlAlchemyReadOnlyTransactionManager",
+    "SqlAlchemyRoutingReadOnlyTransactionManager",
     "SqlAlchemyTransaction",
     "SqlAlchemyTransactionManager",
+    "VersionConflictError",
+    "pin_scope",
+    "ping",
+    "postgres_replica_lag",
+    "reset_pin",
 )
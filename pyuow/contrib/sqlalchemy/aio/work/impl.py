@@ -1,13 +1,14 @@
+import asyncio
 import typing as t
-from asyncio import current_task
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 try:
+    from sqlalchemy import CursorResult
     from sqlalchemy.ext.asyncio import (
         AsyncEngine,
         AsyncSession,
         AsyncSessionTransaction,
-        async_scoped_session,
         async_sessionmaker,
     )
 except ImportError:  # pragma: no cover
@@ -17,9 +18,50 @@ except ImportError:  # pragma: no cover
     )
 
 from .....work.aio.transactional import BaseTransaction, BaseTransactionManager
+from ...tables import BaseTable
+from ...work.buffer import WriteBuffer
+from ...work.exceptions import RollbackOnlyError
+from ...work.replicas import mark_write
+from ...work.tracking import WRITTEN, WriteTrackingSession
+
+_AMBIENT = "pyuow_ambient_transaction"
+_BUFFER = "pyuow_write_buffer"
+_ROLLBACK_ONLY = "pyuow_rollback_only"
 
 
 class SqlAlchemyTransaction(BaseTransaction[AsyncSession]):
+    def __init__(
+        self,
+        transaction_provider: AsyncSession,
+        *,
+        joined: bool = False,
+        buffer: t.Optional[WriteBuffer] = None,
+    ) -> None:
+        super().__init__(transaction_provider)
+        self._joined = joined
+        self._buffer = buffer
+
+    @property
+    def buffer(self) -> t.Optional[WriteBuffer]:
+        return self._buffer
+
+    async def flush(self, table: t.Optional[t.Type[BaseTable]] = None) -> None:
+        if not self._buffer:
+            return
+        if table is not None and not self._buffer.pending(table):
+            return
+
+        dialect = self._transaction_provider.get_bind().dialect
+
+        for pending in self._buffer.drain():
+            for execution in pending.executions(dialect):
+                result = await self._transaction_provider.execute(
+                    execution.statement, execution.parameters
+                )
+                execution.verify(t.cast(CursorResult[t.Any], result))
+
+        self._transaction_provider.expire_all()
+
     async def _get_active_transaction(
         self,
     ) -> t.Union[AsyncSessionTransaction, None]:
@@ -30,33 +72,172 @@ class SqlAlchemyTransaction(BaseTransaction[AsyncSession]):
 
         return None
 
+    async def is_rollback_only(self) -> bool:
+        trx = await self._get_active_transaction()
+        return (
+            trx is not None
+            and self._transaction_provider.info.get(_ROLLBACK_ONLY) is trx
+        )
+
     async def rollback(self) -> None:
+        if self._joined:
+            if trx := await self._get_active_transaction():
+                self._transaction_provider.info[_ROLLBACK_ONLY] = trx
+            return
+        if self._buffer is not None:
+            self._buffer.clear()
+        if await self.is_rollback_only():
+            del self._transaction_provider.info[_ROLLBACK_ONLY]
+        if not self._transaction_provider.in_nested_transaction():
+            self._transaction_provider.info.pop(WRITTEN, None)
         if trx := await self._get_active_transaction():
             await trx.rollback()
 
     async def commit(self) -> None:
+        if self._joined:
+            return
+        if await self.is_rollback_only():
+            await self.rollback()
+            raise RollbackOnlyError()
+        await self.flush()
         if trx := await self._get_active_transaction():
             await trx.commit()
 
 
+class _SessionScope:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.holder = asyncio.current_task()
+        self.lock = asyncio.Lock()
+
+
 class SqlAlchemyTransactionManager(
     BaseTransactionManager[SqlAlchemyTransaction]
 ):
-    def __init__(self, engine: AsyncEngine) -> None:
-        self._session_factory = async_scoped_session(
-            async_sessionmaker(engine, expire_on_commit=False),
-            scopefunc=current_task,
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        join_ambient: bool = True,
+        deferred_writes: bool = False,
+    ) -> None:
+        self._join_ambient = join_ambient
+        self._deferred_writes = deferred_writes
+        self._session_factory = async_sessionmaker(
+            engine,
+            expire_on_commit=False,
+            sync_session_class=WriteTrackingSession,
+        )
+        self._scope: ContextVar[t.Optional[_SessionScope]] = ContextVar(
+            "pyuow_session", default=None
         )
+        self._live_sessions = 0
+
+    @property
+    def live_sessions(self) -> int:
+        return self._live_sessions
 
     @asynccontextmanager
     async def transaction(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        async with self._scoped() as session:
+            if (
+                self._join_ambient
+                and session.info.get(_AMBIENT)
+                and session.in_transaction()
+            ):
+                yield self._transaction(session, joined=True)
+            else:
+                async with self._begin(session):
+                    yield self._transaction(session)
+
+    @asynccontextmanager
+    async def savepoint(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        async with self._scoped() as session, self._begin(session):
+            yield self._transaction(session)
+
+    def current(self) -> t.Optional[SqlAlchemyTransaction]:
+        scope = self._scope.get()
+
+        if scope is None or not scope.session.in_transaction():
+            return None
+
+        return self._transaction(scope.session, joined=True)
+
+    @asynccontextmanager
+    async def _scoped(self) -> t.AsyncIterator[AsyncSession]:
+        scope = self._scope.get()
+
+        if scope is not None and scope.holder is asyncio.current_task():
+            yield scope.session
+            return
+
+        if scope is not None:
+            async with scope.lock:
+                token = self._scope.set(_SessionScope(scope.session))
+                try:
+                    yield scope.session
+                finally:
+                    self._scope.reset(token)
+            return
+
         session = self._session_factory()
+        token = self._scope.set(_SessionScope(session))
+        self._live_sessions += 1
+
+        try:
+            yield session
+        finally:
+            try:
+                await session.close()
+            finally:
+                self._live_sessions -= 1
+                self._scope.reset(token)
+
+    def _transaction(
+        self, session: AsyncSession, *, joined: bool = False
+    ) -> SqlAlchemyTransaction:
+        return SqlAlchemyTransaction(
+            session, joined=joined, buffer=session.info.get(_BUFFER)
+        )
+
+    @asynccontextmanager
+    async def _begin(self, session: AsyncSession) -> t.AsyncIterator[None]:
         if session.in_transaction():
-            async with session.begin_nested():
-                yield SqlAlchemyTransaction(session)
+            await self._transaction(session).flush()
+            async with session.begin_nested(), self._buffered(session):
+                yield
         else:
             async with session.begin():
-                yield SqlAlchemyTransaction(session)
+                session.info[_AMBIENT] = True
+                if self._deferred_writes:
+                    session.info[_BUFFER] = WriteBuffer()
+                try:
+                    async with self._buffered(session):
+                        yield
+                finally:
+                    del session.info[_AMBIENT]
+                    session.info.pop(_BUFFER, None)
+                    session.info.pop(_ROLLBACK_ONLY, None)
+                    written = session.info.pop(WRITTEN, False)
+            if written:
+                mark_write()
+
+    @asynccontextmanager
+    async def _buffered(self, session: AsyncSession) -> t.AsyncIterator[None]:
+        trx = self._transaction(session)
+
+        try:
+            yield
+        except BaseException:
+            if trx.buffer is not None:
+                trx.buffer.clear()
+            raise
+
+        if await trx.is_rollback_only():
+            del session.info[_ROLLBACK_ONLY]
+            raise RollbackOnlyError()
+
+        await trx.flush()
 
 
 class SqlAlchemyReadOnlyTransactionManager(SqlAlchemyTransactionManager):
@@ -67,5 +248,26 @@ class SqlAlchemyReadOnlyTransactionManager(SqlAlchemyTransactionManager):
 
     @asynccontextmanager
     async def transaction(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
-        async with self._session_factory() as session:
+        async with self._scoped() as session:
             yield SqlAlchemyTransaction(session)
+
+    @asynccontextmanager
+    async def detached(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        session = self._session_factory()
+        self._live_sessions += 1
+
+        try:
+            yield SqlAlchemyTransaction(session)
+        finally:
+            try:
+                await session.close()
+            finally:
+                self._live_sessions -= 1
+
+    @asynccontextmanager
+    async def savepoint(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        async with self.transaction() as trx:
+            yield trx
+
+    def current(self) -> t.Optional[SqlAlchemyTransaction]:
+        return None
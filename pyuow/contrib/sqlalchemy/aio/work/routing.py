@@ -0,0 +1,134 @@
+import asyncio
+import typing as t
+from contextlib import asynccontextmanager
+
+try:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import (
+        AsyncConnection,
+        AsyncEngine,
+        async_sessionmaker,
+    )
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Seems that you are trying to import extra module that was not installed,"
+        " please install pyuow[sqlalchemy]"
+    )
+
+from ...work.replicas import (
+    Replica,
+    ReplicaBalancing,
+    ReplicaSet,
+    written_within,
+)
+from ...work.routing import REPLICA_LAG_QUERY
+from .impl import SqlAlchemyReadOnlyTransactionManager, SqlAlchemyTransaction
+
+
+async def ping(connection: AsyncConnection) -> t.Optional[float]:
+    await connection.execute(text("SELECT 1"))
+    return 0.0
+
+
+async def postgres_replica_lag(
+    connection: AsyncConnection,
+) -> t.Optional[float]:
+    lag = (await connection.execute(REPLICA_LAG_QUERY)).scalar()
+    return None if lag is None else float(lag)
+
+
+class SqlAlchemyRoutingReadOnlyTransactionManager(
+    SqlAlchemyReadOnlyTransactionManager
+):
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: t.Sequence[AsyncEngine],
+        *,
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        max_lag: float = 1.0,
+        probe_interval: float = 5.0,
+        probe: t.Callable[
+            [AsyncConnection], t.Awaitable[t.Optional[float]]
+        ] = ping,
+    ) -> None:
+        super().__init__(primary)
+        engines: t.List[AsyncEngine] = [
+            replica.execution_options(isolation_level="AUTOCOMMIT")
+            for replica in replicas
+        ]
+        self._replicas = ReplicaSet(
+            engines,
+            balancing=balancing,
+            max_lag=max_lag,
+            probe_interval=probe_interval,
+        )
+        self._replica_session_factories = {
+            engine: async_sessionmaker(engine, expire_on_commit=False)
+            for engine in engines
+        }
+        self._probe = probe
+        self._probes: t.Set[asyncio.Task[None]] = set()
+
+    @property
+    def replicas(self) -> ReplicaSet[AsyncEngine]:
+        return self._replicas
+
+    @asynccontextmanager
+    async def transaction(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        async with self._routed(super().transaction) as trx:
+            yield trx
+
+    @asynccontextmanager
+    async def detached(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        async with self._routed(super().detached) as trx:
+            yield trx
+
+    async def refresh(self) -> None:
+        await self._report(self._replicas.replicas)
+
+    @asynccontextmanager
+    async def _routed(
+        self,
+        primary: t.Callable[[], t.AsyncContextManager[SqlAlchemyTransaction]],
+    ) -> t.AsyncIterator[SqlAlchemyTransaction]:
+        replica = await self._route()
+
+        if replica is None:
+            async with primary() as trx:
+                yield trx
+            return
+
+        try:
+            session_factory = self._replica_session_factories[replica.engine]
+            async with session_factory() as session:
+                yield SqlAlchemyTransaction(session)
+        finally:
+            self._replicas.release(replica)
+
+    async def _route(self) -> t.Optional[Replica[AsyncEngine]]:
+        if written_within(self._replicas.max_lag):
+            return None
+
+        if due := self._replicas.due():
+            probe = asyncio.ensure_future(self._report(due))
+            self._probes.add(probe)
+            probe.add_done_callback(self._probes.discard)
+
+        return self._replicas.acquire()
+
+    async def _report(
+        self, replicas: t.Sequence[Replica[AsyncEngine]]
+    ) -> None:
+        lags = await asyncio.gather(
+            *(self._check(replica.engine) for replica in replicas)
+        )
+        for replica, lag in zip(replicas, lags):
+            self._replicas.report(replica, lag)
+
+    async def _check(self, engine: AsyncEngine) -> t.Optional[float]:
+        try:
+            async with engine.connect() as connection:
+                return await self._probe(connection)
+        except Exception:
+            return None
@@ -0,0 +1,8 @@
+from .impl import SqlAlchemyIdempotencyStore
+from .serializers import dump_result, load_result
+
+__all__ = (
+    "SqlAlchemyIdempotencyStore",
+    "dump_result",
+    "load_result",
+)
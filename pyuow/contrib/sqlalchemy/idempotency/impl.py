@@ -0,0 +1,145 @@
+import typing as t
+from datetime import datetime, timedelta
+
+try:
+    from sqlalchemy import delete, insert, or_, select, update
+    from sqlalchemy.dialects import postgresql, sqlite
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.orm import Session
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Seems that you are trying to import extra module that was not installed,"
+        " please install pyuow[sqlalchemy]"
+    )
+
+from ....clock import offset_naive_utcnow
+from ....result import Result
+from ....work.exceptions import IdempotencyKeyInUseError
+from ....work.idempotency import BaseIdempotencyStore
+from ..tables import IdempotencyKeyTable
+from ..work import SqlAlchemyTransactionManager
+from .serializers import dump_result, load_result
+
+IDEMPOTENCY_TABLE = t.TypeVar("IDEMPOTENCY_TABLE", bound=IdempotencyKeyTable)
+
+_CONFLICT_INSERTS: t.Dict[
+    str, t.Callable[..., t.Union[postgresql.Insert, sqlite.Insert]]
+] = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class SqlAlchemyIdempotencyStore(
+    t.Generic[IDEMPOTENCY_TABLE], BaseIdempotencyStore
+):
+    def __init__(
+        self,
+        table: t.Type[IDEMPOTENCY_TABLE],
+        transaction_manager: SqlAlchemyTransactionManager,
+        *,
+        ttl: t.Optional[timedelta] = None,
+        dumps: t.Callable[[Result[t.Any]], bytes] = dump_result,
+        loads: t.Callable[[bytes], Result[t.Any]] = load_result,
+    ) -> None:
+        self._table = table
+        self._transaction_manager = transaction_manager
+        self._ttl = ttl
+        self._dumps = dumps
+        self._loads = loads
+        self._detached: t.Set[str] = set()
+
+    def get(self, key: str) -> t.Optional[Result[t.Any]]:
+        statement = select(self._table.result).where(
+            self._table.key == key,
+            self._table.result.is_not(None),
+            or_(
+                self._table.expires_date.is_(None),
+                self._table.expires_date > offset_naive_utcnow(),
+            ),
+        )
+
+        with self._transaction_manager.transaction() as trx:
+            data = (trx.it().execute(statement)).scalar_one_or_none()
+
+        return self._loads(data) if data is not None else None
+
+    def claim(self, key: str) -> t.Optional[Result[t.Any]]:
+        now = offset_naive_utcnow()
+        expired = delete(self._table).where(
+            self._table.key == key, self._table.expires_date <= now
+        )
+        stored = select(self._table.result).where(self._table.key == key)
+        detached = self._transaction_manager.current() is None
+
+        with self._transaction_manager.transaction() as trx:
+            trx.it().execute(expired)
+            if self._insert_pending(trx.it(), key, now):
+                if detached:
+                    self._detached.add(key)
+                return None
+            data = (trx.it().execute(stored)).scalar_one_or_none()
+
+        if data is None:
+            return Result.error(IdempotencyKeyInUseError(key))
+        return self._loads(data)
+
+    def complete(self, key: str, result: Result[t.Any]) -> None:
+        statement = (
+            update(self._table)
+            .where(self._table.key == key)
+            .values(result=self._dumps(result))
+        )
+
+        with self._transaction_manager.transaction() as trx:
+            trx.it().execute(statement)
+
+    def settle(self, key: str, *, committed: bool) -> None:
+        if key not in self._detached:
+            return
+        self._detached.discard(key)
+        if committed:
+            return
+
+        statement = delete(self._table).where(
+            self._table.key == key, self._table.result.is_(None)
+        )
+
+        with self._transaction_manager.transaction() as trx:
+            trx.it().execute(statement)
+
+    def purge(self) -> int:
+        statement = (
+            delete(self._table)
+            .where(self._table.expires_date <= offset_naive_utcnow())
+            .returning(self._table.key)
+        )
+
+        with self._transaction_manager.transaction() as trx:
+            purged = (trx.it().execute(statement)).scalars().all()
+
+        return len(purged)
+
+    def _insert_pending(
+        self, session: Session, key: str, now: datetime
+    ) -> bool:
+        values = dict(
+            key=key,
+            result=None,
+            created_date=now,
+            expires_date=None if self._ttl is None else now + self._ttl,
+        )
+        dialect_insert = _CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+
+        if dialect_insert is not None:
+            statement = (
+                dialect_insert(self._table)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=[self._table.key])
+                .returning(self._table.key)
+            )
+            return session.execute(statement).scalar_one_or_none() is not None
+
+        try:
+            with session.begin_nested():
+                session.execute(insert(self._table).values(**values))
+        except IntegrityError:
+            return False
+        return True
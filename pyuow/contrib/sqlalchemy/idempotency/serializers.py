@@ -0,0 +1,18 @@
+import json
+import typing as t
+
+from ....result import Result
+
+
+def dump_result(result: Result[t.Any]) -> bytes:
+    if result.is_error():
+        raise ValueError("error results are not stored")
+    document = {} if result.is_empty() else {"out": result.get()}
+    return json.dumps(document, separators=(",", ":")).encode()
+
+
+def load_result(data: bytes) -> Result[t.Any]:
+    document = json.loads(data)
+    if "out" not in document:
+        return Result.empty()
+    return Result.ok(document["out"])
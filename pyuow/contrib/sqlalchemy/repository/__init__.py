@@ -3,6 +3,7 @@ from .base import (
     BaseSqlAlchemyRepositoryFactory,
     BaseSqlAlchemyViewRepository,
     BaseSqlAlchemyViewRepositoryFactory,
+    BulkUpdateResult,
 )
 
 __all__ = (
@@ -10,4 +11,5 @@ __all__ = (
     "BaseSqlAlchemyRepositoryFactory",
     "BaseSqlAlchemyViewRepository",
     "BaseSqlAlchemyViewRepositoryFactory",
+    "BulkUpdateResult",
 )
@@ -0,0 +1,5 @@
+import typing as t
+
+ID_ARRAYS: t.FrozenSet[str] = frozenset({"postgresql"})
+STREAM_ISOLATION: t.Dict[str, str] = {"postgresql": "REPEATABLE READ"}
+UPDATE_FROM_VALUES: t.FrozenSet[str] = frozenset({"postgresql"})
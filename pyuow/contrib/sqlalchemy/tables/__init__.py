@@ -2,6 +2,7 @@ from .base import (
     AuditedEntityTable,
     BaseTable,
     EntityTable,
+    IdempotencyKeyTable,
     SoftDeletableEntityTable,
     VersionedEntityTable,
     ViewTable,
@@ -11,6 +12,7 @@ __all__ = (
     "AuditedEntityTable",
     "BaseTable",
     "EntityTable",
+    "IdempotencyKeyTable",
     "SoftDeletableEntityTable",
     "VersionedEntityTable",
     "ViewTable",
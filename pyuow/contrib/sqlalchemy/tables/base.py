@@ -4,7 +4,7 @@ from uuid import UUID
 
 try:
     from sqlalchemy import UUID as SA_UUID
-    from sqlalchemy import DateTime, Integer
+    from sqlalchemy import DateTime, Integer, LargeBinary, String
     from sqlalchemy.orm import (
         DeclarativeBase,
         Mapped,
@@ -54,6 +54,20 @@ class VersionedEntityTable(EntityTable):
     version: Mapped[int] = mapped_column(Integer(), nullable=False)
 
 
+class IdempotencyKeyTable(BaseTable):
+    __abstract__ = True
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    result: Mapped[t.Optional[bytes]] = mapped_column(
+        LargeBinary(), nullable=True
+    )
+    created_date: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False), nullable=False
+    )
+    expires_date: Mapped[t.Optional[datetime]] = mapped_column(
+        DateTime(timezone=False), nullable=True
+    )
+
+
 class ViewTable(BaseTable):
     __abstract__ = True
     __table_args__ = {"info": {"is_view": True}}
@@ -1,11 +1,38 @@
+from .buffer import WriteBuffer
+from .exceptions import RollbackOnlyError, VersionConflictError
 from .impl import (
+    VERSION_CONFLICT_ERRORS,
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
 )
+from .replicas import (
+    Replica,
+    ReplicaBalancing,
+    ReplicaSet,
+    pin_scope,
+    reset_pin,
+)
+from .routing import (
+    SqlAlchemyRoutingReadOnlyTransactionManager,
+    ping,
+    postgres_replica_lag,
+)
 
 __all__ = (
+    "VERSION_CONFLICT_ERRORS",
+    "Replica",
+    "ReplicaBalancing",
+    "ReplicaSet",
+    "RollbackOnlyError",
     "SqlAlchemyReadOnlyTransactionManager",
+    "SqlAlchemyRoutingReadOnlyTransactionManager",
     "SqlAlchemyTransaction",
     "SqlAlchemyTransactionManager",
+    "VersionConflictError",
+    "WriteBuffer",
+    "pin_scope",
+    "ping",
+    "postgres_replica_lag",
+    "reset_pin",
 )
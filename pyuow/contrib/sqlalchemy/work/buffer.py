@@ -0,0 +1,199 @@
+import typing as t
+from dataclasses import dataclass, field
+
+try:
+    from sqlalchemy import (
+        ColumnElement,
+        CursorResult,
+        Dialect,
+        Executable,
+        Table,
+        bindparam,
+        delete,
+        insert,
+        inspect,
+        update,
+    )
+    from sqlalchemy.exc import NoResultFound
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Seems that you are trying to import extra module that was not installed,"
+        " please install pyuow[sqlalchemy]"
+    )
+
+from ..tables import BaseTable
+from .exceptions import VersionConflictError
+
+MAX_PARAMETERS = 30_000
+OPTIMISTIC_GUARDS = frozenset({"updated_date", "version"})
+
+ITEM = t.TypeVar("ITEM")
+
+_INSERT = "insert"
+_UPDATE = "update"
+_DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class BufferedStatement:
+    statement: Executable
+    parameters: t.Optional[t.List[t.Dict[str, t.Any]]]
+    expected: t.Optional[int]
+    optimistic: bool = False
+
+    def executions(self, dialect: Dialect) -> t.Iterator["BufferedStatement"]:
+        if (
+            self.expected is None
+            or self.parameters is None
+            or len(self.parameters) == 1
+            or dialect.supports_sane_multi_rowcount
+        ):
+            yield self
+            return
+
+        for parameters in self.parameters:
+            yield BufferedStatement(
+                self.statement, [parameters], 1, self.optimistic
+            )
+
+    def verify(self, result: CursorResult[t.Any]) -> None:
+        if self.expected is None:
+            return
+
+        sane = (
+            result.supports_sane_rowcount()
+            if self.parameters is None or len(self.parameters) == 1
+            else result.supports_sane_multi_rowcount()
+        )
+
+        if sane and result.rowcount != self.expected:
+            error = VersionConflictError if self.optimistic else NoResultFound
+            raise error(
+                f"Buffered statement expected to match {self.expected} "
+                f"row(s); {result.rowcount} were matched"
+            )
+
+
+@dataclass
+class _Batch:
+    kind: str
+    table: t.Type[BaseTable]
+    columns: t.Tuple[str, ...]
+    guards: t.Tuple[str, ...] = ()
+    nulls: t.Tuple[str, ...] = ()
+    rows: t.List[t.Dict[str, t.Any]] = field(default_factory=list)
+
+    def same_shape(self, other: "_Batch") -> bool:
+        return (
+            self.kind == other.kind
+            and self.table is other.table
+            and self.columns == other.columns
+            and self.guards == other.guards
+            and self.nulls == other.nulls
+        )
+
+    def statements(self) -> t.Iterator[BufferedStatement]:
+        table = t.cast(Table, self.table.__table__)
+        columns = inspect(self.table).columns
+
+        if self.kind == _INSERT:
+            size = max(1, MAX_PARAMETERS // len(self.columns))
+            rows = [
+                {columns[name].key: value for name, value in row.items()}
+                for row in self.rows
+            ]
+            for chunk in _chunks(rows, size):
+                yield BufferedStatement(
+                    insert(table).values(chunk), None, None
+                )
+        elif self.kind == _UPDATE:
+            conditions: t.List[ColumnElement[bool]] = [
+                columns[name] == bindparam(f"w_{name}") for name in self.guards
+            ]
+            conditions.extend(columns[name].is_(None) for name in self.nulls)
+            statement = (
+                update(table)
+                .where(*conditions)
+                .values(
+                    {
+                        columns[name].key: bindparam(f"v_{name}")
+                        for name in self.columns
+                    }
+                )
+            )
+            yield BufferedStatement(
+                statement,
+                self.rows,
+                len(self.rows),
+                optimistic=not OPTIMISTIC_GUARDS.isdisjoint(self.guards),
+            )
+        else:
+            ids = list(dict.fromkeys(row["id"] for row in self.rows))
+            for chunk in _chunks(ids, MAX_PARAMETERS):
+                yield BufferedStatement(
+                    delete(table).where(columns["id"].in_(chunk)),
+                    None,
+                    len(chunk),
+                )
+
+
+class WriteBuffer:
+    def __init__(self) -> None:
+        self._batches: t.List[_Batch] = []
+        self._tables: t.Set[t.Type[BaseTable]] = set()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def pending(self, table: t.Type[BaseTable]) -> bool:
+        return table in self._tables
+
+    def insert(
+        self, table: t.Type[BaseTable], values: t.Mapping[str, t.Any]
+    ) -> None:
+        self._append(_Batch(_INSERT, table, tuple(values)), dict(values))
+
+    def update(
+        self,
+        table: t.Type[BaseTable],
+        values: t.Mapping[str, t.Any],
+        where: t.Mapping[str, t.Any],
+    ) -> None:
+        guards = tuple(
+            name for name, value in where.items() if value is not None
+        )
+        nulls = tuple(name for name, value in where.items() if value is None)
+        row = {f"v_{name}": value for name, value in values.items()}
+        row.update((f"w_{name}", where[name]) for name in guards)
+        self._append(_Batch(_UPDATE, table, tuple(values), guards, nulls), row)
+
+    def delete(self, table: t.Type[BaseTable], entity_id: t.Any) -> None:
+        self._append(_Batch(_DELETE, table, ("id",)), {"id": entity_id})
+
+    def drain(self) -> t.Iterator[BufferedStatement]:
+        batches, self._batches = self._batches, []
+        self.clear()
+
+        for batch in batches:
+            yield from batch.statements()
+
+    def clear(self) -> None:
+        self._batches.clear()
+        self._tables.clear()
+        self._size = 0
+
+    def _append(self, batch: _Batch, row: t.Dict[str, t.Any]) -> None:
+        if self._batches and self._batches[-1].same_shape(batch):
+            batch = self._batches[-1]
+        else:
+            self._batches.append(batch)
+
+        batch.rows.append(row)
+        self._tables.add(batch.table)
+        self._size += 1
+
+
+def _chunks(rows: t.List[ITEM], size: int) -> t.Iterator[t.List[ITEM]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
@@ -0,0 +1,16 @@
+try:
+    from sqlalchemy.exc import NoResultFound
+    from sqlalchemy.orm.exc import StaleDataError
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Seems that you are trying to import extra module that was not installed,"
+        " please install pyuow[sqlalchemy]"
+    )
+
+
+class VersionConflictError(StaleDataError, NoResultFound):
+    pass
+
+
+class RollbackOnlyError(Exception):
+    pass
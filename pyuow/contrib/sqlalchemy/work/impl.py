@@ -2,7 +2,7 @@ import typing as t
 from contextlib import contextmanager
 
 try:
-    from sqlalchemy import Engine
+    from sqlalchemy import CursorResult, Engine
     from sqlalchemy.orm import (
         Session,
         SessionTransaction,
@@ -16,9 +16,55 @@ except ImportError:  # pragma: no cover
     )
 
 from ....work.transactional import BaseTransaction, BaseTransactionManager
+from ..tables import BaseTable
+from .buffer import WriteBuffer
+from .exceptions import RollbackOnlyError, VersionConflictError
+from .replicas import mark_write
+from .tracking import WRITTEN, WriteTrackingSession
+
+VERSION_CONFLICT_ERRORS: t.Tuple[t.Type[Exception], ...] = (
+    VersionConflictError,
+)
+
+
+_AMBIENT = "pyuow_ambient_transaction"
+_BUFFER = "pyuow_write_buffer"
+_ROLLBACK_ONLY = "pyuow_rollback_only"
 
 
 class SqlAlchemyTransaction(BaseTransaction[Session]):
+    def __init__(
+        self,
+        transaction_provider: Session,
+        *,
+        joined: bool = False,
+        buffer: t.Optional[WriteBuffer] = None,
+    ) -> None:
+        super().__init__(transaction_provider)
+        self._joined = joined
+        self._buffer = buffer
+
+    @property
+    def buffer(self) -> t.Optional[WriteBuffer]:
+        return self._buffer
+
+    def flush(self, table: t.Optional[t.Type[BaseTable]] = None) -> None:
+        if not self._buffer:
+            return
+        if table is not None and not self._buffer.pending(table):
+            return
+
+        dialect = self._transaction_provider.get_bind().dialect
+
+        for pending in self._buffer.drain():
+            for execution in pending.executions(dialect):
+                result = self._transaction_provider.execute(
+                    execution.statement, execution.parameters
+                )
+                execution.verify(t.cast(CursorResult[t.Any], result))
+
+        self._transaction_provider.expire_all()
+
     def _get_active_transaction(self) -> t.Union[SessionTransaction, None]:
         if self._transaction_provider.in_nested_transaction():
             return self._transaction_provider.get_nested_transaction()
@@ -27,11 +73,34 @@ class SqlAlchemyTransaction(BaseTransaction[Session]):
 
         return None
 
+    def is_rollback_only(self) -> bool:
+        trx = self._get_active_transaction()
+        return (
+            trx is not None
+            and self._transaction_provider.info.get(_ROLLBACK_ONLY) is trx
+        )
+
     def rollback(self) -> None:
+        if self._joined:
+            if trx := self._get_active_transaction():
+                self._transaction_provider.info[_ROLLBACK_ONLY] = trx
+            return
+        if self._buffer is not None:
+            self._buffer.clear()
+        if self.is_rollback_only():
+            del self._transaction_provider.info[_ROLLBACK_ONLY]
+        if not self._transaction_provider.in_nested_transaction():
+            self._transaction_provider.info.pop(WRITTEN, None)
         if trx := self._get_active_transaction():
             trx.rollback()
 
     def commit(self) -> None:
+        if self._joined:
+            return
+        if self.is_rollback_only():
+            self.rollback()
+            raise RollbackOnlyError()
+        self.flush()
         if trx := self._get_active_transaction():
             trx.commit()
 
@@ -39,20 +108,95 @@ class SqlAlchemyTransaction(BaseTransaction[Session]):
 class SqlAlchemyTransactionManager(
     BaseTransactionManager[SqlAlchemyTransaction]
 ):
-    def __init__(self, engine: Engine) -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        join_ambient: bool = True,
+        deferred_writes: bool = False,
+    ) -> None:
+        self._join_ambient = join_ambient
+        self._deferred_writes = deferred_writes
         self._session_factory = scoped_session(
-            sessionmaker(engine, expire_on_commit=False)
+            sessionmaker(
+                engine, class_=WriteTrackingSession, expire_on_commit=False
+            )
         )
 
     @contextmanager
     def transaction(self) -> t.Iterator[SqlAlchemyTransaction]:
         session = self._session_factory()
+        if (
+            self._join_ambient
+            and session.info.get(_AMBIENT)
+            and session.in_transaction()
+        ):
+            yield self._transaction(session, joined=True)
+        else:
+            with self._begin(session):
+                yield self._transaction(session)
+
+    @contextmanager
+    def savepoint(self) -> t.Iterator[SqlAlchemyTransaction]:
+        session = self._session_factory()
+        with self._begin(session):
+            yield self._transaction(session)
+
+    def current(self) -> t.Optional[SqlAlchemyTransaction]:
+        if not self._session_factory.registry.has():
+            return None
+
+        session = self._session_factory()
+        if not session.in_transaction():
+            return None
+
+        return self._transaction(session, joined=True)
+
+    def _transaction(
+        self, session: Session, *, joined: bool = False
+    ) -> SqlAlchemyTransaction:
+        return SqlAlchemyTransaction(
+            session, joined=joined, buffer=session.info.get(_BUFFER)
+        )
+
+    @contextmanager
+    def _begin(self, session: Session) -> t.Iterator[None]:
         if session.in_transaction():
-            with session.begin_nested():
-                yield SqlAlchemyTransaction(session)
+            self._transaction(session).flush()
+            with session.begin_nested(), self._buffered(session):
+                yield
         else:
             with session.begin():
-                yield SqlAlchemyTransaction(session)
+                session.info[_AMBIENT] = True
+                if self._deferred_writes:
+                    session.info[_BUFFER] = WriteBuffer()
+                try:
+                    with self._buffered(session):
+                        yield
+                finally:
+                    del session.info[_AMBIENT]
+                    session.info.pop(_BUFFER, None)
+                    session.info.pop(_ROLLBACK_ONLY, None)
+                    written = session.info.pop(WRITTEN, False)
+            if written:
+                mark_write()
+
+    @contextmanager
+    def _buffered(self, session: Session) -> t.Iterator[None]:
+        trx = self._transaction(session)
+
+        try:
+            yield
+        except BaseException:
+            if trx.buffer is not None:
+                trx.buffer.clear()
+            raise
+
+        if trx.is_rollback_only():
+            del session.info[_ROLLBACK_ONLY]
+            raise RollbackOnlyError()
+
+        trx.flush()
 
 
 class SqlAlchemyReadOnlyTransactionManager(SqlAlchemyTransactionManager):
@@ -65,3 +209,16 @@ class SqlAlchemyReadOnlyTransactionManager(SqlAlchemyTransactionManager):
     def transaction(self) -> t.Iterator[SqlAlchemyTransaction]:
         with self._session_factory() as session:
             yield SqlAlchemyTransaction(session)
+
+    @contextmanager
+    def detached(self) -> t.Iterator[SqlAlchemyTransaction]:
+        with self._session_factory.session_factory() as session:
+            yield SqlAlchemyTransaction(session)
+
+    @contextmanager
+    def savepoint(self) -> t.Iterator[SqlAlchemyTransaction]:
+        with self.transaction() as trx:
+            yield trx
+
+    def current(self) -> t.Optional[SqlAlchemyTransaction]:
+        return None
@@ -0,0 +1,129 @@
+import threading
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+
+ENGINE = t.TypeVar("ENGINE")
+
+_last_write: ContextVar[t.Optional[float]] = ContextVar(
+    "pyuow_last_write", default=None
+)
+
+
+def mark_write() -> None:
+    _last_write.set(monotonic())
+
+
+def reset_pin() -> None:
+    _last_write.set(None)
+
+
+@contextmanager
+def pin_scope() -> t.Iterator[None]:
+    token = _last_write.set(None)
+    try:
+        yield
+    finally:
+        _last_write.reset(token)
+
+
+def written_within(window: float) -> bool:
+    written_at = _last_write.get()
+    return written_at is not None and monotonic() - written_at < window
+
+
+class ReplicaBalancing(Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+@dataclass
+class Replica(t.Generic[ENGINE]):
+    engine: ENGINE
+    healthy: bool = False
+    lag: t.Optional[float] = None
+    in_flight: int = 0
+    checked_at: float = float("-inf")
+
+
+class ReplicaSet(t.Generic[ENGINE]):
+    def __init__(
+        self,
+        engines: t.Sequence[ENGINE],
+        *,
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        max_lag: float = 1.0,
+        probe_interval: float = 5.0,
+        clock: t.Callable[[], float] = monotonic,
+    ) -> None:
+        if max_lag < 0:
+            raise ValueError("max_lag must not be negative")
+        if probe_interval <= 0:
+            raise ValueError("probe_interval must be positive")
+
+        self._replicas = [Replica(engine) for engine in engines]
+        self._balancing = balancing
+        self._max_lag = max_lag
+        self._probe_interval = probe_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next = 0
+
+    @property
+    def replicas(self) -> t.Tuple[Replica[ENGINE], ...]:
+        return tuple(self._replicas)
+
+    @property
+    def healthy(self) -> int:
+        return sum(replica.healthy for replica in self._replicas)
+
+    @property
+    def max_lag(self) -> float:
+        return self._max_lag
+
+    def due(self) -> t.List[Replica[ENGINE]]:
+        now = self._clock()
+
+        with self._lock:
+            due = [
+                replica
+                for replica in self._replicas
+                if now - replica.checked_at >= self._probe_interval
+            ]
+            for replica in due:
+                replica.checked_at = now
+
+        return due
+
+    def report(self, replica: Replica[ENGINE], lag: t.Optional[float]) -> None:
+        with self._lock:
+            replica.lag = lag
+            replica.healthy = lag is not None and lag <= self._max_lag
+
+    def acquire(self) -> t.Optional[Replica[ENGINE]]:
+        with self._lock:
+            healthy = [
+                replica for replica in self._replicas if replica.healthy
+            ]
+
+            if not healthy:
+                return None
+
+            start = self._next % len(healthy)
+            self._next += 1
+            candidates = healthy[start:] + healthy[:start]
+
+            if self._balancing is ReplicaBalancing.LEAST_CONNECTIONS:
+                chosen = min(candidates, key=lambda replica: replica.in_flight)
+            else:
+                chosen = candidates[0]
+
+            chosen.in_flight += 1
+            return chosen
+
+    def release(self, replica: Replica[ENGINE]) -> None:
+        with self._lock:
+            replica.in_flight -= 1
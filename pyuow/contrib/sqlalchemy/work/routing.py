@@ -0,0 +1,119 @@
+import threading
+import typing as t
+from contextlib import contextmanager
+
+try:
+    from sqlalchemy import Connection, Engine, text
+    from sqlalchemy.orm import sessionmaker
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Seems that you are trying to import extra module that was not installed,"
+        " please install pyuow[sqlalchemy]"
+    )
+
+from .impl import SqlAlchemyReadOnlyTransactionManager, SqlAlchemyTransaction
+from .replicas import Replica, ReplicaBalancing, ReplicaSet, written_within
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_is_in_recovery() THEN COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0"
+    ") ELSE 0 END"
+)
+
+
+def ping(connection: Connection) -> t.Optional[float]:
+    connection.execute(text("SELECT 1"))
+    return 0.0
+
+
+def postgres_replica_lag(connection: Connection) -> t.Optional[float]:
+    lag = connection.execute(REPLICA_LAG_QUERY).scalar()
+    return None if lag is None else float(lag)
+
+
+class SqlAlchemyRoutingReadOnlyTransactionManager(
+    SqlAlchemyReadOnlyTransactionManager
+):
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: t.Sequence[Engine],
+        *,
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        max_lag: float = 1.0,
+        probe_interval: float = 5.0,
+        probe: t.Callable[[Connection], t.Optional[float]] = ping,
+    ) -> None:
+        super().__init__(primary)
+        engines: t.List[Engine] = [
+            replica.execution_options(isolation_level="AUTOCOMMIT")
+            for replica in replicas
+        ]
+        self._replicas = ReplicaSet(
+            engines,
+            balancing=balancing,
+            max_lag=max_lag,
+            probe_interval=probe_interval,
+        )
+        self._replica_session_factories = {
+            engine: sessionmaker(engine, expire_on_commit=False)
+            for engine in engines
+        }
+        self._probe = probe
+
+    @property
+    def replicas(self) -> ReplicaSet[Engine]:
+        return self._replicas
+
+    @contextmanager
+    def transaction(self) -> t.Iterator[SqlAlchemyTransaction]:
+        with self._routed(super().transaction) as trx:
+            yield trx
+
+    @contextmanager
+    def detached(self) -> t.Iterator[SqlAlchemyTransaction]:
+        with self._routed(super().detached) as trx:
+            yield trx
+
+    def refresh(self) -> None:
+        self._report(self._replicas.replicas)
+
+    @contextmanager
+    def _routed(
+        self, primary: t.Callable[[], t.ContextManager[SqlAlchemyTransaction]]
+    ) -> t.Iterator[SqlAlchemyTransaction]:
+        replica = self._route()
+
+        if replica is None:
+            with primary() as trx:
+                yield trx
+            return
+
+        try:
+            session_factory = self._replica_session_factories[replica.engine]
+            with session_factory() as session:
+                yield SqlAlchemyTransaction(session)
+        finally:
+            self._replicas.release(replica)
+
+    def _route(self) -> t.Optional[Replica[Engine]]:
+        if written_within(self._replicas.max_lag):
+            return None
+
+        if due := self._replicas.due():
+            threading.Thread(
+                target=self._report, args=(due,), daemon=True
+            ).start()
+
+        return self._replicas.acquire()
+
+    def _report(self, replicas: t.Sequence[Replica[Engine]]) -> None:
+        for replica in replicas:
+            self._replicas.report(replica, self._check(replica.engine))
+
+    def _check(self, engine: Engine) -> t.Optional[float]:
+        try:
+            with engine.connect() as connection:
+                return self._probe(connection)
+        except Exception:
+            return None
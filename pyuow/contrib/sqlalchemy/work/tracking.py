@@ -0,0 +1,25 @@
+try:
+    from sqlalchemy import TextClause, event
+    from sqlalchemy.orm import ORMExecuteState, Session
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Seems that you are trying to import extra module that was not installed,"
+        " please install pyuow[sqlalchemy]"
+    )
+
+WRITTEN = "pyuow_written"
+
+
+class WriteTrackingSession(Session):
+    pass
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _track_writes(state: ORMExecuteState) -> None:
+    if (
+        state.is_insert
+        or state.is_update
+        or state.is_delete
+        or isinstance(state.statement, TextClause)
+    ):
+        state.session.info[WRITTEN] = True
@@ -7,6 +7,8 @@ from .base import (
 )
 from .exceptions import (
     DataPointCannotBeOverriddenError,
+    DataPointCycleError,
+    DataPointHasMultipleProducersError,
     DataPointIsNotProducedError,
 )
 from .impl import ConsumesDataPoints, ProducesDataPoints
@@ -20,5 +22,7 @@ __all__ = (
     "ConsumesDataPoints",
     "ProducesDataPoints",
     "DataPointCannotBeOverriddenError",
+    "DataPointCycleError",
+    "DataPointHasMultipleProducersError",
     "DataPointIsNotProducedError",
 )
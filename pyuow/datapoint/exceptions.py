@@ -8,3 +8,11 @@ class DataPointIsNotDeclaredError(Exception):
 
 class DataPointIsNotProducedError(Exception):
     pass
+
+
+class DataPointHasMultipleProducersError(Exception):
+    pass
+
+
+class DataPointCycleError(Exception):
+    pass
@@ -1,19 +1,42 @@
 from .base import BaseUnit
+from .cache import CachedUnit, ResultCache
 from .exceptions import (
     CannotReassignUnitError,
     FinalUnitError,
+    FlowIsFrozenError,
     FlowNotTerminatedError,
 )
-from .impl import ConditionalUnit, ErrorUnit, FinalUnit, FlowUnit, RunUnit
+from .impl import (
+    CompiledFlow,
+    ConditionalUnit,
+    ErrorUnit,
+    FinalUnit,
+    FlowUnit,
+    RunUnit,
+)
+from .observer import (
+    FlowObserver,
+    LoggingFlowObserver,
+    NoOpFlowObserver,
+    UnitOutcome,
+)
 
 __all__ = (
     "BaseUnit",
+    "CachedUnit",
     "CannotReassignUnitError",
+    "CompiledFlow",
     "ConditionalUnit",
     "ErrorUnit",
     "FinalUnit",
     "FinalUnitError",
+    "FlowIsFrozenError",
     "FlowNotTerminatedError",
+    "FlowObserver",
     "FlowUnit",
+    "LoggingFlowObserver",
+    "NoOpFlowObserver",
+    "ResultCache",
     "RunUnit",
+    "UnitOutcome",
 )
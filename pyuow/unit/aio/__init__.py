@@ -1,11 +1,32 @@
 from .base import BaseUnit
-from .impl import ConditionalUnit, ErrorUnit, FinalUnit, FlowUnit, RunUnit
+from .cache import CachedUnit
+from .deadline import deadline, remaining_time
+from .impl import (
+    CompiledFlow,
+    ConditionalUnit,
+    DataPointGraphUnit,
+    ErrorUnit,
+    FinalUnit,
+    FlowUnit,
+    ParallelUnit,
+    RunUnit,
+)
+from .threaded import ThreadedFlowUnit, ThreadedRunUnit, UnitThreadPool
 
 __all__ = (
     "BaseUnit",
+    "CachedUnit",
+    "CompiledFlow",
     "ConditionalUnit",
+    "DataPointGraphUnit",
     "ErrorUnit",
     "FinalUnit",
     "FlowUnit",
+    "ParallelUnit",
     "RunUnit",
+    "ThreadedFlowUnit",
+    "ThreadedRunUnit",
+    "UnitThreadPool",
+    "deadline",
+    "remaining_time",
 )
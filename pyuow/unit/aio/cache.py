@@ -0,0 +1,61 @@
+import asyncio
+import typing as t
+from time import monotonic
+
+from ...context import BaseContext
+from ...result import Result
+from ..cache import ResultCache, params_key
+from .base import BaseUnit
+from .impl import FinalUnit
+
+CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
+OUT = t.TypeVar("OUT")
+
+
+class CachedUnit(FinalUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        unit: BaseUnit[CONTEXT, OUT],
+        *,
+        key: t.Callable[[CONTEXT], t.Hashable] = params_key,
+        maxsize: int = 128,
+        ttl: t.Optional[float] = None,
+        cache_errors: bool = False,
+        clock: t.Callable[[], float] = monotonic,
+    ) -> None:
+        super().__init__()
+        self._unit = unit
+        self._key = key
+        self._cache: ResultCache[OUT] = ResultCache(
+            maxsize=maxsize, ttl=ttl, cache_errors=cache_errors, clock=clock
+        )
+        self._pending: t.Dict[t.Hashable, "asyncio.Future[Result[OUT]]"] = {}
+
+    @property
+    def cache(self) -> ResultCache[OUT]:
+        return self._cache
+
+    async def finish(self, context: CONTEXT) -> Result[OUT]:
+        key = self._key(context)
+        pending = self._pending.get(key)
+
+        if pending is not None:
+            self._cache.record_hit()
+            return await asyncio.shield(pending)
+
+        cached = self._cache.get(key)
+
+        if cached is not None:
+            return cached
+
+        pending = asyncio.ensure_future(self._compute(key, context))
+        self._pending[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _compute(self, key: t.Hashable, context: CONTEXT) -> Result[OUT]:
+        try:
+            result = await self._unit(context)
+            self._cache.put(key, result)
+            return result
+        finally:
+            del self._pending[key]
@@ -0,0 +1,68 @@
+import asyncio
+import sys
+import typing as t
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+RETURN = t.TypeVar("RETURN")
+
+_deadline: ContextVar[t.Optional[float]] = ContextVar(
+    "pyuow_deadline", default=None
+)
+
+
+def remaining_time() -> t.Optional[float]:
+    expires_at = _deadline.get()
+
+    if expires_at is None:
+        return None
+
+    return max(0.0, expires_at - asyncio.get_running_loop().time())
+
+
+@asynccontextmanager
+async def deadline(timeout: float) -> t.AsyncIterator[None]:
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + timeout
+    current = _deadline.get()
+
+    if current is not None and current <= expires_at:
+        yield
+        return
+
+    task = asyncio.current_task()
+
+    if task is None:
+        raise RuntimeError("deadline() must be used inside a task")
+
+    expired = False
+
+    def expire() -> None:
+        nonlocal expired
+        expired = True
+        task.cancel()
+
+    handle = loop.call_at(expires_at, expire)
+    token = _deadline.set(expires_at)
+
+    try:
+        yield
+    except asyncio.CancelledError:
+        if not expired:
+            raise
+        if sys.version_info >= (3, 11) and task.uncancel() > 0:
+            raise
+        raise TimeoutError from None
+    finally:
+        handle.cancel()
+        _deadline.reset(token)
+
+
+async def within(
+    awaitable: t.Awaitable[RETURN], timeout: t.Optional[float]
+) -> RETURN:
+    if timeout is None:
+        return await awaitable
+
+    async with deadline(timeout):
+        return await awaitable
@@ -1,25 +1,40 @@
 import abc
+import asyncio
 import typing as t
 from abc import ABC
-from logging import getLogger
+from copy import copy
+from dataclasses import dataclass
+from enum import Enum, auto, unique
+from time import perf_counter_ns
 
 from ...context import BaseContext
+from ...datapoint import (
+    BaseDataPointSpec,
+    DataPointCycleError,
+    DataPointHasMultipleProducersError,
+    DataPointIsNotProducedError,
+)
+from ...datapoint.aio import ConsumesDataPoints, ProducesDataPoints
 from ...result import Result
 from ...types import MISSING, MissingType
 from ..exceptions import (
     CannotReassignUnitError,
     FinalUnitError,
+    FlowIsFrozenError,
     FlowNotTerminatedError,
 )
+from ..observer import FlowObserver, NoOpFlowObserver, UnitOutcome
 from .base import BaseUnit
-
-logger = getLogger(__name__)
+from .deadline import within
 
 CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
 OUT = t.TypeVar("OUT")
 
 
 class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
+    _frozen = False
+    _timeout: t.Optional[float] = None
+
     def __init__(self) -> None:
         self._root: "FlowUnit[CONTEXT, OUT]" = self
         self._next: t.Union["FlowUnit[CONTEXT, OUT]", MissingType] = MISSING
@@ -28,6 +43,8 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
         self: "FlowUnit[CONTEXT, OUT]",
         other: "FlowUnit[CONTEXT, OUT]",
     ) -> "FlowUnit[CONTEXT, OUT]":
+        if self._frozen or other._frozen:
+            raise FlowIsFrozenError(self.__class__.__name__)
         if not isinstance(other._next, MissingType):
             raise CannotReassignUnitError
 
@@ -35,31 +52,21 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
         other._root = self._root
         return other
 
-    def build(self) -> "FlowUnit[CONTEXT, OUT]":
+    def build(self) -> "CompiledFlow[CONTEXT, OUT]":
         cursor: "FlowUnit[CONTEXT, OUT]" = self._root
         while not isinstance(cursor, FinalUnit):
             if isinstance(cursor._next, MissingType):
                 raise FlowNotTerminatedError(cursor.__class__.__name__)
             cursor = cursor._next
-        return self._root
+        return CompiledFlow(self._root)
 
 
 class FinalUnit(FlowUnit[CONTEXT, OUT], ABC):
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
-        cls_name = self.__class__.__name__
-
         try:
-            result = await self.finish(context)
+            return await within(self.finish(context), self._timeout)
         except Exception as error:
-            logger.exception(
-                "[%s] failed with exception", cls_name, exc_info=error
-            )
             return Result.error(error)
-        else:
-            logger.info("[%s] completed", self.__class__.__name__)
-
-        logger.debug("[%s] result [%s]", self.__class__.__name__, result)
-        return result
 
     @abc.abstractmethod
     async def finish(self, context: CONTEXT) -> Result[OUT]:
@@ -91,24 +98,19 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
         self._on_failure = on_failure
 
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
-        cls_name = self.__class__.__name__
-
         if isinstance(self._next, MissingType):
-            raise NotImplementedError(f"[{cls_name}] next unit is not set")
+            raise NotImplementedError(
+                f"[{self.__class__.__name__}] next unit is not set"
+            )
 
         try:
-            passed = await self.condition(context)
+            passed = await within(self.condition(context), self._timeout)
         except Exception as error:
-            logger.exception(
-                "[%s] failed with exception", cls_name, exc_info=error
-            )
             return Result.error(error)
 
         if passed:
-            logger.info("[%s] completed", cls_name)
             return await self._next(context)
 
-        logger.info("[%s] failed", cls_name)
         return await self._on_failure(context)
 
     @abc.abstractmethod
@@ -118,22 +120,366 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
 
 class RunUnit(FlowUnit[CONTEXT, OUT]):
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
-        cls_name = self.__class__.__name__
-
         if isinstance(self._next, MissingType):
-            raise NotImplementedError(f"[{cls_name}] next unit is not set")
+            raise NotImplementedError(
+                f"[{self.__class__.__name__}] next unit is not set"
+            )
 
         try:
-            await self.run(context)
+            await within(self.run(context), self._timeout)
         except Exception as error:
-            logger.exception(
-                "[%s] failed with exception", cls_name, exc_info=error
-            )
             return Result.error(error)
 
-        logger.info("[%s] completed", cls_name)
         return await self._next(context)
 
     @abc.abstractmethod
     async def run(self, context: CONTEXT) -> None:
         raise NotImplementedError
+
+    def __and__(
+        self, other: BaseUnit[CONTEXT, t.Any]
+    ) -> "ParallelUnit[CONTEXT, OUT]":
+        return ParallelUnit(self, other)
+
+
+class ParallelUnit(RunUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        *branches: BaseUnit[CONTEXT, t.Any],
+        timeout: t.Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self._branches = branches
+        self._branch_timeout = timeout
+
+    def __and__(
+        self, other: BaseUnit[CONTEXT, t.Any]
+    ) -> "ParallelUnit[CONTEXT, OUT]":
+        return ParallelUnit(
+            *self._branches, other, timeout=self._branch_timeout
+        )
+
+    async def run(self, context: CONTEXT) -> None:
+        tasks = [
+            asyncio.ensure_future(self._run_branch(branch, context))
+            for branch in self._branches
+        ]
+
+        if not tasks:
+            return
+
+        try:
+            done, pending = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in tasks:
+            if task in done and (error := task.exception()) is not None:
+                raise error
+
+    async def _run_branch(
+        self, branch: BaseUnit[CONTEXT, t.Any], context: CONTEXT
+    ) -> None:
+        if self._branch_timeout is None:
+            await self._execute(branch, context)
+        else:
+            await asyncio.wait_for(
+                self._execute(branch, context), self._branch_timeout
+            )
+
+    @staticmethod
+    async def _execute(
+        branch: BaseUnit[CONTEXT, t.Any], context: CONTEXT
+    ) -> None:
+        if isinstance(branch, RunUnit):
+            await within(branch.run(context), branch._timeout)
+            return
+
+        result = await branch(context)
+
+        if result.is_error():
+            result.raise_for_error()
+
+
+class DataPointGraphUnit(RunUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        *units: RunUnit[CONTEXT, t.Any],
+        timeout: t.Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self._waves: t.Tuple[RunUnit[CONTEXT, t.Any], ...] = tuple(
+            wave[0] if len(wave) == 1 else ParallelUnit(*wave, timeout=timeout)
+            for wave in self._plan(units)
+        )
+
+    @property
+    def waves(self) -> t.Tuple[RunUnit[CONTEXT, t.Any], ...]:
+        return self._waves
+
+    async def run(self, context: CONTEXT) -> None:
+        for wave in self._waves:
+            await within(wave.run(context), wave._timeout)
+
+    @staticmethod
+    def _plan(
+        units: t.Sequence[RunUnit[CONTEXT, t.Any]],
+    ) -> t.List[t.List[RunUnit[CONTEXT, t.Any]]]:
+        producers: t.Dict[
+            BaseDataPointSpec[t.Any], RunUnit[CONTEXT, t.Any]
+        ] = {}
+
+        for unit in units:
+            if not isinstance(unit, ProducesDataPoints):
+                continue
+            for spec in unit._produces:
+                if spec in producers:
+                    raise DataPointHasMultipleProducersError(spec)
+                producers[spec] = unit
+
+        dependencies: t.Dict[int, t.Set[int]] = {}
+
+        for unit in units:
+            consumes = (
+                unit._consumes
+                if isinstance(unit, ConsumesDataPoints)
+                else set()
+            )
+            missing_specs = consumes - producers.keys()
+
+            if len(missing_specs) > 0:
+                raise DataPointIsNotProducedError(missing_specs)
+
+            dependencies[id(unit)] = {id(producers[spec]) for spec in consumes}
+
+        waves: t.List[t.List[RunUnit[CONTEXT, t.Any]]] = []
+        scheduled: t.Set[int] = set()
+        remaining = list(units)
+
+        while remaining:
+            wave = [
+                unit
+                for unit in remaining
+                if dependencies[id(unit)] <= scheduled
+            ]
+
+            if not wave:
+                raise DataPointCycleError(
+                    [unit.__class__.__name__ for unit in remaining]
+                )
+
+            waves.append(wave)
+            scheduled.update(id(unit) for unit in wave)
+            remaining = [
+                unit for unit in remaining if id(unit) not in scheduled
+            ]
+
+        return waves
+
+
+@unique
+class _StepKind(Enum):
+    RUN = auto()
+    CONDITION = auto()
+    FINISH = auto()
+    DELEGATE = auto()
+
+
+@dataclass(frozen=True)
+class _Step(t.Generic[CONTEXT, OUT]):
+    kind: _StepKind
+    unit: BaseUnit[CONTEXT, OUT]
+    action: t.Callable[[CONTEXT], t.Any]
+    next: int = -1
+    on_failure: int = -1
+
+
+def _next_of(unit: FlowUnit[CONTEXT, OUT]) -> FlowUnit[CONTEXT, OUT]:
+    if isinstance(unit._next, MissingType):
+        raise FlowNotTerminatedError(unit.__class__.__name__)
+    return unit._next
+
+
+def _timed(
+    unit: FlowUnit[CONTEXT, OUT], action: t.Callable[[CONTEXT], t.Any]
+) -> t.Callable[[CONTEXT], t.Any]:
+    timeout = unit._timeout
+
+    if timeout is None:
+        return action
+
+    return lambda context: within(action(context), timeout)
+
+
+def _compile(
+    entry: BaseUnit[CONTEXT, OUT],
+) -> t.Tuple[_Step[CONTEXT, OUT], ...]:
+    units: t.List[BaseUnit[CONTEXT, OUT]] = []
+    indexes: t.Dict[int, int] = {}
+
+    def index_of(unit: BaseUnit[CONTEXT, OUT]) -> int:
+        if id(unit) not in indexes:
+            indexes[id(unit)] = len(units)
+            units.append(unit)
+        return indexes[id(unit)]
+
+    index_of(entry)
+    steps: t.List[_Step[CONTEXT, OUT]] = []
+
+    while len(steps) < len(units):
+        unit = units[len(steps)]
+        unit_call = type(unit).__call__
+
+        if isinstance(unit, FlowUnit):
+            unit._frozen = True
+
+        if isinstance(unit, FinalUnit) and unit_call is FinalUnit.__call__:
+            steps.append(
+                _Step(_StepKind.FINISH, unit, _timed(unit, unit.finish))
+            )
+        elif isinstance(unit, RunUnit) and unit_call is RunUnit.__call__:
+            steps.append(
+                _Step(
+                    _StepKind.RUN,
+                    unit,
+                    _timed(unit, unit.run),
+                    next=index_of(_next_of(unit)),
+                )
+            )
+        elif (
+            isinstance(unit, ConditionalUnit)
+            and unit_call is ConditionalUnit.__call__
+        ):
+            steps.append(
+                _Step(
+                    _StepKind.CONDITION,
+                    unit,
+                    _timed(unit, unit.condition),
+                    next=index_of(_next_of(unit)),
+                    on_failure=index_of(unit._on_failure),
+                )
+            )
+        else:
+            steps.append(_Step(_StepKind.DELEGATE, unit, unit))
+
+    return tuple(steps)
+
+
+@t.final
+class CompiledFlow(BaseUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        root: FlowUnit[CONTEXT, OUT],
+        *,
+        observer: t.Optional[FlowObserver] = None,
+    ) -> None:
+        self._root = root
+        self._steps = _compile(root)
+        self._observer = self._active(observer)
+
+    @property
+    def root(self) -> FlowUnit[CONTEXT, OUT]:
+        return self._root
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __rshift__(self, other: BaseUnit[CONTEXT, OUT]) -> t.NoReturn:
+        raise FlowIsFrozenError(self.__class__.__name__)
+
+    def observed_by(
+        self, observer: t.Optional[FlowObserver]
+    ) -> "CompiledFlow[CONTEXT, OUT]":
+        observed = copy(self)
+        observed._observer = self._active(observer)
+        return observed
+
+    async def __call__(self, context: CONTEXT) -> Result[OUT]:
+        if self._observer is not None:
+            return await self._observed_call(context, self._observer)
+
+        run, finish, delegate = (
+            _StepKind.RUN,
+            _StepKind.FINISH,
+            _StepKind.DELEGATE,
+        )
+        steps = self._steps
+        step = steps[0]
+
+        while True:
+            kind = step.kind
+
+            if kind is delegate:
+                return t.cast(Result[OUT], await step.action(context))
+
+            try:
+                outcome = await step.action(context)
+            except Exception as error:
+                return Result.error(error)
+
+            if kind is finish:
+                return t.cast(Result[OUT], outcome)
+
+            step = steps[
+                step.next if kind is run or outcome else step.on_failure
+            ]
+
+    async def _observed_call(
+        self, context: CONTEXT, observer: FlowObserver
+    ) -> Result[OUT]:
+        steps = self._steps
+        step = steps[0]
+
+        while True:
+            unit = step.unit
+            observer.on_unit_start(unit)
+            started = perf_counter_ns()
+
+            if step.kind is _StepKind.DELEGATE:
+                result = t.cast(Result[OUT], await step.action(context))
+                observer.on_unit_end(
+                    unit,
+                    (
+                        UnitOutcome.ERROR
+                        if result.is_error()
+                        else UnitOutcome.COMPLETED
+                    ),
+                    perf_counter_ns() - started,
+                    result,
+                )
+                return result
+
+            try:
+                outcome = await step.action(context)
+            except Exception as error:
+                duration_ns = perf_counter_ns() - started
+                observer.on_exception(unit, error)
+                observer.on_unit_end(unit, UnitOutcome.ERROR, duration_ns)
+                return Result.error(error)
+
+            duration_ns = perf_counter_ns() - started
+
+            if step.kind is _StepKind.FINISH:
+                result = t.cast(Result[OUT], outcome)
+                observer.on_unit_end(
+                    unit, UnitOutcome.COMPLETED, duration_ns, result
+                )
+                return result
+
+            if step.kind is _StepKind.RUN or outcome:
+                observer.on_unit_end(unit, UnitOutcome.COMPLETED, duration_ns)
+                step = steps[step.next]
+            else:
+                observer.on_unit_end(unit, UnitOutcome.FAILED, duration_ns)
+                step = steps[step.on_failure]
+                observer.on_branch(unit, step.unit)
+
+    @staticmethod
+    def _active(
+        observer: t.Optional[FlowObserver],
+    ) -> t.Optional[FlowObserver]:
+        return None if isinstance(observer, NoOpFlowObserver) else observer
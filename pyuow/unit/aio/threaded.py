@@ -0,0 +1,115 @@
+import asyncio
+import contextvars
+import os
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from ...context import BaseContext
+from ...result import Result
+from .. import BaseUnit as SyncBaseUnit
+from .. import RunUnit as SyncRunUnit
+from .impl import FinalUnit, RunUnit
+
+CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
+OUT = t.TypeVar("OUT")
+RETURN = t.TypeVar("RETURN")
+
+
+class UnitThreadPool:
+    def __init__(
+        self,
+        *,
+        max_workers: t.Optional[int] = None,
+        thread_name_prefix: str = "pyuow",
+    ) -> None:
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._active = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return self._in_flight - self._active
+
+    async def run(self, fn: t.Callable[[], RETURN]) -> RETURN:
+        with self._lock:
+            self._in_flight += 1
+
+        submitted = self._executor.submit(
+            self._execute, contextvars.copy_context(), fn
+        )
+        submitted.add_done_callback(self._release)
+        future = asyncio.wrap_future(submitted)
+
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            submitted.cancel()
+            await asyncio.wait({future})
+            raise
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _execute(
+        self, context: contextvars.Context, fn: t.Callable[[], RETURN]
+    ) -> RETURN:
+        with self._lock:
+            self._active += 1
+        try:
+            return context.run(fn)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _release(self, _: t.Any) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+class ThreadedRunUnit(RunUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        unit: SyncRunUnit[CONTEXT, t.Any],
+        *,
+        pool: UnitThreadPool,
+    ) -> None:
+        super().__init__()
+        self._unit = unit
+        self._pool = pool
+
+    async def run(self, context: CONTEXT) -> None:
+        await self._pool.run(partial(self._unit.run, context))
+
+
+class ThreadedFlowUnit(FinalUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        flow: SyncBaseUnit[CONTEXT, OUT],
+        *,
+        pool: UnitThreadPool,
+    ) -> None:
+        super().__init__()
+        self._flow = flow
+        self._pool = pool
+
+    async def finish(self, context: CONTEXT) -> Result[OUT]:
+        return await self._pool.run(partial(self._flow, context))
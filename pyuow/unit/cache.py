@@ -0,0 +1,143 @@
+import threading
+import typing as t
+from collections import OrderedDict
+from time import monotonic
+
+from ..context import BaseContext
+from ..result import Result
+from .base import BaseUnit
+from .impl import FinalUnit
+
+CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
+OUT = t.TypeVar("OUT")
+
+
+def params_key(context: BaseContext[t.Any]) -> t.Hashable:
+    return t.cast(t.Hashable, context.params)
+
+
+class ResultCache(t.Generic[OUT]):
+    def __init__(
+        self,
+        *,
+        maxsize: int = 128,
+        ttl: t.Optional[float] = None,
+        cache_errors: bool = False,
+        clock: t.Callable[[], float] = monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._cache_errors = cache_errors
+        self._clock = clock
+        self._entries: t.OrderedDict[
+            t.Hashable, t.Tuple[float, Result[OUT]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, key: t.Hashable) -> t.Optional[Result[OUT]]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires_at, result = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return result
+                del self._entries[key]
+
+            self._misses += 1
+            return None
+
+    def put(self, key: t.Hashable, result: Result[OUT]) -> None:
+        if result.is_error() and not self._cache_errors:
+            return
+
+        expires_at = (
+            float("inf") if self._ttl is None else self._clock() + self._ttl
+        )
+
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def purge(self) -> int:
+        now = self._clock()
+
+        with self._lock:
+            expired = [
+                key
+                for key, (expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedUnit(FinalUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        unit: BaseUnit[CONTEXT, OUT],
+        *,
+        key: t.Callable[[CONTEXT], t.Hashable] = params_key,
+        maxsize: int = 128,
+        ttl: t.Optional[float] = None,
+        cache_errors: bool = False,
+        clock: t.Callable[[], float] = monotonic,
+    ) -> None:
+        super().__init__()
+        self._unit = unit
+        self._key = key
+        self._cache: ResultCache[OUT] = ResultCache(
+            maxsize=maxsize, ttl=ttl, cache_errors=cache_errors, clock=clock
+        )
+
+    @property
+    def cache(self) -> ResultCache[OUT]:
+        return self._cache
+
+    def finish(self, context: CONTEXT) -> Result[OUT]:
+        key = self._key(context)
+        cached = self._cache.get(key)
+
+        if cached is not None:
+            return cached
+
+        result = self._unit(context)
+        self._cache.put(key, result)
+        return result
@@ -6,5 +6,9 @@ class FinalUnitError(Exception):
     pass
 
 
+class FlowIsFrozenError(Exception):
+    pass
+
+
 class FlowNotTerminatedError(Exception):
     pass
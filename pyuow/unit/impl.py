@@ -1,7 +1,10 @@
 import abc
 import typing as t
 from abc import ABC
-from logging import getLogger
+from copy import copy
+from dataclasses import dataclass
+from enum import Enum, auto, unique
+from time import perf_counter_ns
 
 from ..context import BaseContext
 from ..result import Result
@@ -10,16 +13,18 @@ from .base import BaseUnit
 from .exceptions import (
     CannotReassignUnitError,
     FinalUnitError,
+    FlowIsFrozenError,
     FlowNotTerminatedError,
 )
-
-logger = getLogger(__name__)
+from .observer import FlowObserver, NoOpFlowObserver, UnitOutcome
 
 CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
 OUT = t.TypeVar("OUT")
 
 
 class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
+    _frozen = False
+
     def __init__(self) -> None:
         self._root: "FlowUnit[CONTEXT, OUT]" = self
         self._next: t.Union["FlowUnit[CONTEXT, OUT]", MissingType] = MISSING
@@ -27,6 +32,8 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
     def __rshift__(
         self: "FlowUnit[CONTEXT, OUT]", other: "FlowUnit[CONTEXT, OUT]"
     ) -> "FlowUnit[CONTEXT, OUT]":
+        if self._frozen or other._frozen:
+            raise FlowIsFrozenError(self.__class__.__name__)
         if not isinstance(other._next, MissingType):
             raise CannotReassignUnitError
 
@@ -34,31 +41,21 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
         other._root = self._root
         return other
 
-    def build(self) -> "FlowUnit[CONTEXT, OUT]":
+    def build(self) -> "CompiledFlow[CONTEXT, OUT]":
         cursor: "FlowUnit[CONTEXT, OUT]" = self._root
         while not isinstance(cursor, FinalUnit):
             if isinstance(cursor._next, MissingType):
                 raise FlowNotTerminatedError(cursor.__class__.__name__)
             cursor = cursor._next
-        return self._root
+        return CompiledFlow(self._root)
 
 
 class FinalUnit(FlowUnit[CONTEXT, OUT], ABC):
     def __call__(self, context: CONTEXT) -> Result[OUT]:
-        cls_name = self.__class__.__name__
-
         try:
-            result = self.finish(context)
+            return self.finish(context)
         except Exception as error:
-            logger.exception(
-                "[%s] failed with exception", cls_name, exc_info=error
-            )
             return Result.error(error)
-        else:
-            logger.info("[%s] completed", self.__class__.__name__)
-
-        logger.debug("[%s] result [%s]", self.__class__.__name__, result)
-        return result
 
     @abc.abstractmethod
     def finish(self, context: CONTEXT) -> Result[OUT]:
@@ -89,24 +86,19 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
         self._on_failure = on_failure
 
     def __call__(self, context: CONTEXT) -> Result[OUT]:
-        cls_name = self.__class__.__name__
-
         if isinstance(self._next, MissingType):
-            raise NotImplementedError(f"[{cls_name}] next unit is not set")
+            raise NotImplementedError(
+                f"[{self.__class__.__name__}] next unit is not set"
+            )
 
         try:
             passed = self.condition(context)
         except Exception as error:
-            logger.exception(
-                "[%s] failed with exception", cls_name, exc_info=error
-            )
             return Result.error(error)
 
         if passed:
-            logger.info("[%s] completed", cls_name)
             return self._next(context)
 
-        logger.info("[%s] failed", cls_name)
         return self._on_failure(context)
 
     @abc.abstractmethod
@@ -116,22 +108,209 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
 
 class RunUnit(FlowUnit[CONTEXT, OUT]):
     def __call__(self, context: CONTEXT) -> Result[OUT]:
-        cls_name = self.__class__.__name__
-
         if isinstance(self._next, MissingType):
-            raise NotImplementedError(f"[{cls_name}] next unit is not set")
+            raise NotImplementedError(
+                f"[{self.__class__.__name__}] next unit is not set"
+            )
 
         try:
             self.run(context)
         except Exception as error:
-            logger.exception(
-                "[%s] failed with exception", cls_name, exc_info=error
-            )
             return Result.error(error)
 
-        logger.info("[%s] completed", cls_name)
         return self._next(context)
 
     @abc.abstractmethod
     def run(self, context: CONTEXT) -> None:
         raise NotImplementedError
+
+
+@unique
+class _StepKind(Enum):
+    RUN = auto()
+    CONDITION = auto()
+    FINISH = auto()
+    DELEGATE = auto()
+
+
+@dataclass(frozen=True)
+class _Step(t.Generic[CONTEXT, OUT]):
+    kind: _StepKind
+    unit: BaseUnit[CONTEXT, OUT]
+    action: t.Callable[[CONTEXT], t.Any]
+    next: int = -1
+    on_failure: int = -1
+
+
+def _next_of(unit: FlowUnit[CONTEXT, OUT]) -> FlowUnit[CONTEXT, OUT]:
+    if isinstance(unit._next, MissingType):
+        raise FlowNotTerminatedError(unit.__class__.__name__)
+    return unit._next
+
+
+def _compile(
+    entry: BaseUnit[CONTEXT, OUT],
+) -> t.Tuple[_Step[CONTEXT, OUT], ...]:
+    units: t.List[BaseUnit[CONTEXT, OUT]] = []
+    indexes: t.Dict[int, int] = {}
+
+    def index_of(unit: BaseUnit[CONTEXT, OUT]) -> int:
+        if id(unit) not in indexes:
+            indexes[id(unit)] = len(units)
+            units.append(unit)
+        return indexes[id(unit)]
+
+    index_of(entry)
+    steps: t.List[_Step[CONTEXT, OUT]] = []
+
+    while len(steps) < len(units):
+        unit = units[len(steps)]
+        unit_call = type(unit).__call__
+
+        if isinstance(unit, FlowUnit):
+            unit._frozen = True
+
+        if isinstance(unit, FinalUnit) and unit_call is FinalUnit.__call__:
+            steps.append(_Step(_StepKind.FINISH, unit, unit.finish))
+        elif isinstance(unit, RunUnit) and unit_call is RunUnit.__call__:
+            steps.append(
+                _Step(
+                    _StepKind.RUN,
+                    unit,
+                    unit.run,
+                    next=index_of(_next_of(unit)),
+                )
+            )
+        elif (
+            isinstance(unit, ConditionalUnit)
+            and unit_call is ConditionalUnit.__call__
+        ):
+            steps.append(
+                _Step(
+                    _StepKind.CONDITION,
+                    unit,
+                    unit.condition,
+                    next=index_of(_next_of(unit)),
+                    on_failure=index_of(unit._on_failure),
+                )
+            )
+        else:
+            steps.append(_Step(_StepKind.DELEGATE, unit, unit))
+
+    return tuple(steps)
+
+
+@t.final
+class CompiledFlow(BaseUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        root: FlowUnit[CONTEXT, OUT],
+        *,
+        observer: t.Optional[FlowObserver] = None,
+    ) -> None:
+        self._root = root
+        self._steps = _compile(root)
+        self._observer = self._active(observer)
+
+    @property
+    def root(self) -> FlowUnit[CONTEXT, OUT]:
+        return self._root
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __rshift__(self, other: BaseUnit[CONTEXT, OUT]) -> t.NoReturn:
+        raise FlowIsFrozenError(self.__class__.__name__)
+
+    def observed_by(
+        self, observer: t.Optional[FlowObserver]
+    ) -> "CompiledFlow[CONTEXT, OUT]":
+        observed = copy(self)
+        observed._observer = self._active(observer)
+        return observed
+
+    def __call__(self, context: CONTEXT) -> Result[OUT]:
+        if self._observer is not None:
+            return self._observed_call(context, self._observer)
+
+        run, finish, delegate = (
+            _StepKind.RUN,
+            _StepKind.FINISH,
+            _StepKind.DELEGATE,
+        )
+        steps = self._steps
+        step = steps[0]
+
+        while True:
+            kind = step.kind
+
+            if kind is delegate:
+                return t.cast(Result[OUT], step.action(context))
+
+            try:
+                outcome = step.action(context)
+            except Exception as error:
+                return Result.error(error)
+
+            if kind is finish:
+                return t.cast(Result[OUT], outcome)
+
+            step = steps[
+                step.next if kind is run or outcome else step.on_failure
+            ]
+
+    def _observed_call(
+        self, context: CONTEXT, observer: FlowObserver
+    ) -> Result[OUT]:
+        steps = self._steps
+        step = steps[0]
+
+        while True:
+            unit = step.unit
+            observer.on_unit_start(unit)
+            started = perf_counter_ns()
+
+            if step.kind is _StepKind.DELEGATE:
+                result = t.cast(Result[OUT], step.action(context))
+                observer.on_unit_end(
+                    unit,
+                    (
+                        UnitOutcome.ERROR
+                        if result.is_error()
+                        else UnitOutcome.COMPLETED
+                    ),
+                    perf_counter_ns() - started,
+                    result,
+                )
+                return result
+
+            try:
+                outcome = step.action(context)
+            except Exception as error:
+                duration_ns = perf_counter_ns() - started
+                observer.on_exception(unit, error)
+                observer.on_unit_end(unit, UnitOutcome.ERROR, duration_ns)
+                return Result.error(error)
+
+            duration_ns = perf_counter_ns() - started
+
+            if step.kind is _StepKind.FINISH:
+                result = t.cast(Result[OUT], outcome)
+                observer.on_unit_end(
+                    unit, UnitOutcome.COMPLETED, duration_ns, result
+                )
+                return result
+
+            if step.kind is _StepKind.RUN or outcome:
+                observer.on_unit_end(unit, UnitOutcome.COMPLETED, duration_ns)
+                step = steps[step.next]
+            else:
+                observer.on_unit_end(unit, UnitOutcome.FAILED, duration_ns)
+                step = steps[step.on_failure]
+                observer.on_branch(unit, step.unit)
+
+    @staticmethod
+    def _active(
+        observer: t.Optional[FlowObserver],
+    ) -> t.Optional[FlowObserver]:
+        return None if isinstance(observer, NoOpFlowObserver) else observer
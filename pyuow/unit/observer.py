@@ -0,0 +1,68 @@
+import typing as t
+from enum import Enum, auto, unique
+from logging import Logger, getLogger
+
+from ..result import Result
+
+logger = getLogger(__name__)
+
+
+@unique
+class UnitOutcome(Enum):
+    COMPLETED = auto()
+    FAILED = auto()
+    ERROR = auto()
+
+
+class FlowObserver:
+    def on_unit_start(self, unit: object) -> None:
+        pass
+
+    def on_unit_end(
+        self,
+        unit: object,
+        outcome: UnitOutcome,
+        duration_ns: int,
+        result: t.Optional[Result[t.Any]] = None,
+    ) -> None:
+        pass
+
+    def on_branch(self, unit: object, target: object) -> None:
+        pass
+
+    def on_exception(self, unit: object, error: Exception) -> None:
+        pass
+
+
+@t.final
+class NoOpFlowObserver(FlowObserver):
+    pass
+
+
+class LoggingFlowObserver(FlowObserver):
+    def __init__(self, *, logger: Logger = logger) -> None:
+        self._logger = logger
+
+    def on_unit_end(
+        self,
+        unit: object,
+        outcome: UnitOutcome,
+        duration_ns: int,
+        result: t.Optional[Result[t.Any]] = None,
+    ) -> None:
+        cls_name = unit.__class__.__name__
+
+        if outcome is UnitOutcome.COMPLETED:
+            self._logger.info("[%s] completed", cls_name)
+        elif outcome is UnitOutcome.FAILED:
+            self._logger.info("[%s] failed", cls_name)
+
+        if result is not None:
+            self._logger.debug("[%s] result [%s]", cls_name, result)
+
+    def on_exception(self, unit: object, error: Exception) -> None:
+        self._logger.exception(
+            "[%s] failed with exception",
+            unit.__class__.__name__,
+            exc_info=error,
+        )
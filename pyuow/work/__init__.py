@@ -1,6 +1,11 @@
 from .base import BaseUnitProxy, BaseWorkManager
+from .exceptions import IdempotencyKeyInUseError, WorkRejectedError
+from .retry import RetryPolicy
 
 __all__ = (
     "BaseUnitProxy",
     "BaseWorkManager",
+    "IdempotencyKeyInUseError",
+    "RetryPolicy",
+    "WorkRejectedError",
 )
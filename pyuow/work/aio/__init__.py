@@ -1,6 +1,9 @@
+from .admission import AdmissionController, AdmissionPolicy
 from .base import BaseUnitProxy, BaseWorkManager
 
 __all__ = (
+    "AdmissionController",
+    "AdmissionPolicy",
     "BaseUnitProxy",
     "BaseWorkManager",
 )
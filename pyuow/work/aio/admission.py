@@ -0,0 +1,138 @@
+import asyncio
+import typing as t
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum, auto, unique
+
+from ..exceptions import WorkRejectedError
+
+
+@unique
+class AdmissionPolicy(Enum):
+    FIFO = auto()
+    LIFO = auto()
+    CODEL = auto()
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        *,
+        max_in_flight: int,
+        max_queued: t.Optional[int] = None,
+        queue_timeout: t.Optional[float] = None,
+        policy: AdmissionPolicy = AdmissionPolicy.FIFO,
+        codel_target: float = 0.005,
+        codel_interval: float = 0.1,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive")
+        if max_queued is not None and max_queued < 0:
+            raise ValueError("max_queued must not be negative")
+
+        self._max_in_flight = max_in_flight
+        self._max_queued = max_queued
+        self._queue_timeout = queue_timeout
+        self._policy = policy
+        self._codel_target = codel_target
+        self._codel_interval = codel_interval
+        self._waiters: t.Deque["asyncio.Future[bool]"] = deque()
+        self._in_flight = 0
+        self._rejected = 0
+        self._last_empty: t.Optional[float] = None
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    @asynccontextmanager
+    async def admit(self) -> t.AsyncIterator[None]:
+        if not await self.acquire():
+            self._rejected += 1
+            raise WorkRejectedError(
+                f"admission rejected: {self._in_flight} in flight,"
+                f" {len(self._waiters)} queued"
+            )
+
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> bool:
+        if self._in_flight < self._max_in_flight and not self._waiters:
+            self._in_flight += 1
+            return True
+
+        loop = asyncio.get_running_loop()
+        overloaded = self._overloaded(loop.time())
+
+        if self._max_queued is not None and self.queued >= self._max_queued:
+            if not self._waiters or not self._lifo(overloaded):
+                return False
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(False)
+                    break
+
+        if not self._waiters:
+            self._last_empty = loop.time()
+
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        timeout = self._codel_target if overloaded else self._queue_timeout
+
+        try:
+            if timeout is None:
+                return await waiter
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return self._granted(waiter)
+        except asyncio.CancelledError:
+            if self._granted(waiter):
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        while self._waiters:
+            if self._lifo(self._overloaded(asyncio.get_running_loop().time())):
+                waiter = self._waiters.pop()
+            else:
+                waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+
+        self._in_flight -= 1
+
+    def _lifo(self, overloaded: bool) -> bool:
+        return overloaded or self._policy is AdmissionPolicy.LIFO
+
+    def _overloaded(self, now: float) -> bool:
+        return (
+            self._policy is AdmissionPolicy.CODEL
+            and self._last_empty is not None
+            and len(self._waiters) > 0
+            and now - self._last_empty > self._codel_interval
+        )
+
+    @staticmethod
+    def _granted(waiter: "asyncio.Future[bool]") -> bool:
+        return waiter.done() and not waiter.cancelled() and waiter.result()
@@ -4,18 +4,56 @@ from abc import ABC
 
 from ...context import BaseContext
 from ...result import Result
-from ...unit.aio import BaseUnit
+from ...unit import FlowObserver
+from ...unit.aio import BaseUnit, CompiledFlow, deadline
 
 CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
 OUT = t.TypeVar("OUT")
 
 
 class BaseUnitProxy(BaseUnit[CONTEXT, OUT], ABC):
-    async def do_with(self, context: CONTEXT) -> Result[OUT]:
-        return await self(context)
+    async def do_with(
+        self, context: CONTEXT, *, timeout: t.Optional[float] = None
+    ) -> Result[OUT]:
+        if timeout is None:
+            return await self(context)
+
+        try:
+            async with deadline(timeout):
+                return await self(context)
+        except TimeoutError as error:
+            return Result.error(error)
+
+    async def do_with_retry(
+        self,
+        context_factory: t.Callable[[], CONTEXT],
+        *,
+        timeout: t.Optional[float] = None,
+    ) -> Result[OUT]:
+        return await self.do_with(context_factory(), timeout=timeout)
+
+    async def do_with_many(
+        self,
+        contexts: t.Iterable[CONTEXT],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.List[Result[OUT]]:
+        return [await self.do_with(context) for context in contexts]
 
 
 class BaseWorkManager(ABC):
+    _observer: t.Optional[FlowObserver] = None
+
+    def __init__(self, *, observer: t.Optional[FlowObserver] = None) -> None:
+        self._observer = observer
+
     @abc.abstractmethod
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
         raise NotImplementedError
+
+    def _observed(
+        self, unit: BaseUnit[CONTEXT, OUT]
+    ) -> BaseUnit[CONTEXT, OUT]:
+        if self._observer is not None and isinstance(unit, CompiledFlow):
+            return unit.observed_by(self._observer)
+        return unit
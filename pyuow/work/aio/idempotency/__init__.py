@@ -0,0 +1,15 @@
+from .base import BaseIdempotencyStore
+from .impl import (
+    IdempotencyWorkManager,
+    IdempotentUnit,
+    IdempotentUnitProxy,
+)
+from .in_memory import InMemoryIdempotencyStore
+
+__all__ = (
+    "BaseIdempotencyStore",
+    "IdempotencyWorkManager",
+    "IdempotentUnit",
+    "IdempotentUnitProxy",
+    "InMemoryIdempotencyStore",
+)
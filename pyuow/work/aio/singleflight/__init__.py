@@ -0,0 +1,6 @@
+from .impl import SingleFlightUnitProxy, SingleFlightWorkManager
+
+__all__ = (
+    "SingleFlightUnitProxy",
+    "SingleFlightWorkManager",
+)
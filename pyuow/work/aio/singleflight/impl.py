@@ -0,0 +1,108 @@
+import asyncio
+import typing as t
+from dataclasses import dataclass
+from functools import partial
+
+from ....context import BaseContext
+from ....result import Result
+from ....unit.aio import BaseUnit
+from ....unit.cache import params_key
+from ...aio import BaseUnitProxy, BaseWorkManager
+
+CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
+OUT = t.TypeVar("OUT")
+
+
+@dataclass(eq=False)
+class _Flight:
+    task: "asyncio.Future[Result[t.Any]]"
+    waiters: int = 0
+
+
+class SingleFlightUnitProxy(BaseUnitProxy[CONTEXT, OUT]):
+    def __init__(
+        self,
+        *,
+        proxy: BaseUnitProxy[CONTEXT, OUT],
+        unit: BaseUnit[CONTEXT, OUT],
+        key: t.Callable[[CONTEXT], t.Hashable],
+        flights: t.Dict[t.Hashable, _Flight],
+    ) -> None:
+        self._proxy = proxy
+        self._unit = unit
+        self._key = key
+        self._flights = flights
+
+    async def __call__(self, context: CONTEXT) -> Result[OUT]:
+        return await self.do_with(context)
+
+    async def do_with(
+        self, context: CONTEXT, *, timeout: t.Optional[float] = None
+    ) -> Result[OUT]:
+        flight_key = (self._unit, self._key(context))
+        flight = self._flights.get(flight_key)
+
+        if flight is None:
+            flight = _Flight(
+                asyncio.ensure_future(
+                    self._proxy.do_with(context, timeout=timeout)
+                )
+            )
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(
+                partial(self._land, flight_key, flight)
+            )
+
+        flight.waiters += 1
+
+        try:
+            return t.cast(
+                Result[OUT],
+                await asyncio.wait_for(asyncio.shield(flight.task), timeout),
+            )
+        except asyncio.TimeoutError:
+            if flight.task.done():
+                raise
+            return Result.error(TimeoutError())
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._drop(flight_key, flight)
+                flight.task.cancel()
+
+    def _land(
+        self,
+        flight_key: t.Hashable,
+        flight: _Flight,
+        task: "asyncio.Future[Result[t.Any]]",
+    ) -> None:
+        self._drop(flight_key, flight)
+
+    def _drop(self, flight_key: t.Hashable, flight: _Flight) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+
+
+class SingleFlightWorkManager(BaseWorkManager):
+    def __init__(
+        self,
+        *,
+        work_manager: BaseWorkManager,
+        key: t.Callable[[t.Any], t.Hashable] = params_key,
+    ) -> None:
+        super().__init__()
+        self._work_manager = work_manager
+        self._key = key
+        self._flights: t.Dict[t.Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
+        return SingleFlightUnitProxy(
+            proxy=self._work_manager.by(unit),
+            unit=unit,
+            key=self._key,
+            flights=self._flights,
+        )
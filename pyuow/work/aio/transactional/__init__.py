@@ -1,9 +1,12 @@
 from .base import BaseTransaction, BaseTransactionManager
+from .group import GroupCommit, GroupCommitter
 from .impl import TransactionalUnitProxy, TransactionalWorkManager
 
 __all__ = (
     "BaseTransaction",
     "BaseTransactionManager",
+    "GroupCommit",
+    "GroupCommitter",
     "TransactionalUnitProxy",
     "TransactionalWorkManager",
 )
@@ -12,6 +12,9 @@ class BaseTransaction(t.Generic[TRANSACTION_PROVIDER], ABC):
     def it(self) -> TRANSACTION_PROVIDER:
         return self._transaction_provider
 
+    async def flush(self) -> None:
+        pass
+
     @abc.abstractmethod
     async def rollback(self) -> None:
         raise NotImplementedError
@@ -28,3 +31,6 @@ class BaseTransactionManager(t.Generic[TRANSACTION], ABC):
     @abc.abstractmethod
     def transaction(self) -> t.AsyncContextManager[TRANSACTION]:
         raise NotImplementedError
+
+    def savepoint(self) -> t.AsyncContextManager[TRANSACTION]:
+        return self.transaction()
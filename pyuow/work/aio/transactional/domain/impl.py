@@ -4,10 +4,13 @@ from .....context import BaseContext
 from .....context.domain import BaseDomainContext
 from .....domain import Batch
 from .....result import Result
+from .....unit import FlowObserver
 from .....unit.aio import BaseUnit
-from .....work.aio import BaseUnitProxy
+from .....work import RetryPolicy
+from .....work.aio import AdmissionController, BaseUnitProxy
 from .....work.aio.transactional import (
     BaseTransactionManager,
+    GroupCommit,
     TransactionalWorkManager,
 )
 from .. import BaseTransaction
@@ -42,14 +45,24 @@ class DomainTransactionalWorkManager(TransactionalWorkManager):
         *,
         transaction_manager: BaseTransactionManager[TRANSACTION],
         batch_handler: t.Callable[[Batch], t.Awaitable[None]],
+        observer: t.Optional[FlowObserver] = None,
+        admission: t.Optional[AdmissionController] = None,
+        group_commit: t.Optional[GroupCommit] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
     ) -> None:
-        super().__init__(transaction_manager=transaction_manager)
+        super().__init__(
+            transaction_manager=transaction_manager,
+            observer=observer,
+            admission=admission,
+            group_commit=group_commit,
+            retry_policy=retry_policy,
+        )
         self._batch_handler = batch_handler
 
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
         return super().by(
             unit=DomainUnit(
-                unit=unit,
+                unit=self._observed(unit),
                 batch_handler=self._batch_handler,
             )
         )
@@ -0,0 +1,130 @@
+import asyncio
+import typing as t
+from contextvars import Context, ContextVar, copy_context
+from dataclasses import dataclass
+
+from ....result import Result
+from .base import BaseTransactionManager
+
+OUT = t.TypeVar("OUT")
+
+_Job = t.Callable[[], t.Awaitable[Result[t.Any]]]
+_Changes = t.Mapping[ContextVar[t.Any], t.Any]
+_Outcome = t.Tuple[Result[t.Any], _Changes]
+_Entry = t.Tuple[_Job, "asyncio.Future[_Outcome]", Context]
+
+_batching: ContextVar[bool] = ContextVar("pyuow_group_batch", default=False)
+
+
+@dataclass(frozen=True)
+class GroupCommit:
+    max_size: int = 64
+    window: float = 0.002
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("max_size must be positive")
+        if self.window < 0:
+            raise ValueError("window must not be negative")
+
+
+class GroupCommitter:
+    def __init__(
+        self,
+        transaction_manager: BaseTransactionManager[t.Any],
+        policy: GroupCommit,
+    ) -> None:
+        self._transaction_manager = transaction_manager
+        self._policy = policy
+        self._batch: t.List[_Entry] = []
+        self._timer: t.Optional[asyncio.TimerHandle] = None
+        self._commits: t.Set["asyncio.Task[None]"] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._batch)
+
+    async def submit(
+        self, job: t.Callable[[], t.Awaitable[Result[OUT]]]
+    ) -> Result[OUT]:
+        if _batching.get():
+            return await job()
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[_Outcome]" = loop.create_future()
+        self._batch.append((job, future, copy_context()))
+
+        if len(self._batch) >= self._policy.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._policy.window, self._flush)
+
+        result, changes = await future
+        for var, value in changes.items():
+            var.set(value)
+
+        return t.cast(Result[OUT], result)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch = self._batch, []
+        task = Context().run(asyncio.ensure_future, self._commit(batch))
+        self._commits.add(task)
+        task.add_done_callback(self._commits.discard)
+
+    async def _commit(self, batch: t.List[_Entry]) -> None:
+        changes: _Changes = {}
+
+        try:
+            try:
+                results = await self._run(batch)
+                changes = {
+                    var: value
+                    for var, value in copy_context().items()
+                    if var is not _batching
+                }
+            except Exception as error:
+                results = [Result.error(error) for _ in batch]
+
+            for (_, future, _), result in zip(batch, results):
+                if not future.done() and result is not None:
+                    future.set_result((result, changes))
+        finally:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _run(
+        self, batch: t.List[_Entry]
+    ) -> t.List[t.Optional[Result[t.Any]]]:
+        results: t.List[t.Optional[Result[t.Any]]] = []
+        _batching.set(True)
+
+        async with self._transaction_manager.transaction() as trx:
+            shared = copy_context()
+            for job, future, context in batch:
+                if future.cancelled():
+                    results.append(None)
+                    continue
+                try:
+                    results.append(await _spawn(job, context, shared))
+                except Exception as error:
+                    results.append(Result.error(error))
+
+            await trx.commit()
+
+        return results
+
+
+def _spawn(
+    job: _Job, context: Context, shared: Context
+) -> "asyncio.Future[Result[t.Any]]":
+    def start() -> "asyncio.Future[Result[t.Any]]":
+        for var, value in shared.items():
+            var.set(value)
+        return asyncio.ensure_future(job())
+
+    return context.run(start)
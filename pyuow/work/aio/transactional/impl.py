@@ -1,12 +1,21 @@
+import asyncio
 import typing as t
+from contextlib import nullcontext
+from functools import partial
+from itertools import islice
 
 from ....context import BaseContext
 from ....result import Result
-from ....unit.aio import BaseUnit
+from ....unit import FlowObserver
+from ....unit.aio import BaseUnit, deadline
 from ...aio import BaseWorkManager
+from ...aio.admission import AdmissionController
 from ...aio.base import BaseUnitProxy
 from ...aio.transactional import BaseTransactionManager
+from ...exceptions import WorkRejectedError
+from ...retry import RetryPolicy
 from .base import BaseTransaction
+from .group import GroupCommit, GroupCommitter
 
 CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
 OUT = t.TypeVar("OUT")
@@ -19,13 +28,117 @@ class TransactionalUnitProxy(BaseUnitProxy[CONTEXT, OUT]):
         *,
         transaction_manager: BaseTransactionManager[TRANSACTION],
         unit: BaseUnit[CONTEXT, OUT],
+        admission: t.Optional[AdmissionController] = None,
+        group_committer: t.Optional[GroupCommitter] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
     ) -> None:
         self._transaction_manager = transaction_manager
         self._unit = unit
+        self._admission = admission
+        self._group_committer = group_committer
+        self._retry_policy = retry_policy
 
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
+        return await self.do_with(context)
+
+    async def do_with(
+        self, context: CONTEXT, *, timeout: t.Optional[float] = None
+    ) -> Result[OUT]:
+        if self._admission is None:
+            return await self._execute(context, timeout)
+
+        try:
+            async with self._admission.admit():
+                return await self._execute(context, timeout)
+        except WorkRejectedError as error:
+            return Result.error(error)
+
+    async def do_with_retry(
+        self,
+        context_factory: t.Callable[[], CONTEXT],
+        *,
+        timeout: t.Optional[float] = None,
+    ) -> Result[OUT]:
+        if self._retry_policy is None:
+            return await self.do_with(context_factory(), timeout=timeout)
+
+        attempt = 1
+
+        while True:
+            try:
+                result = await self.do_with(context_factory(), timeout=timeout)
+            except Exception as error:
+                delay = self._retry_policy.retry_after(error, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_policy.retry_after(result, attempt)
+                if delay is None:
+                    return result
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def do_with_many(
+        self,
+        contexts: t.Iterable[CONTEXT],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.List[Result[OUT]]:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        results: t.List[Result[OUT]] = []
+        iterator = iter(contexts)
+
+        while chunk := list(islice(iterator, chunk_size)):
+            try:
+                async with self._admit():
+                    results.extend(await self._run_chunk(chunk))
+            except Exception as error:
+                results.extend(Result.error(error) for _ in chunk)
+
+        return results
+
+    def _admit(self) -> t.AsyncContextManager[None]:
+        if self._admission is None:
+            return nullcontext()
+        return self._admission.admit()
+
+    async def _run_chunk(self, chunk: t.List[CONTEXT]) -> t.List[Result[OUT]]:
         async with self._transaction_manager.transaction() as trx:
-            result = await self._unit(context)
+            results = [await self._run(context) for context in chunk]
+            await trx.commit()
+            return results
+
+    async def _execute(
+        self, context: CONTEXT, timeout: t.Optional[float]
+    ) -> Result[OUT]:
+        if self._group_committer is None:
+            return await self._run(context, timeout)
+
+        return await self._group_committer.submit(
+            partial(self._run, context, timeout)
+        )
+
+    async def _run(
+        self, context: CONTEXT, timeout: t.Optional[float] = None
+    ) -> Result[OUT]:
+        async with self._transaction_manager.savepoint() as trx:
+            if timeout is None:
+                result = await self._unit(context)
+            else:
+                try:
+                    async with deadline(timeout):
+                        result = await self._unit(context)
+                except TimeoutError as error:
+                    result = Result.error(error)
+
+            if not result.is_error():
+                try:
+                    await trx.flush()
+                except Exception as error:
+                    result = Result.error(error)
 
             if result.is_error():
                 await trx.rollback()
@@ -40,11 +153,26 @@ class TransactionalWorkManager(BaseWorkManager):
         self,
         *,
         transaction_manager: BaseTransactionManager[TRANSACTION],
+        observer: t.Optional[FlowObserver] = None,
+        admission: t.Optional[AdmissionController] = None,
+        group_commit: t.Optional[GroupCommit] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
     ) -> None:
+        super().__init__(observer=observer)
         self._transaction_manager = transaction_manager
+        self._admission = admission
+        self._retry_policy = retry_policy
+        self._group_committer = (
+            None
+            if group_commit is None
+            else GroupCommitter(transaction_manager, group_commit)
+        )
 
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
         return TransactionalUnitProxy(
             transaction_manager=self._transaction_manager,
-            unit=unit,
+            unit=self._observed(unit),
+            admission=self._admission,
+            group_committer=self._group_committer,
+            retry_policy=self._retry_policy,
         )
@@ -4,7 +4,7 @@ from abc import ABC
 
 from ..context import BaseContext
 from ..result import Result
-from ..unit import BaseUnit
+from ..unit import BaseUnit, CompiledFlow, FlowObserver
 
 CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
 OUT = t.TypeVar("OUT")
@@ -14,8 +14,33 @@ class BaseUnitProxy(BaseUnit[CONTEXT, OUT], ABC):
     def do_with(self, context: CONTEXT) -> Result[OUT]:
         return self(context)
 
+    def do_with_retry(
+        self, context_factory: t.Callable[[], CONTEXT]
+    ) -> Result[OUT]:
+        return self.do_with(context_factory())
+
+    def do_with_many(
+        self,
+        contexts: t.Iterable[CONTEXT],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.List[Result[OUT]]:
+        return [self.do_with(context) for context in contexts]
+
 
 class BaseWorkManager(ABC):
+    _observer: t.Optional[FlowObserver] = None
+
+    def __init__(self, *, observer: t.Optional[FlowObserver] = None) -> None:
+        self._observer = observer
+
     @abc.abstractmethod
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
         raise NotImplementedError
+
+    def _observed(
+        self, unit: BaseUnit[CONTEXT, OUT]
+    ) -> BaseUnit[CONTEXT, OUT]:
+        if self._observer is not None and isinstance(unit, CompiledFlow):
+            return unit.observed_by(self._observer)
+        return unit
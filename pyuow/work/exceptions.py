@@ -0,0 +1,6 @@
+class WorkRejectedError(Exception):
+    pass
+
+
+class IdempotencyKeyInUseError(Exception):
+    pass
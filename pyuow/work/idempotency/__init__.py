@@ -0,0 +1,17 @@
+from .base import BaseIdempotencyStore
+from .impl import (
+    IdempotencyClaims,
+    IdempotencyWorkManager,
+    IdempotentUnit,
+    IdempotentUnitProxy,
+)
+from .in_memory import InMemoryIdempotencyStore
+
+__all__ = (
+    "BaseIdempotencyStore",
+    "IdempotencyClaims",
+    "IdempotencyWorkManager",
+    "IdempotentUnit",
+    "IdempotentUnitProxy",
+    "InMemoryIdempotencyStore",
+)
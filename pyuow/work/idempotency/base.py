@@ -0,0 +1,27 @@
+import abc
+import typing as t
+from abc import ABC
+
+from ...result import Result
+
+
+class BaseIdempotencyStore(ABC):
+    @abc.abstractmethod
+    def get(self, key: str) -> t.Optional[Result[t.Any]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def claim(self, key: str) -> t.Optional[Result[t.Any]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def complete(self, key: str, result: Result[t.Any]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def settle(self, key: str, *, committed: bool) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def purge(self) -> int:
+        raise NotImplementedError
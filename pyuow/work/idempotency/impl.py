@@ -0,0 +1,191 @@
+import threading
+import typing as t
+from itertools import islice
+
+from ...context import BaseContext
+from ...result import Result
+from ...unit import BaseUnit
+from ..base import BaseUnitProxy, BaseWorkManager
+from .base import BaseIdempotencyStore
+
+CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
+OUT = t.TypeVar("OUT")
+
+
+class IdempotencyClaims:
+    def __init__(self) -> None:
+        self._keys: t.Dict[int, str] = {}
+        self._abandoned: t.List[str] = []
+        self._lock = threading.Lock()
+
+    def hold(self, context: BaseContext[t.Any], key: str) -> None:
+        with self._lock:
+            self._keys[id(context)] = key
+
+    def release(self, context: BaseContext[t.Any]) -> t.Optional[str]:
+        with self._lock:
+            return self._keys.pop(id(context), None)
+
+    def abandon(self, context: BaseContext[t.Any]) -> None:
+        with self._lock:
+            if (key := self._keys.pop(id(context), None)) is not None:
+                self._abandoned.append(key)
+
+    def abandoned(self) -> t.List[str]:
+        with self._lock:
+            abandoned, self._abandoned = self._abandoned, []
+        return abandoned
+
+
+class IdempotentUnit(BaseUnit[CONTEXT, OUT]):
+    def __init__(
+        self,
+        *,
+        unit: BaseUnit[CONTEXT, OUT],
+        store: BaseIdempotencyStore,
+        key: t.Callable[[CONTEXT], str],
+        claims: t.Optional[IdempotencyClaims] = None,
+    ) -> None:
+        self._unit = unit
+        self._store = store
+        self._key = key
+        self._claims = claims
+
+    def __call__(self, context: CONTEXT) -> Result[OUT]:
+        if self._claims is not None:
+            for abandoned in self._claims.abandoned():
+                self._store.settle(abandoned, committed=False)
+
+        key = self._key(context)
+        stored = self._store.claim(key)
+
+        if stored is not None:
+            return t.cast(Result[OUT], stored)
+
+        if self._claims is not None:
+            self._claims.hold(context, key)
+
+        try:
+            result = self._unit(context)
+        except BaseException:
+            if self._claims is None:
+                self._store.settle(key, committed=False)
+            raise
+
+        if not result.is_error():
+            self._store.complete(key, result)
+
+        if self._claims is None:
+            self._store.settle(key, committed=not result.is_error())
+
+        return result
+
+
+class IdempotentUnitProxy(BaseUnitProxy[CONTEXT, OUT]):
+    def __init__(
+        self,
+        *,
+        proxy: BaseUnitProxy[CONTEXT, OUT],
+        store: BaseIdempotencyStore,
+        claims: IdempotencyClaims,
+    ) -> None:
+        self._proxy = proxy
+        self._store = store
+        self._claims = claims
+
+    def __call__(self, context: CONTEXT) -> Result[OUT]:
+        return self.do_with(context)
+
+    def do_with(self, context: CONTEXT) -> Result[OUT]:
+        try:
+            result = self._proxy.do_with(context)
+        except BaseException:
+            self._settle([context], committed=False)
+            raise
+
+        self._settle([context], committed=not result.is_error())
+        return result
+
+    def do_with_retry(
+        self, context_factory: t.Callable[[], CONTEXT]
+    ) -> Result[OUT]:
+        attempts: t.List[CONTEXT] = []
+
+        def attempt() -> CONTEXT:
+            for context in attempts:
+                self._claims.abandon(context)
+            attempts[:] = [context_factory()]
+            return attempts[0]
+
+        try:
+            result = self._proxy.do_with_retry(attempt)
+        except BaseException:
+            self._settle(attempts, committed=False)
+            raise
+
+        self._settle(attempts, committed=not result.is_error())
+        return result
+
+    def do_with_many(
+        self,
+        contexts: t.Iterable[CONTEXT],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.List[Result[OUT]]:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        results: t.List[Result[OUT]] = []
+        iterator = iter(contexts)
+
+        while chunk := list(islice(iterator, chunk_size)):
+            try:
+                settled = self._proxy.do_with_many(chunk)
+            except BaseException:
+                self._settle(chunk, committed=False)
+                raise
+
+            for context, result in zip(chunk, settled):
+                self._settle([context], committed=not result.is_error())
+            results.extend(settled)
+
+        return results
+
+    def _settle(
+        self, contexts: t.Iterable[CONTEXT], *, committed: bool
+    ) -> None:
+        for abandoned in self._claims.abandoned():
+            self._store.settle(abandoned, committed=False)
+
+        for context in contexts:
+            if (key := self._claims.release(context)) is not None:
+                self._store.settle(key, committed=committed)
+
+
+class IdempotencyWorkManager(BaseWorkManager):
+    def __init__(
+        self,
+        *,
+        work_manager: BaseWorkManager,
+        store: BaseIdempotencyStore,
+        key: t.Callable[[t.Any], str],
+    ) -> None:
+        super().__init__()
+        self._work_manager = work_manager
+        self._store = store
+        self._key = key
+
+    def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
+        claims = IdempotencyClaims()
+        return IdempotentUnitProxy(
+            proxy=self._work_manager.by(
+                IdempotentUnit(
+                    unit=self._work_manager._observed(unit),
+                    store=self._store,
+                    key=self._key,
+                    claims=claims,
+                )
+            ),
+            store=self._store,
+            claims=claims,
+        )
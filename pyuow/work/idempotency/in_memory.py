@@ -0,0 +1,49 @@
+import threading
+import typing as t
+from datetime import timedelta
+
+from ...result import Result
+from ...unit.cache import ResultCache
+from ..exceptions import IdempotencyKeyInUseError
+from .base import BaseIdempotencyStore
+
+
+class InMemoryIdempotencyStore(BaseIdempotencyStore):
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        ttl: t.Optional[timedelta] = None,
+    ) -> None:
+        self._cache: ResultCache[t.Any] = ResultCache(
+            maxsize=maxsize,
+            ttl=None if ttl is None else ttl.total_seconds(),
+        )
+        self._claimed: t.Dict[str, t.Optional[Result[t.Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> t.Optional[Result[t.Any]]:
+        return self._cache.get(key)
+
+    def claim(self, key: str) -> t.Optional[Result[t.Any]]:
+        with self._lock:
+            if (stored := self._cache.get(key)) is not None:
+                return stored
+            if key in self._claimed:
+                return Result.error(IdempotencyKeyInUseError(key))
+            self._claimed[key] = None
+            return None
+
+    def complete(self, key: str, result: Result[t.Any]) -> None:
+        with self._lock:
+            if key in self._claimed:
+                self._claimed[key] = result
+
+    def settle(self, key: str, *, committed: bool) -> None:
+        with self._lock:
+            result = self._claimed.pop(key, None)
+            if committed and result is not None:
+                self._cache.put(key, result)
+
+    def purge(self) -> int:
+        return self._cache.purge()
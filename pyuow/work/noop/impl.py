@@ -23,4 +23,4 @@ class NoOpUnitProxy(BaseUnitProxy[CONTEXT, OUT]):  # pragma: no cover
 
 class NoOpWorkManager(BaseWorkManager):  # pragma: no cover
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
-        return NoOpUnitProxy(unit=unit)
+        return NoOpUnitProxy(unit=self._observed(unit))
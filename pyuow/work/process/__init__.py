@@ -0,0 +1,3 @@
+from .impl import ProcessPoolFlowRunner
+
+__all__ = ("ProcessPoolFlowRunner",)
@@ -0,0 +1,134 @@
+import os
+import typing as t
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from itertools import islice
+from multiprocessing.context import BaseContext as ProcessContext
+from types import TracebackType
+
+from ...context import BaseContext
+from ...result import Result
+from ...unit import BaseUnit
+
+CONTEXT = t.TypeVar("CONTEXT", bound=BaseContext[t.Any])
+OUT = t.TypeVar("OUT")
+
+_worker_flow: t.Optional[BaseUnit[t.Any, t.Any]] = None
+
+
+def _init_worker(
+    flow_factory: t.Callable[[], BaseUnit[t.Any, t.Any]],
+) -> None:
+    global _worker_flow
+    _worker_flow = flow_factory()
+
+
+def _run_chunk(contexts: t.List[t.Any]) -> t.List[Result[t.Any]]:
+    flow = t.cast(BaseUnit[t.Any, t.Any], _worker_flow)
+    results: t.List[Result[t.Any]] = []
+
+    for context in contexts:
+        try:
+            results.append(flow(context))
+        except Exception as error:
+            results.append(Result.error(error))
+
+    return results
+
+
+class ProcessPoolFlowRunner(t.Generic[CONTEXT, OUT]):
+    def __init__(
+        self,
+        flow_factory: t.Callable[[], BaseUnit[CONTEXT, OUT]],
+        *,
+        max_workers: t.Optional[int] = None,
+        chunk_size: int = 1,
+        max_in_flight: t.Optional[int] = None,
+        mp_context: t.Optional[ProcessContext] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(flow_factory,),
+        )
+        self._chunk_size = chunk_size
+        self._max_in_flight = max_in_flight or 2 * workers
+
+    def __enter__(self) -> "ProcessPoolFlowRunner[CONTEXT, OUT]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: t.Optional[t.Type[BaseException]],
+        exc_value: t.Optional[BaseException],
+        traceback: t.Optional[TracebackType],
+    ) -> None:
+        self.shutdown()
+
+    def map(
+        self, contexts: t.Iterable[CONTEXT], *, ordered: bool = True
+    ) -> t.Iterator[Result[OUT]]:
+        chunks = self._chunks(contexts)
+
+        if ordered:
+            return self._map_ordered(chunks)
+
+        return self._map_as_completed(chunks)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _map_ordered(
+        self, chunks: t.Iterator[t.List[CONTEXT]]
+    ) -> t.Iterator[Result[OUT]]:
+        pending: t.Deque[Future[t.List[Result[OUT]]]] = deque(
+            self._submit(chunk)
+            for chunk in islice(chunks, self._max_in_flight)
+        )
+
+        try:
+            while pending:
+                results = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(self._submit(chunk))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _map_as_completed(
+        self, chunks: t.Iterator[t.List[CONTEXT]]
+    ) -> t.Iterator[Result[OUT]]:
+        pending: t.Set[Future[t.List[Result[OUT]]]] = {
+            self._submit(chunk)
+            for chunk in islice(chunks, self._max_in_flight)
+        }
+
+        try:
+            while pending:
+                done, pending = wait_futures(
+                    pending, return_when=FIRST_COMPLETED
+                )
+                for chunk in islice(chunks, len(done)):
+                    pending.add(self._submit(chunk))
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _submit(self, chunk: t.List[CONTEXT]) -> Future[t.List[Result[OUT]]]:
+        return self._executor.submit(_run_chunk, chunk)
+
+    def _chunks(
+        self, contexts: t.Iterable[CONTEXT]
+    ) -> t.Iterator[t.List[CONTEXT]]:
+        iterator = iter(contexts)
+        while chunk := list(islice(iterator, self._chunk_size)):
+            yield chunk
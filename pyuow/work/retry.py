@@ -0,0 +1,70 @@
+import threading
+import typing as t
+from random import uniform
+
+from ..result import Result
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        *,
+        retry_on: t.Tuple[t.Type[Exception], ...],
+        max_attempts: int = 3,
+        base_delay: float = 0.01,
+        max_delay: float = 1.0,
+        jitter: t.Callable[[float, float], float] = uniform,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+
+        self._retry_on = retry_on
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._conflicts = 0
+        self._retries = 0
+        self._exhausted = 0
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def conflicts(self) -> int:
+        return self._conflicts
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def exhausted(self) -> int:
+        return self._exhausted
+
+    def retry_after(
+        self, outcome: t.Union[Result[t.Any], Exception], attempt: int
+    ) -> t.Optional[float]:
+        if isinstance(outcome, Result):
+            if not outcome.is_error():
+                return None
+            try:
+                outcome.raise_for_error()
+            except Exception as error:
+                outcome = error
+
+        if not isinstance(outcome, self._retry_on):
+            return None
+
+        with self._lock:
+            self._conflicts += 1
+            if attempt >= self._max_attempts:
+                self._exhausted += 1
+                return None
+            self._retries += 1
+
+        return self._jitter(
+            0.0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+        )
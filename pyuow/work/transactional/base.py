@@ -13,6 +13,9 @@ class BaseTransaction(t.Generic[TRANSACTION_PROVIDER], ABC):
     def it(self) -> TRANSACTION_PROVIDER:
         return self._transaction_provider
 
+    def flush(self) -> None:
+        pass
+
     @abc.abstractmethod
     def rollback(self) -> None:
         raise NotImplementedError
@@ -26,3 +29,6 @@ class BaseTransactionManager(t.Generic[TRANSACTION], ABC):
     @abc.abstractmethod
     def transaction(self) -> t.ContextManager[TRANSACTION]:
         raise NotImplementedError
+
+    def savepoint(self) -> t.ContextManager[TRANSACTION]:
+        return self.transaction()
@@ -4,8 +4,8 @@ from ....context import BaseContext
 from ....context.domain import BaseDomainContext
 from ....domain import Batch
 from ....result import Result
-from ....unit import BaseUnit
-from ....work import BaseUnitProxy
+from ....unit import BaseUnit, FlowObserver
+from ....work import BaseUnitProxy, RetryPolicy
 from ....work.transactional import (
     BaseTransactionManager,
     TransactionalWorkManager,
@@ -42,14 +42,20 @@ class DomainTransactionalWorkManager(TransactionalWorkManager):
         *,
         transaction_manager: BaseTransactionManager[TRANSACTION],
         batch_handler: t.Callable[[Batch], None],
+        observer: t.Optional[FlowObserver] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
     ) -> None:
-        super().__init__(transaction_manager=transaction_manager)
+        super().__init__(
+            transaction_manager=transaction_manager,
+            observer=observer,
+            retry_policy=retry_policy,
+        )
         self._batch_handler = batch_handler
 
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
         return super().by(
             unit=DomainUnit(
-                unit=unit,
+                unit=self._observed(unit),
                 batch_handler=self._batch_handler,
             )
         )
@@ -1,9 +1,11 @@
 import typing as t
+from itertools import islice
+from time import sleep
 
 from ...context import BaseContext
 from ...result import Result
-from ...unit import BaseUnit
-from ...work import BaseWorkManager
+from ...unit import BaseUnit, FlowObserver
+from ...work import BaseWorkManager, RetryPolicy
 from ...work.transactional import BaseTransaction, BaseTransactionManager
 from ..base import BaseUnitProxy
 
@@ -18,14 +20,22 @@ class TransactionalUnitProxy(BaseUnitProxy[CONTEXT, OUT]):
         *,
         transaction_manager: BaseTransactionManager[TRANSACTION],
         unit: BaseUnit[CONTEXT, OUT],
+        retry_policy: t.Optional[RetryPolicy] = None,
     ) -> None:
         self._transaction_manager = transaction_manager
         self._unit = unit
+        self._retry_policy = retry_policy
 
     def __call__(self, context: CONTEXT) -> Result[OUT]:
-        with self._transaction_manager.transaction() as trx:
+        with self._transaction_manager.savepoint() as trx:
             result = self._unit(context)
 
+            if not result.is_error():
+                try:
+                    trx.flush()
+                except Exception as error:
+                    result = Result.error(error)
+
             if result.is_error():
                 trx.rollback()
             else:
@@ -33,17 +43,71 @@ class TransactionalUnitProxy(BaseUnitProxy[CONTEXT, OUT]):
 
             return result
 
+    def do_with_retry(
+        self, context_factory: t.Callable[[], CONTEXT]
+    ) -> Result[OUT]:
+        if self._retry_policy is None:
+            return self.do_with(context_factory())
+
+        attempt = 1
+
+        while True:
+            try:
+                result = self.do_with(context_factory())
+            except Exception as error:
+                delay = self._retry_policy.retry_after(error, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_policy.retry_after(result, attempt)
+                if delay is None:
+                    return result
+
+            sleep(delay)
+            attempt += 1
+
+    def do_with_many(
+        self,
+        contexts: t.Iterable[CONTEXT],
+        *,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.List[Result[OUT]]:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        results: t.List[Result[OUT]] = []
+        iterator = iter(contexts)
+
+        while chunk := list(islice(iterator, chunk_size)):
+            try:
+                results.extend(self._run_chunk(chunk))
+            except Exception as error:
+                results.extend(Result.error(error) for _ in chunk)
+
+        return results
+
+    def _run_chunk(self, chunk: t.List[CONTEXT]) -> t.List[Result[OUT]]:
+        with self._transaction_manager.transaction() as trx:
+            results = [self(context) for context in chunk]
+            trx.commit()
+            return results
+
 
 class TransactionalWorkManager(BaseWorkManager):
     def __init__(
         self,
         *,
         transaction_manager: BaseTransactionManager[TRANSACTION],
+        observer: t.Optional[FlowObserver] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
     ) -> None:
+        super().__init__(observer=observer)
         self._transaction_manager = transaction_manager
+        self._retry_policy = retry_policy
 
     def by(self, unit: BaseUnit[CONTEXT, OUT]) -> BaseUnitProxy[CONTEXT, OUT]:
         return TransactionalUnitProxy(
             transaction_manager=self._transaction_manager,
-            unit=unit,
+            unit=self._observed(unit),
+            retry_policy=self._retry_policy,
         )
@@ -0,0 +1,158 @@
+import json
+import pickle
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pyuow.contrib.sqlalchemy.aio.idempotency import SqlAlchemyIdempotencyStore
+from pyuow.contrib.sqlalchemy.aio.work import SqlAlchemyTransactionManager
+from pyuow.result import Result
+from pyuow.work import IdempotencyKeyInUseError
+
+from ...fake_tables import FakeIdempotencyKeyTable
+
+
+@pytest.mark.skip_on_ci
+class TestSqlAlchemyIdempotencyStore:
+    async def test_get_should_return_stored_result(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(async_engine)
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        await store.complete(key, Result.ok("test"))
+        # when
+        result = await store.get(key)
+        # then
+        assert result is not None
+        assert result.get() == "test"
+
+    async def test_complete_should_store_result_as_json(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(async_engine)
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        # when
+        await store.complete(key, Result.ok({"id": 1}))
+        # then
+        async with async_engine.connect() as connection:
+            data = (
+                await connection.execute(
+                    select(FakeIdempotencyKeyTable.result).where(
+                        FakeIdempotencyKeyTable.key == key
+                    )
+                )
+            ).scalar_one()
+        assert data is not None
+        assert json.loads(data) == {"out": {"id": 1}}
+
+    async def test_get_should_return_pickled_result_when_opted_in(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable,
+            SqlAlchemyTransactionManager(async_engine),
+            dumps=pickle.dumps,
+            loads=pickle.loads,
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        await store.complete(key, Result.ok({1, 2}))
+        # when
+        result = await store.get(key)
+        # then
+        assert result is not None
+        assert result.get() == {1, 2}
+
+    async def test_complete_should_not_persist_when_transaction_is_rolled_back(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(async_engine)
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, transaction_manager
+        )
+        key = str(uuid4())
+        # when
+        async with transaction_manager.transaction() as trx:
+            await store.claim(key)
+            await store.complete(key, Result.ok("test"))
+            await trx.rollback()
+        # then
+        assert await store.get(key) is None
+
+    async def test_purge_should_remove_expired_results(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable,
+            SqlAlchemyTransactionManager(async_engine),
+            ttl=timedelta(seconds=-1),
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        await store.complete(key, Result.ok("test"))
+        # when
+        purged = await store.purge()
+        # then
+        assert purged >= 1
+        assert await store.get(key) is None
+
+    async def test_claim_should_reject_pending_key(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(async_engine)
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        # when
+        claimed = await store.claim(key)
+        # then
+        assert claimed is not None
+        with pytest.raises(IdempotencyKeyInUseError):
+            claimed.raise_for_error()
+
+    async def test_claim_should_return_stored_result(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(async_engine)
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        await store.complete(key, Result.ok("test"))
+        await store.settle(key, committed=True)
+        # when
+        claimed = await store.claim(key)
+        # then
+        assert claimed is not None
+        assert claimed.get() == "test"
+
+    async def test_settle_should_release_uncommitted_claim(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(async_engine)
+        )
+        key = str(uuid4())
+        await store.claim(key)
+        # when
+        await store.settle(key, committed=False)
+        # then
+        assert await store.claim(key) is None
@@ -18,6 +18,7 @@ from pyuow.contrib.sqlalchemy.aio.repository import (
 from pyuow.contrib.sqlalchemy.aio.work import (
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransactionManager,
+    VersionConflictError,
 )
 from pyuow.entity import Entity, Version
 from pyuow.repository.aio import BaseEntityRepository, BaseViewRepository
@@ -33,6 +34,7 @@ from ...fake_tables import (
     FakeAuditedEntityTable,
     FakeEntityTable,
     FakeEntityViewTable,
+    FakeRenamedColumnEntityTable,
     FakeVersionedEntityTable,
 )
 
@@ -55,6 +57,26 @@ class FakeEntityRepository(
         )
 
 
+class FakeRenamedColumnEntityRepository(
+    BaseSqlAlchemyEntityRepository[
+        FakeEntityId, FakeEntity, FakeRenamedColumnEntityTable
+    ]
+):
+    @staticmethod
+    def to_entity(record: FakeRenamedColumnEntityTable) -> FakeEntity:
+        return FakeEntity(
+            id=FakeEntityId(record.id),
+            field=record.field,
+        )
+
+    @staticmethod
+    def to_record(entity: FakeEntity) -> FakeRenamedColumnEntityTable:
+        return FakeRenamedColumnEntityTable(
+            id=entity.id,
+            field=entity.field,
+        )
+
+
 class FakeAuditedEntityRepository(
     BaseSqlAlchemyEntityRepository[
         FakeEntityId, FakeAuditedEntity, FakeAuditedEntityTable
@@ -122,6 +144,13 @@ class FakeEntityViewRepository(
     ) -> t.Iterable[FakeEntityView]:
         return await self.find_all_by(self._table.field == field)
 
+    def stream_all_by_field(
+        self, field: str, *, batch_size: int
+    ) -> t.AsyncContextManager[t.AsyncIterator[FakeEntityView]]:
+        return self.stream_all_by(
+            self._table.field == field, batch_size=batch_size
+        )
+
     async def get_by_field(self, field: str) -> FakeEntityView:
         return await self.get_by(self._table.field == field)
 
@@ -442,6 +471,339 @@ class TestSqlAlchemyEntityRepository:
         # then
         assert result is True
 
+    async def test_iter_all_should_yield_each_entity_once_across_chunks(
+        self, entity_repository: FakeEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(7)
+        ]
+        await entity_repository.add_all(entities)
+        ids = [entity.id for entity in entities]
+        # when
+        async with entity_repository.iter_all(
+            [*ids, *ids], chunk_size=3
+        ) as found:
+            result = [entity async for entity in found]
+        # then
+        assert sorted(entity.id for entity in result) == sorted(ids)
+
+    async def test_iter_all_should_close_session_on_early_break(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        readonly_transaction_manager = SqlAlchemyReadOnlyTransactionManager(
+            async_engine
+        )
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            SqlAlchemyTransactionManager(async_engine),
+            readonly_transaction_manager,
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(4)
+        ]
+        await repository.add_all(entities)
+        result = []
+        # when
+        async with repository.iter_all(
+            [entity.id for entity in entities], chunk_size=1
+        ) as found:
+            async for entity in found:
+                result.append(await repository.get(entity.id))
+                break
+        # then
+        assert len(result) == 1
+        assert readonly_transaction_manager.live_sessions == 0
+
+    async def test_try_delete_all_should_soft_delete_and_report_affected_ids(
+        self, audited_entity_repository: FakeAuditedEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(3)
+        ]
+        missing = FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+        await audited_entity_repository.add_all(entities)
+        # when
+        result = await audited_entity_repository.try_delete_all(
+            [*entities, missing], chunk_size=2
+        )
+        # then
+        assert result == [entity.id for entity in entities]
+        assert not await audited_entity_repository.exists(entities[0].id)
+        assert await audited_entity_repository.try_delete_all(entities) == []
+
+    async def test_try_delete_all_should_hard_delete_and_report_affected_ids(
+        self, entity_repository: FakeEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(3)
+        ]
+        await entity_repository.add_all(entities)
+        # when
+        result = await entity_repository.try_delete_all(entities, chunk_size=2)
+        # then
+        assert result == [entity.id for entity in entities]
+        assert await entity_repository.delete_all(entities) is False
+
+    async def test_add_all_should_insert_in_chunks_and_keep_input_order(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            SqlAlchemyTransactionManager(async_engine),
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+            chunk_size=3,
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(10)
+        ]
+        # when
+        result = await repository.add_all(entities)
+        # then
+        assert list(result) == entities
+        assert await repository.exists(entities[-1].id)
+
+    async def test_try_update_all_should_report_conflicting_entities(
+        self, versioned_entity_repository: FakeVersionedEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(3)
+        ]
+        await versioned_entity_repository.add_all(entities)
+        stale = replace(entities[1], version=Version(123))
+        # when
+        result = await versioned_entity_repository.try_update_all(
+            [
+                entities[0].change_field("changed"),
+                stale,
+                entities[2].change_field("changed"),
+            ],
+            chunk_size=2,
+        )
+        # then
+        assert result.conflicts == [stale.id]
+        assert [entity.id for entity in result.updated] == [
+            entities[0].id,
+            entities[2].id,
+        ]
+        assert all(entity.field == "changed" for entity in result.updated)
+        assert all(entity.version == Version(1) for entity in result.updated)
+
+    async def test_try_update_all_should_reject_duplicate_ids(
+        self, versioned_entity_repository: FakeVersionedEntityRepository
+    ) -> None:
+        # given
+        entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+        await versioned_entity_repository.add(entity)
+        # when / then
+        with pytest.raises(ValueError):
+            await versioned_entity_repository.try_update_all(
+                [entity.change_field("first"), entity.change_field("second")]
+            )
+
+    async def test_try_update_all_should_chunk_by_bound_parameters(
+        self,
+        versioned_entity_repository: FakeVersionedEntityRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # given
+        entities = [
+            FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(5)
+        ]
+        await versioned_entity_repository.add_all(entities)
+        chunks: t.List[int] = []
+        update_from_values = versioned_entity_repository._update_from_values
+
+        def spy(chunk: t.Sequence[t.Any]) -> t.Any:
+            chunks.append(len(chunk))
+            return update_from_values(chunk)
+
+        monkeypatch.setattr(
+            "pyuow.contrib.sqlalchemy.aio.repository.base.MAX_PARAMETERS", 8
+        )
+        monkeypatch.setattr(
+            versioned_entity_repository, "_update_from_values", spy
+        )
+        # when
+        result = await versioned_entity_repository.try_update_all(
+            [entity.change_field("changed") for entity in entities],
+            chunk_size=100,
+        )
+        # then
+        assert not result.conflicts
+        assert chunks == [2, 2, 1]
+
+    async def test_update_all_should_raise_if_any_entity_conflicts(
+        self, versioned_entity_repository: FakeVersionedEntityRepository
+    ) -> None:
+        # given
+        entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+        await versioned_entity_repository.add(entity)
+        # when / then
+        with pytest.raises(VersionConflictError):
+            await versioned_entity_repository.update_all(
+                [replace(entity, version=Version(123))]
+            )
+
+    async def test_find_should_see_uncommitted_entity_inside_transaction(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(async_engine)
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+        )
+        entity = FakeEntity(id=FakeEntityId(uuid4()), field="test")
+        # when
+        async with transaction_manager.transaction() as trx:
+            await repository.add(entity)
+            result = await repository.find(entity.id)
+            await trx.rollback()
+        # then
+        assert result == entity
+        assert await repository.find(entity.id) is None
+
+    async def test_add_should_defer_insert_until_read_when_writes_are_deferred(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            async_engine, deferred_writes=True
+        )
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(3)
+        ]
+        # when
+        async with transaction_manager.transaction() as trx:
+            for entity in entities:
+                await repository.add(entity)
+            pending = len(trx.buffer or [])
+            result = await repository.find_all(
+                [entity.id for entity in entities]
+            )
+        # then
+        assert pending == 3
+        assert sorted(result, key=lambda entity: entity.field) == entities
+
+    async def test_update_should_raise_on_commit_when_deferred_update_conflicts(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            async_engine, deferred_writes=True
+        )
+        repository = FakeVersionedEntityRepository(
+            FakeVersionedEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+        )
+        entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+        await repository.add(entity)
+        stale = replace(entity, version=Version(5))
+        # when / then
+        with pytest.raises(VersionConflictError):
+            async with transaction_manager.transaction():
+                await repository.update(stale)
+
+    async def test_try_update_all_should_update_renamed_columns(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        repository = FakeRenamedColumnEntityRepository(
+            FakeRenamedColumnEntityTable,
+            SqlAlchemyTransactionManager(async_engine),
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(2)
+        ]
+        await repository.add_all(entities)
+        # when
+        result = await repository.try_update_all(
+            [replace(entity, field="changed") for entity in entities]
+        )
+        # then
+        assert not result.conflicts
+        assert [entity.field for entity in result.updated] == [
+            "changed",
+            "changed",
+        ]
+        assert (await repository.get(entities[0].id)).field == "changed"
+
+    async def test_try_delete_all_should_report_affected_ids_with_deferred_writes(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            async_engine, deferred_writes=True
+        )
+        repository = FakeAuditedEntityRepository(
+            FakeAuditedEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+        )
+        entities = [
+            FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(2)
+        ]
+        missing = FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+        await repository.add_all(entities)
+        await repository.delete(entities[0])
+        # when
+        async with transaction_manager.transaction():
+            result = await repository.try_delete_all([*entities, missing])
+        # then
+        assert result == [entities[1].id]
+        assert not await repository.exists(entities[1].id)
+
+    async def test_try_update_all_should_report_conflicts_with_deferred_writes(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            async_engine, deferred_writes=True
+        )
+        repository = FakeVersionedEntityRepository(
+            FakeVersionedEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(async_engine),
+        )
+        entities = [
+            FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(2)
+        ]
+        await repository.add_all(entities)
+        stale = replace(entities[1], version=Version(5))
+        # when
+        async with transaction_manager.transaction():
+            result = await repository.try_update_all(
+                [entities[0].change_field("changed"), stale]
+            )
+        # then
+        assert result.conflicts == [stale.id]
+        assert [entity.id for entity in result.updated] == [entities[0].id]
+
 
 @pytest.mark.skip_on_ci
 class TestSqlAlchemyViewRepository:
@@ -497,6 +859,58 @@ class TestSqlAlchemyViewRepository:
         # then
         assert {view.id for view in result} == {entity1.id, entity2.id}
 
+    async def test_stream_all_by_should_yield_all_views_in_batches(
+        self,
+        entity_repository: FakeEntityRepository,
+        entity_view_repository: FakeEntityViewRepository,
+    ) -> None:
+        # given
+        field = str(uuid4())
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=field) for _ in range(5)
+        ]
+        await entity_repository.add_all(entities)
+        # when
+        async with entity_view_repository.stream_all_by_field(
+            field, batch_size=2
+        ) as views:
+            result = [view async for view in views]
+        # then
+        assert {view.id for view in result} == {
+            entity.id for entity in entities
+        }
+
+    async def test_stream_all_by_should_close_session_on_early_break(
+        self,
+        async_engine: AsyncEngine,
+        entity_repository: FakeEntityRepository,
+    ) -> None:
+        # given
+        readonly_transaction_manager = SqlAlchemyReadOnlyTransactionManager(
+            async_engine
+        )
+        repository = FakeEntityViewRepository(
+            FakeEntityViewTable, readonly_transaction_manager
+        )
+        field = str(uuid4())
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=field) for _ in range(5)
+        ]
+        await entity_repository.add_all(entities)
+        result = []
+        # when
+        async with repository.stream_all_by_field(
+            field, batch_size=2
+        ) as views:
+            async for view in views:
+                assert await repository.exists_by_field(field)
+                result.append(view)
+                if len(result) == 3:
+                    break
+        # then
+        assert len(result) == 3
+        assert readonly_transaction_manager.live_sessions == 0
+
     async def test_find_all_by_should_return_empty_sequence_when_no_view_matches(
         self, entity_view_repository: FakeEntityViewRepository
     ) -> None:
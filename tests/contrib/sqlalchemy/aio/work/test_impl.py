@@ -1,13 +1,20 @@
+import asyncio
+import typing as t
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from pyuow.contrib.sqlalchemy.aio.work import (
+    RollbackOnlyError,
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
 )
+from pyuow.result import Result
+from pyuow.unit.aio import FinalUnit, ParallelUnit, RunUnit
+from pyuow.work.aio.transactional import TransactionalWorkManager
 
 
 @pytest.mark.skip_on_ci
@@ -98,10 +105,44 @@ class TestSqlAlchemyTransaction:
         # when / then
         await trx.commit()
 
+    async def test_async_commit_should_do_nothing_when_transaction_is_joined(
+        self,
+    ) -> None:
+        # given
+        root_trx = AsyncMock()
+        trx_provider = Mock(
+            in_nested_transaction=Mock(return_value=False),
+            in_transaction=Mock(return_value=True),
+            get_transaction=Mock(return_value=root_trx),
+        )
+        trx = SqlAlchemyTransaction(trx_provider, joined=True)
+        # when
+        await trx.commit()
+        # then
+        root_trx.commit.assert_not_called()
+
+    async def test_async_rollback_should_mark_owner_when_transaction_is_joined(
+        self,
+    ) -> None:
+        # given
+        root_trx = Mock()
+        trx_provider = Mock(
+            info={},
+            in_nested_transaction=Mock(return_value=False),
+            in_transaction=Mock(return_value=True),
+            get_transaction=Mock(return_value=root_trx),
+        )
+        trx = SqlAlchemyTransaction(trx_provider, joined=True)
+        # when
+        await trx.rollback()
+        # then
+        root_trx.rollback.assert_not_called()
+        assert await SqlAlchemyTransaction(trx_provider).is_rollback_only()
+
 
 @pytest.mark.skip_on_ci
 class TestSqlAlchemyTransactionManager:
-    async def test_async_transaction_should_open_nested_transaction_if_called_in_already_opened_transaction(
+    async def test_async_savepoint_should_open_nested_transaction_if_called_in_already_opened_transaction(
         self, async_engine: AsyncEngine
     ) -> None:
         # given
@@ -110,7 +151,7 @@ class TestSqlAlchemyTransactionManager:
         async with manager.transaction() as trx:
             first_session = trx.it()
 
-            async with manager.transaction() as trx2:
+            async with manager.savepoint() as trx2:
                 second_session = trx2.it()
 
                 # then
@@ -122,6 +163,33 @@ class TestSqlAlchemyTransactionManager:
 
         assert not first_session.in_transaction()
 
+    async def test_async_transaction_should_join_already_opened_transaction(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        # when
+        async with manager.transaction() as trx:
+            async with manager.transaction() as trx2:
+                # then
+                assert trx2.it() is trx.it()
+                assert not trx2.it().in_nested_transaction()
+
+            assert trx.it().in_transaction()
+
+    async def test_async_transaction_should_open_nested_transaction_if_join_ambient_is_disabled(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(
+            async_engine, join_ambient=False
+        )
+        # when
+        async with manager.transaction():
+            async with manager.transaction() as trx2:
+                # then
+                assert trx2.it().in_nested_transaction()
+
     async def test_async_transaction_should_not_open_nested_transaction_if_called_in_new_transaction(
         self, async_engine: AsyncEngine
     ) -> None:
@@ -137,6 +205,145 @@ class TestSqlAlchemyTransactionManager:
 
         assert not session.in_transaction()
 
+    async def test_async_commit_should_fail_after_joined_transaction_rolled_back(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        # when
+        async with manager.transaction() as trx:
+            async with manager.transaction() as joined:
+                await joined.rollback()
+
+            assert trx.it().in_transaction()
+
+            # then
+            with pytest.raises(RollbackOnlyError):
+                await trx.commit()
+
+            assert not trx.it().in_transaction()
+
+    async def test_async_transaction_should_fail_on_exit_after_joined_transaction_rolled_back(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        # when / then
+        with pytest.raises(RollbackOnlyError):
+            async with manager.transaction():
+                async with manager.transaction() as joined:
+                    await joined.rollback()
+
+    async def test_async_commit_should_succeed_after_joined_transaction_committed(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        # when
+        async with manager.transaction() as trx:
+            async with manager.transaction() as joined:
+                await joined.commit()
+
+            await trx.commit()
+
+            # then
+            assert not trx.it().in_transaction()
+
+    async def test_async_current_should_return_active_transaction(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        # when
+        async with manager.transaction() as trx:
+            current = manager.current()
+
+            # then
+            assert current is not None
+            assert current.it() is trx.it()
+
+        assert manager.current() is None
+
+    async def test_async_transaction_should_close_session_when_outermost_transaction_ends(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        # when
+        async with manager.transaction():
+            async with manager.savepoint():
+                # then
+                assert manager.live_sessions == 1
+
+        assert manager.live_sessions == 0
+        assert manager.current() is None
+
+    async def test_async_transaction_should_share_session_with_child_tasks(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+
+        async def child() -> t.Any:
+            async with manager.transaction() as trx:
+                return trx.it()
+
+        # when
+        async with manager.transaction() as trx:
+            child_session = await asyncio.create_task(child())
+            # then
+            assert child_session is trx.it()
+
+    async def test_async_transaction_should_serialize_child_tasks_sharing_session(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+        active: t.List[Mock] = []
+        overlaps: t.List[int] = []
+
+        class QueryUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                async with manager.transaction() as trx:
+                    active.append(context)
+                    overlaps.append(len(active))
+                    await trx.it().execute(text("SELECT 1"))
+                    await asyncio.sleep(0.01)
+                    active.remove(context)
+
+        class CountUnit(FinalUnit[Mock, int]):
+            async def finish(self, context: Mock) -> Result[int]:
+                return Result.ok(len(overlaps))
+
+        flow = (
+            ParallelUnit[Mock, int](QueryUnit(), QueryUnit(), QueryUnit())
+            >> CountUnit()
+        ).build()
+        work = TransactionalWorkManager(transaction_manager=manager)
+        # when
+        result = await work.by(flow).do_with(Mock())
+        # then
+        assert result.get() == 3
+        assert max(overlaps) == 1
+        assert manager.live_sessions == 0
+
+    async def test_async_transaction_should_use_separate_sessions_in_separate_tasks(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(async_engine)
+
+        async def run() -> t.Any:
+            async with manager.transaction() as trx:
+                await asyncio.sleep(0)
+                return trx.it()
+
+        # when
+        first, second = await asyncio.gather(run(), run())
+        # then
+        assert first is not second
+        assert manager.live_sessions == 0
+
     async def test_async_readonly_transaction_should_yield_session(
         self, async_engine: AsyncEngine
     ) -> None:
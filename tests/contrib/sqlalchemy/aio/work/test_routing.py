@@ -0,0 +1,89 @@
+import asyncio
+import typing as t
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from pyuow.contrib.sqlalchemy.aio.work import (
+    SqlAlchemyRoutingReadOnlyTransactionManager,
+)
+
+
+@pytest.mark.skip_on_ci
+class TestSqlAlchemyRoutingReadOnlyTransactionManager:
+    async def test_transaction_should_read_from_healthy_replica(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            async_engine, [async_engine]
+        )
+        await manager.refresh()
+        # when
+        async with manager.transaction() as trx:
+            in_flight = manager.replicas.replicas[0].in_flight
+            await trx.it().execute(text("SELECT 1"))
+        # then
+        assert in_flight == 1
+        assert manager.replicas.replicas[0].in_flight == 0
+
+    async def test_transaction_should_read_from_primary_before_first_probe(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            async_engine, [async_engine]
+        )
+        # when
+        async with manager.transaction():
+            in_flight = manager.replicas.replicas[0].in_flight
+        await manager.refresh()
+        # then
+        assert in_flight == 0
+        assert manager.replicas.healthy == 1
+
+    async def test_transaction_should_fall_back_to_primary_when_probe_fails(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        async def failing(connection: AsyncConnection) -> t.Optional[float]:
+            raise ConnectionError
+
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            async_engine, [async_engine], probe=failing
+        )
+        # when
+        await manager.refresh()
+        async with manager.transaction():
+            in_flight = manager.replicas.replicas[0].in_flight
+        # then
+        assert in_flight == 0
+        assert manager.replicas.healthy == 0
+
+    async def test_transaction_should_not_wait_for_due_probes(
+        self, async_engine: AsyncEngine
+    ) -> None:
+        # given
+        probed = asyncio.Event()
+        release = asyncio.Event()
+
+        async def blocking(connection: AsyncConnection) -> t.Optional[float]:
+            if not probed.is_set():
+                probed.set()
+                return 0.0
+            await release.wait()
+            return 10.0
+
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            async_engine, [async_engine], probe=blocking
+        )
+        await manager.refresh()
+        # when
+        async with manager.transaction():
+            in_flight = manager.replicas.replicas[0].in_flight
+        release.set()
+        await manager.refresh()
+        # then
+        assert in_flight == 1
+        assert manager.replicas.healthy == 0
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 from pyuow.contrib.sqlalchemy.tables import (
     AuditedEntityTable,
     EntityTable,
+    IdempotencyKeyTable,
     SoftDeletableEntityTable,
     VersionedEntityTable,
     ViewTable,
@@ -31,6 +32,16 @@ class FakeVersionedEntityTable(VersionedEntityTable):
     field: Mapped[str]
 
 
+class FakeRenamedColumnEntityTable(EntityTable):
+    __tablename__ = "fake_renamed_column_entities"
+
+    field: Mapped[str] = mapped_column("field_value")
+
+
+class FakeIdempotencyKeyTable(IdempotencyKeyTable):
+    __tablename__ = "fake_idempotency_keys"
+
+
 class FakeEntityViewTable(ViewTable):
     __tablename__ = "fake_entities_view"
 
@@ -0,0 +1,148 @@
+import json
+import pickle
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from pyuow.contrib.sqlalchemy.idempotency import SqlAlchemyIdempotencyStore
+from pyuow.contrib.sqlalchemy.work import SqlAlchemyTransactionManager
+from pyuow.result import Result
+from pyuow.work import IdempotencyKeyInUseError
+
+from ..fake_tables import FakeIdempotencyKeyTable
+
+
+@pytest.mark.skip_on_ci
+class TestSqlAlchemyIdempotencyStore:
+    def test_get_should_return_stored_result(self, engine: Engine) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(engine)
+        )
+        key = str(uuid4())
+        store.claim(key)
+        store.complete(key, Result.ok("test"))
+        # when
+        result = store.get(key)
+        # then
+        assert result is not None
+        assert result.get() == "test"
+
+    def test_complete_should_store_result_as_json(
+        self, engine: Engine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(engine)
+        )
+        key = str(uuid4())
+        store.claim(key)
+        # when
+        store.complete(key, Result.ok({"id": 1}))
+        # then
+        with engine.connect() as connection:
+            data = connection.execute(
+                select(FakeIdempotencyKeyTable.result).where(
+                    FakeIdempotencyKeyTable.key == key
+                )
+            ).scalar_one()
+        assert data is not None
+        assert json.loads(data) == {"out": {"id": 1}}
+
+    def test_get_should_return_pickled_result_when_opted_in(
+        self, engine: Engine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable,
+            SqlAlchemyTransactionManager(engine),
+            dumps=pickle.dumps,
+            loads=pickle.loads,
+        )
+        key = str(uuid4())
+        store.claim(key)
+        store.complete(key, Result.ok({1, 2}))
+        # when
+        result = store.get(key)
+        # then
+        assert result is not None
+        assert result.get() == {1, 2}
+
+    def test_complete_should_not_persist_when_transaction_is_rolled_back(
+        self, engine: Engine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(engine)
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, transaction_manager
+        )
+        key = str(uuid4())
+        # when
+        with transaction_manager.transaction() as trx:
+            store.claim(key)
+            store.complete(key, Result.ok("test"))
+            trx.rollback()
+        # then
+        assert store.get(key) is None
+
+    def test_purge_should_remove_expired_results(self, engine: Engine) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable,
+            SqlAlchemyTransactionManager(engine),
+            ttl=timedelta(seconds=-1),
+        )
+        key = str(uuid4())
+        store.claim(key)
+        store.complete(key, Result.ok("test"))
+        # when
+        purged = store.purge()
+        # then
+        assert purged >= 1
+        assert store.get(key) is None
+
+    def test_claim_should_reject_pending_key(self, engine: Engine) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(engine)
+        )
+        key = str(uuid4())
+        store.claim(key)
+        # when
+        claimed = store.claim(key)
+        # then
+        assert claimed is not None
+        with pytest.raises(IdempotencyKeyInUseError):
+            claimed.raise_for_error()
+
+    def test_claim_should_return_stored_result(self, engine: Engine) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(engine)
+        )
+        key = str(uuid4())
+        store.claim(key)
+        store.complete(key, Result.ok("test"))
+        store.settle(key, committed=True)
+        # when
+        claimed = store.claim(key)
+        # then
+        assert claimed is not None
+        assert claimed.get() == "test"
+
+    def test_settle_should_release_uncommitted_claim(
+        self, engine: Engine
+    ) -> None:
+        # given
+        store = SqlAlchemyIdempotencyStore(
+            FakeIdempotencyKeyTable, SqlAlchemyTransactionManager(engine)
+        )
+        key = str(uuid4())
+        store.claim(key)
+        # when
+        store.settle(key, committed=False)
+        # then
+        assert store.claim(key) is None
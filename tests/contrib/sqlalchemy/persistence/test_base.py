@@ -18,6 +18,7 @@ from pyuow.contrib.sqlalchemy.repository import (
 from pyuow.contrib.sqlalchemy.work import (
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransactionManager,
+    VersionConflictError,
 )
 from pyuow.entity import Entity, Version
 from pyuow.repository import BaseEntityRepository, BaseViewRepository
@@ -33,6 +34,7 @@ from ..fake_tables import (
     FakeAuditedEntityTable,
     FakeEntityTable,
     FakeEntityViewTable,
+    FakeRenamedColumnEntityTable,
     FakeVersionedEntityTable,
 )
 
@@ -55,6 +57,26 @@ class FakeEntityRepository(
         )
 
 
+class FakeRenamedColumnEntityRepository(
+    BaseSqlAlchemyEntityRepository[
+        FakeEntityId, FakeEntity, FakeRenamedColumnEntityTable
+    ]
+):
+    @staticmethod
+    def to_entity(record: FakeRenamedColumnEntityTable) -> FakeEntity:
+        return FakeEntity(
+            id=FakeEntityId(record.id),
+            field=record.field,
+        )
+
+    @staticmethod
+    def to_record(entity: FakeEntity) -> FakeRenamedColumnEntityTable:
+        return FakeRenamedColumnEntityTable(
+            id=entity.id,
+            field=entity.field,
+        )
+
+
 class FakeAuditedEntityRepository(
     BaseSqlAlchemyEntityRepository[
         FakeEntityId, FakeAuditedEntity, FakeAuditedEntityTable
@@ -120,6 +142,13 @@ class FakeEntityViewRepository(
     def find_all_by_field(self, field: str) -> t.Iterable[FakeEntityView]:
         return self.find_all_by(self._table.field == field)
 
+    def stream_all_by_field(
+        self, field: str, *, batch_size: int
+    ) -> t.ContextManager[t.Iterator[FakeEntityView]]:
+        return self.stream_all_by(
+            self._table.field == field, batch_size=batch_size
+        )
+
     def get_by_field(self, field: str) -> FakeEntityView:
         return self.get_by(self._table.field == field)
 
@@ -377,7 +406,7 @@ class TestSqlAlchemyEntityRepository:
         entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
         versioned_entity_repository.add(entity)
         # when / then
-        with pytest.raises(NoResultFound):
+        with pytest.raises(VersionConflictError):
             versioned_entity_repository.update(
                 replace(entity, version=Version(123))
             )
@@ -434,6 +463,327 @@ class TestSqlAlchemyEntityRepository:
         # then
         assert result is True
 
+    def test_iter_all_should_yield_each_entity_once_across_chunks(
+        self, entity_repository: FakeEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(7)
+        ]
+        entity_repository.add_all(entities)
+        ids = [entity.id for entity in entities]
+        # when
+        with entity_repository.iter_all([*ids, *ids], chunk_size=3) as found:
+            result = list(found)
+        # then
+        assert sorted(entity.id for entity in result) == sorted(ids)
+
+    def test_iter_all_should_allow_nested_reads_and_early_break(
+        self, entity_repository: FakeEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(4)
+        ]
+        entity_repository.add_all(entities)
+        ids = [entity.id for entity in entities]
+        result = []
+        # when
+        with entity_repository.iter_all(ids, chunk_size=1) as found:
+            for entity in found:
+                result.append(entity_repository.get(entity.id))
+                if len(result) == 2:
+                    break
+        # then
+        assert len(result) == 2
+        assert entity_repository.exists(ids[0])
+
+    def test_try_delete_all_should_soft_delete_and_report_affected_ids(
+        self, audited_entity_repository: FakeAuditedEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(3)
+        ]
+        missing = FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+        audited_entity_repository.add_all(entities)
+        # when
+        result = audited_entity_repository.try_delete_all(
+            [*entities, missing], chunk_size=2
+        )
+        # then
+        assert result == [entity.id for entity in entities]
+        assert not audited_entity_repository.exists(entities[0].id)
+        assert audited_entity_repository.try_delete_all(entities) == []
+
+    def test_try_delete_all_should_hard_delete_and_report_affected_ids(
+        self, entity_repository: FakeEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(3)
+        ]
+        entity_repository.add_all(entities)
+        # when
+        result = entity_repository.try_delete_all(entities, chunk_size=2)
+        # then
+        assert result == [entity.id for entity in entities]
+        assert entity_repository.delete_all(entities) is False
+
+    def test_add_all_should_insert_in_chunks_and_keep_input_order(
+        self, engine: Engine
+    ) -> None:
+        # given
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            SqlAlchemyTransactionManager(engine),
+            SqlAlchemyReadOnlyTransactionManager(engine),
+            chunk_size=3,
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(10)
+        ]
+        # when
+        result = repository.add_all(entities)
+        # then
+        assert list(result) == entities
+        assert repository.exists(entities[-1].id)
+
+    def test_try_update_all_should_report_conflicting_entities(
+        self, versioned_entity_repository: FakeVersionedEntityRepository
+    ) -> None:
+        # given
+        entities = [
+            FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(3)
+        ]
+        versioned_entity_repository.add_all(entities)
+        stale = replace(entities[1], version=Version(123))
+        # when
+        result = versioned_entity_repository.try_update_all(
+            [
+                entities[0].change_field("changed"),
+                stale,
+                entities[2].change_field("changed"),
+            ],
+            chunk_size=2,
+        )
+        # then
+        assert result.conflicts == [stale.id]
+        assert [entity.id for entity in result.updated] == [
+            entities[0].id,
+            entities[2].id,
+        ]
+        assert all(entity.field == "changed" for entity in result.updated)
+        assert all(entity.version == Version(1) for entity in result.updated)
+
+    def test_try_update_all_should_reject_duplicate_ids(
+        self, versioned_entity_repository: FakeVersionedEntityRepository
+    ) -> None:
+        # given
+        entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+        versioned_entity_repository.add(entity)
+        # when / then
+        with pytest.raises(ValueError):
+            versioned_entity_repository.try_update_all(
+                [entity.change_field("first"), entity.change_field("second")]
+            )
+
+    def test_try_update_all_should_chunk_by_bound_parameters(
+        self,
+        versioned_entity_repository: FakeVersionedEntityRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # given
+        entities = [
+            FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(5)
+        ]
+        versioned_entity_repository.add_all(entities)
+        chunks: t.List[int] = []
+        update_from_values = versioned_entity_repository._update_from_values
+
+        def spy(chunk: t.Sequence[t.Any]) -> t.Any:
+            chunks.append(len(chunk))
+            return update_from_values(chunk)
+
+        monkeypatch.setattr(
+            "pyuow.contrib.sqlalchemy.repository.base.MAX_PARAMETERS", 8
+        )
+        monkeypatch.setattr(
+            versioned_entity_repository, "_update_from_values", spy
+        )
+        # when
+        result = versioned_entity_repository.try_update_all(
+            [entity.change_field("changed") for entity in entities],
+            chunk_size=100,
+        )
+        # then
+        assert not result.conflicts
+        assert chunks == [2, 2, 1]
+
+    def test_update_all_should_raise_if_any_entity_conflicts(
+        self, versioned_entity_repository: FakeVersionedEntityRepository
+    ) -> None:
+        # given
+        entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+        versioned_entity_repository.add(entity)
+        # when / then
+        with pytest.raises(VersionConflictError):
+            versioned_entity_repository.update_all(
+                [replace(entity, version=Version(123))]
+            )
+
+    def test_find_should_see_uncommitted_entity_inside_transaction(
+        self, engine: Engine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(engine)
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(engine),
+        )
+        entity = FakeEntity(id=FakeEntityId(uuid4()), field="test")
+        # when
+        with transaction_manager.transaction() as trx:
+            repository.add(entity)
+            result = repository.find(entity.id)
+            trx.rollback()
+        # then
+        assert result == entity
+        assert repository.find(entity.id) is None
+
+    def test_add_should_defer_insert_until_read_when_writes_are_deferred(
+        self, engine: Engine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            engine, deferred_writes=True
+        )
+        repository = FakeEntityRepository(
+            FakeEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(engine),
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=str(index))
+            for index in range(3)
+        ]
+        # when
+        with transaction_manager.transaction() as trx:
+            for entity in entities:
+                repository.add(entity)
+            pending = len(trx.buffer or [])
+            result = repository.find_all([entity.id for entity in entities])
+        # then
+        assert pending == 3
+        assert sorted(result, key=lambda entity: entity.field) == entities
+
+    def test_update_should_raise_on_commit_when_deferred_update_conflicts(
+        self, engine: Engine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            engine, deferred_writes=True
+        )
+        repository = FakeVersionedEntityRepository(
+            FakeVersionedEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(engine),
+        )
+        entity = FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+        repository.add(entity)
+        stale = replace(entity, version=Version(5))
+        # when / then
+        with pytest.raises(VersionConflictError):
+            with transaction_manager.transaction():
+                repository.update(stale)
+
+    def test_try_update_all_should_update_renamed_columns(
+        self, engine: Engine
+    ) -> None:
+        # given
+        repository = FakeRenamedColumnEntityRepository(
+            FakeRenamedColumnEntityTable,
+            SqlAlchemyTransactionManager(engine),
+            SqlAlchemyReadOnlyTransactionManager(engine),
+        )
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(2)
+        ]
+        repository.add_all(entities)
+        # when
+        result = repository.try_update_all(
+            [replace(entity, field="changed") for entity in entities]
+        )
+        # then
+        assert not result.conflicts
+        assert [entity.field for entity in result.updated] == [
+            "changed",
+            "changed",
+        ]
+        assert (repository.get(entities[0].id)).field == "changed"
+
+    def test_try_delete_all_should_report_affected_ids_with_deferred_writes(
+        self, engine: Engine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            engine, deferred_writes=True
+        )
+        repository = FakeAuditedEntityRepository(
+            FakeAuditedEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(engine),
+        )
+        entities = [
+            FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(2)
+        ]
+        missing = FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+        repository.add_all(entities)
+        repository.delete(entities[0])
+        # when
+        with transaction_manager.transaction():
+            result = repository.try_delete_all([*entities, missing])
+        # then
+        assert result == [entities[1].id]
+        assert not repository.exists(entities[1].id)
+
+    def test_try_update_all_should_report_conflicts_with_deferred_writes(
+        self, engine: Engine
+    ) -> None:
+        # given
+        transaction_manager = SqlAlchemyTransactionManager(
+            engine, deferred_writes=True
+        )
+        repository = FakeVersionedEntityRepository(
+            FakeVersionedEntityTable,
+            transaction_manager,
+            SqlAlchemyReadOnlyTransactionManager(engine),
+        )
+        entities = [
+            FakeVersionedEntity(id=FakeEntityId(uuid4()), field="test")
+            for _ in range(2)
+        ]
+        repository.add_all(entities)
+        stale = replace(entities[1], version=Version(5))
+        # when
+        with transaction_manager.transaction():
+            result = repository.try_update_all(
+                [entities[0].change_field("changed"), stale]
+            )
+        # then
+        assert result.conflicts == [stale.id]
+        assert [entity.id for entity in result.updated] == [entities[0].id]
+
 
 @pytest.mark.skip_on_ci
 class TestSqlAlchemyViewRepository:
@@ -489,6 +839,52 @@ class TestSqlAlchemyViewRepository:
         # then
         assert {view.id for view in result} == {entity1.id, entity2.id}
 
+    def test_stream_all_by_should_yield_all_views_in_batches(
+        self,
+        entity_repository: FakeEntityRepository,
+        entity_view_repository: FakeEntityViewRepository,
+    ) -> None:
+        # given
+        field = str(uuid4())
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=field) for _ in range(5)
+        ]
+        entity_repository.add_all(entities)
+        # when
+        with entity_view_repository.stream_all_by_field(
+            field, batch_size=2
+        ) as views:
+            result = list(views)
+        # then
+        assert {view.id for view in result} == {
+            entity.id for entity in entities
+        }
+
+    def test_stream_all_by_should_survive_nested_reads_and_early_break(
+        self,
+        entity_repository: FakeEntityRepository,
+        entity_view_repository: FakeEntityViewRepository,
+    ) -> None:
+        # given
+        field = str(uuid4())
+        entities = [
+            FakeEntity(id=FakeEntityId(uuid4()), field=field) for _ in range(5)
+        ]
+        entity_repository.add_all(entities)
+        result = []
+        # when
+        with entity_view_repository.stream_all_by_field(
+            field, batch_size=2
+        ) as views:
+            for view in views:
+                assert entity_view_repository.exists_by_field(field)
+                result.append(view)
+                if len(result) == 4:
+                    break
+        # then
+        assert len(result) == 4
+        assert entity_view_repository.exists_by_field(field)
+
     def test_find_all_by_should_return_empty_sequence_when_no_view_matches(
         self, entity_view_repository: FakeEntityViewRepository
     ) -> None:
@@ -20,6 +20,20 @@ CREATE TABLE IF NOT EXISTS fake_entities
     field        varchar(255) NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS fake_renamed_column_entities
+(
+    id           uuid NOT NULL PRIMARY KEY,
+    field_value  varchar(255) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS fake_idempotency_keys
+(
+    key          varchar(255) NOT NULL PRIMARY KEY,
+    result       bytea,
+    created_date timestamp without time zone NOT NULL,
+    expires_date timestamp without time zone
+);
+
 CREATE OR REPLACE VIEW fake_entities_view AS
 SELECT id,
        field,
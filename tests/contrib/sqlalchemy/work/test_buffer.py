@@ -0,0 +1,186 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm.exc import StaleDataError
+
+from pyuow.contrib.sqlalchemy.work import (
+    VERSION_CONFLICT_ERRORS,
+    VersionConflictError,
+    WriteBuffer,
+)
+from pyuow.contrib.sqlalchemy.work.buffer import BufferedStatement
+
+from ..fake_tables import (
+    FakeAuditedEntityTable,
+    FakeEntityTable,
+    FakeRenamedColumnEntityTable,
+    FakeVersionedEntityTable,
+)
+
+
+class TestWriteBuffer:
+    def test_drain_should_merge_consecutive_inserts_into_one_statement(
+        self,
+    ) -> None:
+        # given
+        buffer = WriteBuffer()
+        for _ in range(3):
+            buffer.insert(FakeEntityTable, {"id": uuid4(), "field": "test"})
+        # when
+        statements = list(buffer.drain())
+        # then
+        assert len(statements) == 1
+        assert "INSERT INTO" in str(statements[0].statement)
+        assert len(buffer) == 0
+
+    def test_drain_should_keep_order_of_interleaved_writes(self) -> None:
+        # given
+        buffer = WriteBuffer()
+        entity_id = uuid4()
+        buffer.insert(FakeEntityTable, {"id": entity_id, "field": "test"})
+        buffer.update(FakeEntityTable, {"field": "new"}, {"id": entity_id})
+        buffer.delete(FakeEntityTable, entity_id)
+        # when
+        statements = [str(pending.statement) for pending in buffer.drain()]
+        # then
+        assert [statement.split()[0] for statement in statements] == [
+            "INSERT",
+            "UPDATE",
+            "DELETE",
+        ]
+
+    def test_drain_should_batch_updates_as_executemany_with_guards(
+        self,
+    ) -> None:
+        # given
+        buffer = WriteBuffer()
+        for _ in range(2):
+            buffer.update(
+                FakeAuditedEntityTable,
+                {"field": "new"},
+                {"id": uuid4(), "deleted_date": None},
+            )
+        # when
+        (pending,) = buffer.drain()
+        # then
+        assert pending.parameters is not None
+        assert len(pending.parameters) == 2
+        assert pending.expected == 2
+        assert "deleted_date IS NULL" in str(pending.statement)
+
+    def test_drain_should_resolve_columns_through_mapper(self) -> None:
+        # given
+        buffer = WriteBuffer()
+        entity_id = uuid4()
+        buffer.insert(
+            FakeRenamedColumnEntityTable, {"id": entity_id, "field": "test"}
+        )
+        buffer.update(
+            FakeRenamedColumnEntityTable,
+            {"field": "new"},
+            {"id": entity_id, "field": "test"},
+        )
+        # when
+        statements = [str(pending.statement) for pending in buffer.drain()]
+        # then
+        assert all("field_value" in statement for statement in statements)
+        assert "field_value=:v_field" in statements[1]
+        assert ".field_value = :w_field" in statements[1]
+
+    def test_drain_should_delete_repeated_ids_once(self) -> None:
+        # given
+        buffer = WriteBuffer()
+        entity_id = uuid4()
+        buffer.delete(FakeEntityTable, entity_id)
+        buffer.delete(FakeEntityTable, entity_id)
+        # when
+        (pending,) = buffer.drain()
+        # then
+        assert pending.expected == 1
+
+    def test_pending_should_report_tables_with_queued_writes(self) -> None:
+        # given
+        buffer = WriteBuffer()
+        # when
+        buffer.insert(FakeEntityTable, {"id": uuid4(), "field": "test"})
+        # then
+        assert buffer.pending(FakeEntityTable)
+        assert not buffer.pending(FakeAuditedEntityTable)
+
+    def test_verify_should_raise_version_conflict_for_versioned_updates(
+        self,
+    ) -> None:
+        # given
+        buffer = WriteBuffer()
+        buffer.update(
+            FakeVersionedEntityTable,
+            {"field": "new", "version": 2},
+            {"id": uuid4(), "version": 1},
+        )
+        (pending,) = buffer.drain()
+        result = Mock(
+            rowcount=0, supports_sane_rowcount=Mock(return_value=True)
+        )
+        # when / then
+        with pytest.raises(VersionConflictError):
+            pending.verify(result)
+
+    def test_verify_should_raise_when_fewer_rows_matched(self) -> None:
+        # given
+        pending = BufferedStatement(Mock(), [{}, {}], 2)
+        result = Mock(
+            rowcount=1, supports_sane_multi_rowcount=Mock(return_value=True)
+        )
+        # when / then
+        with pytest.raises(NoResultFound):
+            pending.verify(result)
+
+    def test_executions_should_split_rows_without_sane_multi_rowcount(
+        self,
+    ) -> None:
+        # given
+        buffer = WriteBuffer()
+        for version in (1, 2):
+            buffer.update(
+                FakeVersionedEntityTable,
+                {"field": "new", "version": version + 1},
+                {"id": uuid4(), "version": version},
+            )
+        (pending,) = buffer.drain()
+        dialect = Mock(supports_sane_multi_rowcount=False)
+        # when
+        executions = list(pending.executions(dialect))
+        # then
+        assert [execution.parameters for execution in executions] == [
+            [row] for row in pending.parameters or []
+        ]
+        assert all(execution.expected == 1 for execution in executions)
+        assert all(execution.optimistic for execution in executions)
+
+    def test_executions_should_keep_executemany_with_sane_multi_rowcount(
+        self,
+    ) -> None:
+        # given
+        pending = BufferedStatement(Mock(), [{}, {}], 2)
+        dialect = Mock(supports_sane_multi_rowcount=True)
+        # when
+        executions = list(pending.executions(dialect))
+        # then
+        assert executions == [pending]
+
+
+class TestVersionConflictErrors:
+    def test_should_match_version_conflicts_but_not_missing_rows(
+        self,
+    ) -> None:
+        # given
+        conflict = VersionConflictError("changed by another transaction")
+        missing = NoResultFound("No row was found when one was required")
+        # when / then
+        assert isinstance(conflict, VERSION_CONFLICT_ERRORS)
+        assert not isinstance(missing, VERSION_CONFLICT_ERRORS)
+        assert not isinstance(
+            StaleDataError("deleted"), VERSION_CONFLICT_ERRORS
+        )
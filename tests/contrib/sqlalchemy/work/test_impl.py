@@ -4,6 +4,7 @@ import pytest
 from sqlalchemy.engine import Engine
 
 from pyuow.contrib.sqlalchemy.work import (
+    RollbackOnlyError,
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
@@ -98,10 +99,44 @@ class TestSqlAlchemyTransaction:
         # then
         root_trx.commit.assert_called_once()
 
+    def test_sync_commit_should_do_nothing_when_transaction_is_joined(
+        self,
+    ) -> None:
+        # given
+        root_trx = Mock()
+        trx_provider = Mock(
+            in_nested_transaction=Mock(return_value=False),
+            in_transaction=Mock(return_value=True),
+            get_transaction=Mock(return_value=root_trx),
+        )
+        trx = SqlAlchemyTransaction(trx_provider, joined=True)
+        # when
+        trx.commit()
+        # then
+        root_trx.commit.assert_not_called()
+
+    def test_sync_rollback_should_mark_owner_when_transaction_is_joined(
+        self,
+    ) -> None:
+        # given
+        root_trx = Mock()
+        trx_provider = Mock(
+            info={},
+            in_nested_transaction=Mock(return_value=False),
+            in_transaction=Mock(return_value=True),
+            get_transaction=Mock(return_value=root_trx),
+        )
+        trx = SqlAlchemyTransaction(trx_provider, joined=True)
+        # when
+        trx.rollback()
+        # then
+        root_trx.rollback.assert_not_called()
+        assert SqlAlchemyTransaction(trx_provider).is_rollback_only()
+
 
 @pytest.mark.skip_on_ci
 class TestSqlAlchemyTransactionManager:
-    def test_sync_transaction_should_open_nested_transaction_if_called_in_already_opened_transaction(
+    def test_sync_savepoint_should_open_nested_transaction_if_called_in_already_opened_transaction(
         self, engine: Engine
     ) -> None:
         # given
@@ -110,7 +145,7 @@ class TestSqlAlchemyTransactionManager:
         with manager.transaction() as trx:
             first_session = trx.it()
 
-            with manager.transaction() as trx2:
+            with manager.savepoint() as trx2:
                 second_session = trx2.it()
 
                 # then
@@ -122,6 +157,31 @@ class TestSqlAlchemyTransactionManager:
 
         assert not first_session.in_transaction()
 
+    def test_sync_transaction_should_join_already_opened_transaction(
+        self, engine: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(engine)
+        # when
+        with manager.transaction() as trx:
+            with manager.transaction() as trx2:
+                # then
+                assert trx2.it() is trx.it()
+                assert not trx2.it().in_nested_transaction()
+
+            assert trx.it().in_transaction()
+
+    def test_sync_transaction_should_open_nested_transaction_if_join_ambient_is_disabled(
+        self, engine: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(engine, join_ambient=False)
+        # when
+        with manager.transaction():
+            with manager.transaction() as trx2:
+                # then
+                assert trx2.it().in_nested_transaction()
+
     def test_sync_transaction_should_not_open_nested_transaction_if_called_in_new_transaction(
         self, engine: Engine
     ) -> None:
@@ -137,6 +197,65 @@ class TestSqlAlchemyTransactionManager:
 
         assert not session.in_transaction()
 
+    def test_sync_commit_should_fail_after_joined_transaction_rolled_back(
+        self, engine: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(engine)
+        # when
+        with manager.transaction() as trx:
+            with manager.transaction() as joined:
+                joined.rollback()
+
+            assert trx.it().in_transaction()
+
+            # then
+            with pytest.raises(RollbackOnlyError):
+                trx.commit()
+
+            assert not trx.it().in_transaction()
+
+    def test_sync_transaction_should_fail_on_exit_after_joined_transaction_rolled_back(
+        self, engine: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(engine)
+        # when / then
+        with pytest.raises(RollbackOnlyError):
+            with manager.transaction():
+                with manager.transaction() as joined:
+                    joined.rollback()
+
+    def test_sync_commit_should_succeed_after_joined_transaction_committed(
+        self, engine: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(engine)
+        # when
+        with manager.transaction() as trx:
+            with manager.transaction() as joined:
+                joined.commit()
+
+            trx.commit()
+
+            # then
+            assert not trx.it().in_transaction()
+
+    def test_sync_current_should_return_active_transaction(
+        self, engine: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyTransactionManager(engine)
+        # when
+        with manager.transaction() as trx:
+            current = manager.current()
+
+            # then
+            assert current is not None
+            assert current.it() is trx.it()
+
+        assert manager.current() is None
+
     def test_sync_readonly_transaction_should_yield_session(
         self, engine: Engine
     ) -> None:
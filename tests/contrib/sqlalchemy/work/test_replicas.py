@@ -0,0 +1,85 @@
+from pyuow.contrib.sqlalchemy.work import ReplicaBalancing, ReplicaSet
+
+
+class TestReplicaSet:
+    def test_acquire_should_rotate_replicas_when_round_robin(self) -> None:
+        # given
+        replicas = ReplicaSet(["a", "b", "c"])
+        for probed in replicas.replicas:
+            replicas.report(probed, 0.0)
+        # when
+        chosen = []
+        for _ in range(4):
+            replica = replicas.acquire()
+            assert replica is not None
+            chosen.append(replica.engine)
+            replicas.release(replica)
+        # then
+        assert chosen == ["a", "b", "c", "a"]
+
+    def test_acquire_should_pick_least_busy_replica_when_least_connections(
+        self,
+    ) -> None:
+        # given
+        replicas = ReplicaSet(
+            ["a", "b"], balancing=ReplicaBalancing.LEAST_CONNECTIONS
+        )
+        for probed in replicas.replicas:
+            replicas.report(probed, 0.0)
+        busy = replicas.acquire()
+        # when
+        replica = replicas.acquire()
+        # then
+        assert busy is not None and replica is not None
+        assert replica.engine != busy.engine
+        assert (busy.in_flight, replica.in_flight) == (1, 1)
+
+    def test_report_should_eject_replica_that_failed_or_lags(self) -> None:
+        # given
+        replicas = ReplicaSet(["a", "b", "c"], max_lag=1.0)
+        a, b, c = replicas.replicas
+        # when
+        replicas.report(a, None)
+        replicas.report(b, 5.0)
+        replicas.report(c, 0.5)
+        # then
+        assert replicas.healthy == 1
+        replica = replicas.acquire()
+        assert replica is not None
+        assert replica.engine == "c"
+
+    def test_acquire_should_return_none_when_no_replica_is_healthy(
+        self,
+    ) -> None:
+        # given
+        replicas = ReplicaSet(["a"])
+        replicas.report(replicas.replicas[0], None)
+        # when
+        replica = replicas.acquire()
+        # then
+        assert replica is None
+
+    def test_acquire_should_return_none_before_first_report(self) -> None:
+        # given
+        replicas = ReplicaSet(["a"])
+        # when
+        replica = replicas.acquire()
+        # then
+        assert replica is None
+        assert replicas.healthy == 0
+
+    def test_due_should_return_replicas_once_per_probe_interval(self) -> None:
+        # given
+        now = [0.0]
+        replicas = ReplicaSet(
+            ["a", "b"], probe_interval=5.0, clock=lambda: now[0]
+        )
+        # when
+        first = replicas.due()
+        second = replicas.due()
+        now[0] = 5.0
+        third = replicas.due()
+        # then
+        assert len(first) == 2
+        assert second == []
+        assert len(third) == 2
@@ -0,0 +1,199 @@
+import threading
+import typing as t
+from pathlib import Path
+
+import pytest
+from sqlalchemy import (
+    Connection,
+    Engine,
+    column,
+    create_engine,
+    insert,
+    literal,
+    select,
+    table,
+    text,
+)
+
+from pyuow.contrib.sqlalchemy.work import (
+    SqlAlchemyRoutingReadOnlyTransactionManager,
+    SqlAlchemyTransactionManager,
+    pin_scope,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_recent_write() -> t.Iterator[None]:
+    with pin_scope():
+        yield
+
+
+def database(path: Path, name: str) -> Engine:
+    engine = create_engine(f"sqlite:///{path / name}.db")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE source (name TEXT)"))
+        connection.execute(
+            text("INSERT INTO source VALUES (:name)"), {"name": name}
+        )
+    return engine
+
+
+def source(manager: SqlAlchemyRoutingReadOnlyTransactionManager) -> t.Any:
+    with manager.transaction() as trx:
+        return trx.it().execute(text("SELECT name FROM source")).scalar()
+
+
+class TestSqlAlchemyRoutingReadOnlyTransactionManager:
+    @pytest.fixture
+    def primary(self, tmp_path: Path) -> Engine:
+        return database(tmp_path, "primary")
+
+    def test_transaction_should_balance_reads_across_replicas(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary,
+            [database(tmp_path, "first"), database(tmp_path, "second")],
+        )
+        manager.refresh()
+        # when
+        sources = [source(manager) for _ in range(3)]
+        # then
+        assert sources == ["first", "second", "first"]
+
+    def test_transaction_should_read_from_primary_before_first_probe(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        release = threading.Event()
+
+        def blocking(connection: Connection) -> t.Optional[float]:
+            release.wait(timeout=5)
+            return 0.0
+
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")], probe=blocking
+        )
+        # when
+        result = source(manager)
+        release.set()
+        # then
+        assert result == "primary"
+
+    def test_transaction_should_fall_back_to_primary_when_replicas_fail_probe(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        def lagging(connection: Connection) -> t.Optional[float]:
+            return 10.0
+
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")], probe=lagging
+        )
+        # when
+        manager.refresh()
+        result = source(manager)
+        # then
+        assert result == "primary"
+        assert manager.replicas.healthy == 0
+
+    def test_transaction_should_pin_to_primary_after_write(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")], max_lag=60.0
+        )
+        manager.refresh()
+        before = source(manager)
+        # when
+        with SqlAlchemyTransactionManager(primary).transaction() as trx:
+            trx.it().execute(
+                text("INSERT INTO source VALUES (:name)"), {"name": "write"}
+            )
+        after = source(manager)
+        # then
+        assert before == "replica"
+        assert after == "primary"
+
+    def test_transaction_should_not_wait_for_due_probes(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        probing = threading.Event()
+        release = threading.Event()
+
+        def blocking(connection: Connection) -> t.Optional[float]:
+            if not probing.is_set():
+                probing.set()
+                return 0.0
+            release.wait(timeout=5)
+            return 10.0
+
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")], probe=blocking
+        )
+        manager.refresh()
+        # when
+        result = source(manager)
+        release.set()
+        # then
+        assert result == "replica"
+        assert probing.wait(timeout=5)
+
+    def test_transaction_should_not_pin_to_primary_after_read_or_rollback(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")], max_lag=60.0
+        )
+        manager.refresh()
+        writer = SqlAlchemyTransactionManager(primary)
+        # when
+        with writer.transaction() as trx:
+            trx.it().execute(select(literal(1)))
+        with writer.transaction() as trx:
+            trx.it().execute(
+                insert(table("source", column("name"))).values(name="write")
+            )
+            trx.rollback()
+        result = source(manager)
+        # then
+        assert result == "replica"
+
+    def test_pin_scope_should_reset_primary_pin(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")], max_lag=60.0
+        )
+        manager.refresh()
+        with SqlAlchemyTransactionManager(primary).transaction() as trx:
+            trx.it().execute(
+                text("INSERT INTO source VALUES (:name)"), {"name": "write"}
+            )
+        # when
+        with pin_scope():
+            scoped = source(manager)
+        after = source(manager)
+        # then
+        assert scoped == "replica"
+        assert after == "primary"
+
+    def test_detached_should_read_from_replica(
+        self, tmp_path: Path, primary: Engine
+    ) -> None:
+        # given
+        manager = SqlAlchemyRoutingReadOnlyTransactionManager(
+            primary, [database(tmp_path, "replica")]
+        )
+        manager.refresh()
+        # when
+        with manager.detached() as trx:
+            result = trx.it().execute(text("SELECT name FROM source")).scalar()
+        # then
+        assert result == "replica"
+        assert manager.replicas.replicas[0].in_flight == 0
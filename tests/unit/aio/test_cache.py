@@ -0,0 +1,98 @@
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock
+
+from pyuow.context import BaseImmutableContext, BaseParams
+from pyuow.result import Result
+from pyuow.unit.aio import CachedUnit
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    sku: str
+
+
+@dataclass(frozen=True)
+class FakeContext(BaseImmutableContext[FakeParams]):
+    pass
+
+
+class TestCachedUnit:
+    async def test_finish_should_reuse_result_for_equal_params(self) -> None:
+        # given
+        unit = AsyncMock(
+            side_effect=lambda context: Result.ok(context.params.sku)
+        )
+        cached = CachedUnit[FakeContext, str](unit)
+        # when
+        results = [
+            await cached(FakeContext(params=FakeParams(sku=sku)))
+            for sku in ("a", "a", "b")
+        ]
+        # then
+        assert [result.get() for result in results] == ["a", "a", "b"]
+        assert unit.await_count == 2
+        assert cached.cache.hits == 1
+        assert cached.cache.misses == 2
+
+    async def test_finish_should_share_single_computation_for_concurrent_misses(
+        self,
+    ) -> None:
+        # given
+        release = asyncio.Event()
+
+        async def compute(context: FakeContext) -> Result[str]:
+            await release.wait()
+            return Result.ok(context.params.sku)
+
+        unit = AsyncMock(side_effect=compute)
+        cached = CachedUnit[FakeContext, str](unit)
+        context = FakeContext(params=FakeParams(sku="a"))
+        # when
+        tasks = [asyncio.ensure_future(cached(context)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        # then
+        assert [result.get() for result in results] == ["a", "a", "a"]
+        unit.assert_awaited_once()
+        assert cached.cache.hits == 2
+        assert cached.cache.misses == 1
+
+    async def test_finish_should_keep_computation_when_leader_is_cancelled(
+        self,
+    ) -> None:
+        # given
+        release = asyncio.Event()
+
+        async def compute(context: FakeContext) -> Result[str]:
+            await release.wait()
+            return Result.ok("test")
+
+        unit = AsyncMock(side_effect=compute)
+        cached = CachedUnit[FakeContext, str](unit)
+        context = FakeContext(params=FakeParams(sku="a"))
+        leader = asyncio.ensure_future(cached(context))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(cached(context))
+        await asyncio.sleep(0)
+        # when
+        leader.cancel()
+        release.set()
+        result = await follower
+        # then
+        assert leader.cancelled() is True
+        assert result.get() == "test"
+        unit.assert_awaited_once()
+
+    async def test_finish_should_return_error_and_not_cache_it(self) -> None:
+        # given
+        unit = AsyncMock(return_value=Result.error(Exception("test")))
+        cached = CachedUnit[FakeContext, int](unit)
+        context = FakeContext(params=FakeParams(sku="a"))
+        # when
+        await cached(context)
+        result = await cached(context)
+        # then
+        assert result.is_error() is True
+        assert unit.await_count == 2
@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.result import Result
+from pyuow.unit.aio import (
+    ConditionalUnit,
+    FinalUnit,
+    RunUnit,
+    deadline,
+    remaining_time,
+)
+
+
+class TestDeadline:
+    async def test_remaining_time_should_be_none_without_deadline(
+        self,
+    ) -> None:
+        # when / then
+        assert remaining_time() is None
+
+    async def test_deadline_should_expose_remaining_time(self) -> None:
+        # when
+        async with deadline(10):
+            remaining = remaining_time()
+        # then
+        assert remaining is not None
+        assert 9 < remaining <= 10
+        assert remaining_time() is None
+
+    async def test_deadline_should_raise_timeout_error_on_expiry(
+        self,
+    ) -> None:
+        # when / then
+        with pytest.raises(TimeoutError):
+            async with deadline(0.01):
+                await asyncio.sleep(10)
+
+    async def test_deadline_should_keep_shorter_outer_deadline(self) -> None:
+        # when
+        async with deadline(1):
+            outer = remaining_time()
+            async with deadline(10):
+                inner = remaining_time()
+        # then
+        assert outer is not None and inner is not None
+        assert inner <= outer <= 1
+
+    async def test_deadline_should_not_swallow_external_cancellation(
+        self,
+    ) -> None:
+        # given
+        async def wait() -> None:
+            async with deadline(10):
+                await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(wait())
+        await asyncio.sleep(0)
+        # when
+        task.cancel()
+        # then
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+class TestUnitTimeouts:
+    async def test_run_unit_timeout_should_return_timeout_error(
+        self,
+    ) -> None:
+        # given
+        class SlowUnit(RunUnit[Mock, None]):
+            _timeout = 0.01
+
+            async def run(self, context: Mock) -> None:
+                await asyncio.sleep(10)
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        flow = (SlowUnit() >> TerminalUnit()).build()
+        # when
+        compiled_result = await flow(Mock())
+        recursive_result = await flow.root(Mock())
+        # then
+        for result in (compiled_result, recursive_result):
+            with pytest.raises(TimeoutError):
+                result.raise_for_error()
+
+    async def test_unit_should_read_remaining_time_of_its_timeout(
+        self,
+    ) -> None:
+        # given
+        class CheckUnit(ConditionalUnit[Mock, float]):
+            _timeout = 5.0
+
+            async def condition(self, context: Mock) -> bool:
+                context.remaining = remaining_time()
+                return True
+
+        class TerminalUnit(FinalUnit[Mock, float]):
+            async def finish(self, context: Mock) -> Result[float]:
+                return Result.ok(context.remaining)
+
+        flow = (CheckUnit(on_failure=Mock()) >> TerminalUnit()).build()
+        # when
+        result = await flow(Mock())
+        # then
+        assert 4 < result.get() <= 5
@@ -1,3 +1,5 @@
+import asyncio
+import sys
 import typing as t
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, Mock
@@ -6,20 +8,31 @@ import pytest
 
 from pyuow.context import BaseMutableContext, BaseParams
 from pyuow.context.datapoint.aio.in_memory import InMemoryDataPointContext
-from pyuow.datapoint import BaseDataPointSpec
+from pyuow.datapoint import (
+    BaseDataPointSpec,
+    DataPointCycleError,
+    DataPointHasMultipleProducersError,
+    DataPointIsNotProducedError,
+)
 from pyuow.datapoint.aio import ConsumesDataPoints, ProducesDataPoints
 from pyuow.result import Result
 from pyuow.types import MISSING
 from pyuow.unit import (
     CannotReassignUnitError,
     FinalUnitError,
+    FlowIsFrozenError,
     FlowNotTerminatedError,
+    FlowObserver,
+    UnitOutcome,
 )
 from pyuow.unit.aio import (
+    CompiledFlow,
     ConditionalUnit,
+    DataPointGraphUnit,
     ErrorUnit,
     FinalUnit,
     FlowUnit,
+    ParallelUnit,
     RunUnit,
 )
 
@@ -57,6 +70,30 @@ class TestUnits:
         with pytest.raises(CannotReassignUnitError):
             unit1 >> unit2 >> unit1
 
+    async def test_async_flow_unit_rshift_should_raise_after_build(
+        self,
+    ) -> None:
+        # given
+        class FakeUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                pass
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        unit = FakeUnit()
+        terminal = TerminalUnit()
+        flow = (unit >> terminal).build()
+        # when / then
+        with pytest.raises(FlowIsFrozenError):
+            FakeUnit() >> unit
+        with pytest.raises(FlowIsFrozenError):
+            unit >> FakeUnit()
+        with pytest.raises(FlowIsFrozenError):
+            flow >> FakeUnit()
+        assert unit._next is terminal
+
     async def test_async_flow_unit_build_should_return_flow_root(self) -> None:
         # given
         class FakeUnit(FlowUnit[Mock, None]):
@@ -72,7 +109,91 @@ class TestUnits:
         # when
         flow = unit1 >> unit2 >> TerminalUnit()
         # then
-        assert flow.build() == unit1
+        assert flow.build().root == unit1
+
+    async def test_async_flow_unit_build_should_compile_flat_plan(
+        self,
+    ) -> None:
+        # given
+        mock_logic = Mock()
+
+        class FakeUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                mock_logic(context)
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        mock_context = Mock()
+        flow: FlowUnit[Mock, None] = FakeUnit()
+        for _ in range(sys.getrecursionlimit() * 2):
+            flow = flow >> FakeUnit()
+        # when
+        compiled = (flow >> TerminalUnit()).build()
+        result = await compiled(mock_context)
+        # then
+        assert isinstance(compiled, CompiledFlow)
+        assert len(compiled) == sys.getrecursionlimit() * 2 + 2
+        assert result.is_empty() is True
+        assert mock_logic.call_count == sys.getrecursionlimit() * 2 + 1
+
+    async def test_async_flow_unit_build_should_resolve_on_failure_branch(
+        self,
+    ) -> None:
+        # given
+        mock_logic = Mock()
+
+        class FakeConditionalUnit(ConditionalUnit[Mock, str]):
+            async def condition(self, context: Mock) -> bool:
+                return False
+
+        class FakeRunUnit(RunUnit[Mock, str]):
+            async def run(self, context: Mock) -> None:
+                mock_logic(context)
+
+        class TerminalUnit(FinalUnit[Mock, str]):
+            def __init__(self, out: str) -> None:
+                super().__init__()
+                self._out = out
+
+            async def finish(self, context: Mock) -> Result[str]:
+                return Result.ok(self._out)
+
+        mock_context = Mock()
+        on_failure = FakeRunUnit()
+        on_failure >> TerminalUnit("failure")
+        # when
+        flow = (
+            FakeConditionalUnit(on_failure=on_failure)
+            >> TerminalUnit("success")
+        ).build()
+        result = await flow(mock_context)
+        # then
+        assert len(flow) == 4
+        assert result.get() == "failure"
+        mock_logic.assert_called_once_with(mock_context)
+
+    async def test_async_flow_unit_build_should_raise_if_on_failure_not_terminated(
+        self,
+    ) -> None:
+        # given
+        class FakeConditionalUnit(ConditionalUnit[Mock, None]):
+            async def condition(self, context: Mock) -> bool:
+                return False
+
+        class FakeRunUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None: ...
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        # when / then
+        with pytest.raises(FlowNotTerminatedError):
+            (
+                FakeConditionalUnit(on_failure=FakeRunUnit()) >> TerminalUnit()
+            ).build()
 
     async def test_async_complex_units_flow_should_behave_properly(
         self,
@@ -292,3 +413,320 @@ class TestUnits:
         # then
         assert result.is_error() is True
         mock_context.assert_not_called()
+
+    async def test_async_compiled_flow_should_notify_observer(self) -> None:
+        # given
+        class FakeConditionalUnit(ConditionalUnit[Mock, None]):
+            async def condition(self, context: Mock) -> bool:
+                return False
+
+        class FakeRunUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None: ...
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        observer = Mock(spec=FlowObserver)
+        run_unit = FakeRunUnit()
+        on_failure = TerminalUnit()
+        conditional_unit = FakeConditionalUnit(on_failure=on_failure)
+        flow = (run_unit >> conditional_unit >> TerminalUnit()).build()
+        # when
+        result = await flow.observed_by(observer)(Mock())
+        # then
+        assert result.is_empty() is True
+        assert [c.args[0] for c in observer.on_unit_start.call_args_list] == [
+            run_unit,
+            conditional_unit,
+            on_failure,
+        ]
+        assert [c.args[1] for c in observer.on_unit_end.call_args_list] == [
+            UnitOutcome.COMPLETED,
+            UnitOutcome.FAILED,
+            UnitOutcome.COMPLETED,
+        ]
+        observer.on_branch.assert_called_once_with(
+            conditional_unit, on_failure
+        )
+        observer.on_exception.assert_not_called()
+
+    async def test_async_compiled_flow_should_notify_observer_on_exception(
+        self,
+    ) -> None:
+        # given
+        error = Exception("test")
+
+        class FakeRunUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                raise error
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        observer = Mock(spec=FlowObserver)
+        run_unit = FakeRunUnit()
+        flow = (run_unit >> TerminalUnit()).build()
+        # when
+        result = await flow.observed_by(observer)(Mock())
+        # then
+        assert result.is_error() is True
+        observer.on_exception.assert_called_once_with(run_unit, error)
+        assert observer.on_unit_end.call_args.args[:2] == (
+            run_unit,
+            UnitOutcome.ERROR,
+        )
+
+    async def test_async_parallel_unit_should_run_branches_concurrently(
+        self,
+    ) -> None:
+        # given
+        started = Mock()
+        release = asyncio.Event()
+
+        class WaitingUnit(RunUnit[Mock, str]):
+            def __init__(self, name: str) -> None:
+                super().__init__()
+                self._name = name
+
+            async def run(self, context: Mock) -> None:
+                started(self._name)
+                await release.wait()
+
+        class ReleasingFinalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                started("flow")
+                release.set()
+                return Result.empty()
+
+        class TerminalUnit(FinalUnit[Mock, str]):
+            async def finish(self, context: Mock) -> Result[str]:
+                return Result.ok("done")
+
+        flow = (
+            (
+                WaitingUnit("a")
+                & WaitingUnit("b")
+                & ReleasingFinalUnit().build()
+            )
+            >> TerminalUnit()
+        ).build()
+        # when
+        result = await flow(Mock())
+        # then
+        assert result.get() == "done"
+        assert {c.args[0] for c in started.call_args_list} == {
+            "a",
+            "b",
+            "flow",
+        }
+
+    async def test_async_parallel_unit_should_fail_fast_and_cancel_siblings(
+        self,
+    ) -> None:
+        # given
+        error = Exception("test")
+        cancelled = Mock()
+
+        class SlowUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled()
+                    raise
+
+        class FailingUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                raise error
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        flow = (
+            ParallelUnit[Mock, None](SlowUnit(), FailingUnit())
+            >> TerminalUnit()
+        ).build()
+        # when
+        result = await flow(Mock())
+        # then
+        assert result.is_error() is True
+        with pytest.raises(Exception) as exc_info:
+            result.raise_for_error()
+        assert exc_info.value is error
+        cancelled.assert_called_once_with()
+
+    async def test_async_parallel_unit_should_fail_on_error_result(
+        self,
+    ) -> None:
+        # given
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        branch = ErrorUnit[Mock, None](exc=ValueError("test")).build()
+        flow = (
+            ParallelUnit[Mock, None](TerminalUnit().build(), branch)
+            >> TerminalUnit()
+        ).build()
+        # when
+        result = await flow(Mock())
+        # then
+        assert result.is_error() is True
+        with pytest.raises(ValueError):
+            result.raise_for_error()
+
+    async def test_async_parallel_unit_should_apply_branch_timeout(
+        self,
+    ) -> None:
+        # given
+        class SlowUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None:
+                await asyncio.sleep(10)
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        flow = (
+            ParallelUnit[Mock, None](SlowUnit(), timeout=0.01)
+            >> TerminalUnit()
+        ).build()
+        # when
+        result = await flow(Mock())
+        # then
+        with pytest.raises(asyncio.TimeoutError):
+            result.raise_for_error()
+
+    async def test_async_parallel_unit_and_should_extend_branches(
+        self,
+    ) -> None:
+        # given
+        class FakeUnit(RunUnit[Mock, None]):
+            async def run(self, context: Mock) -> None: ...
+
+        unit1, unit2, unit3 = FakeUnit(), FakeUnit(), FakeUnit()
+        # when
+        parallel = ParallelUnit[Mock, None](unit1, unit2, timeout=1.0) & unit3
+        # then
+        assert parallel._branches == (unit1, unit2, unit3)
+        assert parallel._branch_timeout == 1.0
+
+
+BaseSpec = BaseDataPointSpec("base", int)
+DoubledSpec = BaseDataPointSpec("doubled", int)
+SquaredSpec = BaseDataPointSpec("squared", int)
+TotalSpec = BaseDataPointSpec("total", int)
+
+
+@dataclass(frozen=True)
+class FakeGraphContext(InMemoryDataPointContext[Mock]):
+    pass
+
+
+class ProduceBase(RunUnit[FakeGraphContext, int], ProducesDataPoints):
+    _produces = {BaseSpec}
+
+    async def run(self, context: FakeGraphContext) -> None:
+        await self.to(context).add(BaseSpec(3))
+
+
+class ProduceDoubled(
+    RunUnit[FakeGraphContext, int], ConsumesDataPoints, ProducesDataPoints
+):
+    _consumes = {BaseSpec}
+    _produces = {DoubledSpec}
+
+    async def run(self, context: FakeGraphContext) -> None:
+        datapoints = await self.out_of(context)
+        await self.to(context).add(DoubledSpec(datapoints[BaseSpec] * 2))
+
+
+class ProduceSquared(
+    RunUnit[FakeGraphContext, int], ConsumesDataPoints, ProducesDataPoints
+):
+    _consumes = {BaseSpec}
+    _produces = {SquaredSpec}
+
+    async def run(self, context: FakeGraphContext) -> None:
+        datapoints = await self.out_of(context)
+        await self.to(context).add(SquaredSpec(datapoints[BaseSpec] ** 2))
+
+
+class ProduceTotal(
+    RunUnit[FakeGraphContext, int], ConsumesDataPoints, ProducesDataPoints
+):
+    _consumes = {DoubledSpec, SquaredSpec}
+    _produces = {TotalSpec}
+
+    async def run(self, context: FakeGraphContext) -> None:
+        datapoints = await self.out_of(context)
+        await self.to(context).add(
+            TotalSpec(datapoints[DoubledSpec] + datapoints[SquaredSpec])
+        )
+
+
+class ReturnTotal(FinalUnit[FakeGraphContext, int], ConsumesDataPoints):
+    _consumes = {TotalSpec}
+
+    async def finish(self, context: FakeGraphContext) -> Result[int]:
+        datapoints = await self.out_of(context)
+        return Result.ok(datapoints[TotalSpec])
+
+
+class TestDataPointGraphUnit:
+    async def test_graph_should_schedule_units_in_topological_waves(
+        self,
+    ) -> None:
+        # given
+        produce_base = ProduceBase()
+        produce_doubled = ProduceDoubled()
+        produce_squared = ProduceSquared()
+        produce_total = ProduceTotal()
+        # when
+        graph = DataPointGraphUnit[FakeGraphContext, int](
+            produce_total, produce_squared, produce_doubled, produce_base
+        )
+        flow = (graph >> ReturnTotal()).build()
+        result = await flow(FakeGraphContext(params=Mock()))
+        # then
+        assert result.get() == 15
+        assert graph.waves[0] is produce_base
+        assert isinstance(graph.waves[1], ParallelUnit)
+        assert graph.waves[1]._branches == (produce_squared, produce_doubled)
+        assert graph.waves[2] is produce_total
+
+    def test_graph_should_raise_if_spec_is_not_produced(self) -> None:
+        # when / then
+        with pytest.raises(DataPointIsNotProducedError):
+            DataPointGraphUnit[FakeGraphContext, int](ProduceDoubled())
+
+    def test_graph_should_raise_if_spec_has_multiple_producers(self) -> None:
+        # when / then
+        with pytest.raises(DataPointHasMultipleProducersError):
+            DataPointGraphUnit[FakeGraphContext, int](
+                ProduceBase(), ProduceBase()
+            )
+
+    def test_graph_should_raise_on_cycle(self) -> None:
+        # given
+        class ProduceBaseFromTotal(
+            RunUnit[FakeGraphContext, int],
+            ConsumesDataPoints,
+            ProducesDataPoints,
+        ):
+            _consumes = {TotalSpec}
+            _produces = {BaseSpec}
+
+            async def run(self, context: FakeGraphContext) -> None: ...
+
+        # when / then
+        with pytest.raises(DataPointCycleError):
+            DataPointGraphUnit[FakeGraphContext, int](
+                ProduceBaseFromTotal(),
+                ProduceDoubled(),
+                ProduceSquared(),
+                ProduceTotal(),
+            )
@@ -0,0 +1,142 @@
+import asyncio
+import contextvars
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.result import Result
+from pyuow.unit import FinalUnit as SyncFinalUnit
+from pyuow.unit import RunUnit as SyncRunUnit
+from pyuow.unit.aio import (
+    FinalUnit,
+    ThreadedFlowUnit,
+    ThreadedRunUnit,
+    UnitThreadPool,
+)
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+class TestUnitThreadPool:
+    async def test_run_should_execute_in_worker_thread_with_context_vars(
+        self,
+    ) -> None:
+        # given
+        pool = UnitThreadPool(max_workers=1)
+        request_id.set("test")
+        # when
+        thread, value = await pool.run(
+            lambda: (threading.current_thread(), request_id.get())
+        )
+        # then
+        assert thread is not threading.current_thread()
+        assert value == "test"
+        assert pool.max_workers == 1
+        assert pool.in_flight == 0
+        pool.shutdown()
+
+    async def test_run_should_report_queued_and_active_work(self) -> None:
+        # given
+        pool = UnitThreadPool(max_workers=1)
+        release = threading.Event()
+        # when
+        tasks = [
+            asyncio.ensure_future(pool.run(release.wait)) for _ in range(3)
+        ]
+        while pool.active == 0:
+            await asyncio.sleep(0.001)
+        # then
+        assert pool.in_flight == 3
+        assert pool.active == 1
+        assert pool.queued == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert pool.in_flight == 0
+        pool.shutdown()
+
+    async def test_run_should_wait_for_thread_when_cancelled(self) -> None:
+        # given
+        pool = UnitThreadPool(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+        finished = Mock()
+
+        def blocking() -> None:
+            started.set()
+            release.wait()
+            finished()
+
+        task = asyncio.ensure_future(pool.run(blocking))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        # when
+        task.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        # then
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        finished.assert_called_once_with()
+        pool.shutdown()
+
+
+class TestThreadedUnits:
+    async def test_threaded_run_unit_should_run_sync_unit(self) -> None:
+        # given
+        mock_logic = Mock()
+
+        class BlockingUnit(SyncRunUnit[Mock, None]):
+            def run(self, context: Mock) -> None:
+                mock_logic(context, threading.current_thread())
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            async def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        pool = UnitThreadPool(max_workers=1)
+        mock_context = Mock()
+        flow = (
+            ThreadedRunUnit[Mock, None](BlockingUnit(), pool=pool)
+            >> TerminalUnit()
+        ).build()
+        # when
+        result = await flow(mock_context)
+        # then
+        assert result.is_empty() is True
+        assert mock_logic.call_args.args[0] is mock_context
+        assert mock_logic.call_args.args[1] is not threading.current_thread()
+        pool.shutdown()
+
+    async def test_threaded_flow_unit_should_return_sync_flow_result(
+        self,
+    ) -> None:
+        # given
+        class BlockingUnit(SyncFinalUnit[Mock, str]):
+            def finish(self, context: Mock) -> Result[str]:
+                return Result.ok(threading.current_thread().name)
+
+        pool = UnitThreadPool(max_workers=1, thread_name_prefix="legacy")
+        flow = ThreadedFlowUnit(BlockingUnit().build(), pool=pool).build()
+        # when
+        result = await flow(Mock())
+        # then
+        assert result.get().startswith("legacy")
+        pool.shutdown()
+
+    async def test_threaded_flow_unit_should_return_error_on_exception(
+        self,
+    ) -> None:
+        # given
+        def failing(context: Mock) -> Result[None]:
+            raise ValueError("test")
+
+        pool = UnitThreadPool(max_workers=1)
+        flow = ThreadedFlowUnit[Mock, None](
+            Mock(side_effect=failing), pool=pool
+        ).build()
+        # when
+        result = await flow(Mock())
+        # then
+        with pytest.raises(ValueError):
+            result.raise_for_error()
+        pool.shutdown()
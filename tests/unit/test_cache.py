@@ -0,0 +1,127 @@
+import typing as t
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.context import BaseImmutableContext, BaseParams
+from pyuow.result import Result
+from pyuow.unit import CachedUnit, ConditionalUnit, ResultCache
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    sku: str
+
+
+@dataclass(frozen=True)
+class FakeContext(BaseImmutableContext[FakeParams]):
+    pass
+
+
+class TestResultCache:
+    def test_get_should_evict_least_recently_used_entry(self) -> None:
+        # given
+        cache: ResultCache[int] = ResultCache(maxsize=2)
+        cache.put("a", Result.ok(1))
+        cache.put("b", Result.ok(2))
+        cache.get("a")
+        # when
+        cache.put("c", Result.ok(3))
+        # then
+        assert cache.get("b") is None
+        assert cache.get("a") == Result.ok(1)
+        assert cache.size == 2
+
+    def test_get_should_expire_entries_after_ttl(self) -> None:
+        # given
+        clock = Mock(return_value=0.0)
+        cache: ResultCache[int] = ResultCache(ttl=10, clock=clock)
+        cache.put("a", Result.ok(1))
+        # when
+        clock.return_value = 9.0
+        fresh = cache.get("a")
+        clock.return_value = 10.0
+        expired = cache.get("a")
+        # then
+        assert fresh == Result.ok(1)
+        assert expired is None
+        assert cache.size == 0
+
+    def test_put_should_skip_error_results_unless_enabled(self) -> None:
+        # given
+        cache: ResultCache[int] = ResultCache()
+        errors_cache: ResultCache[int] = ResultCache(cache_errors=True)
+        error: Result[int] = Result.error(Exception("test"))
+        # when
+        cache.put("a", error)
+        errors_cache.put("a", error)
+        # then
+        assert cache.get("a") is None
+        assert errors_cache.get("a") is error
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"maxsize": 0}, {"ttl": 0}, {"ttl": -1.0}]
+    )
+    def test_init_should_reject_invalid_limits(
+        self, kwargs: t.Dict[str, t.Any]
+    ) -> None:
+        # when / then
+        with pytest.raises(ValueError):
+            ResultCache(**kwargs)
+
+
+class TestCachedUnit:
+    def test_finish_should_reuse_result_for_equal_params(self) -> None:
+        # given
+        unit = Mock(side_effect=lambda context: Result.ok(context.params.sku))
+        cached = CachedUnit[FakeContext, str](unit)
+        # when
+        results = [
+            cached(FakeContext(params=FakeParams(sku=sku)))
+            for sku in ("a", "a", "b", "a")
+        ]
+        # then
+        assert [result.get() for result in results] == ["a", "a", "b", "a"]
+        assert unit.call_count == 2
+        assert cached.cache.hits == 2
+        assert cached.cache.misses == 2
+
+    def test_finish_should_use_custom_key(self) -> None:
+        # given
+        unit = Mock(return_value=Result.ok(1))
+        cached = CachedUnit[FakeContext, int](unit, key=lambda context: 1)
+        # when
+        cached(FakeContext(params=FakeParams(sku="a")))
+        cached(FakeContext(params=FakeParams(sku="b")))
+        # then
+        unit.assert_called_once()
+
+    def test_finish_should_recompute_error_results(self) -> None:
+        # given
+        unit = Mock(return_value=Result.error(Exception("test")))
+        cached = CachedUnit[FakeContext, int](unit)
+        context = FakeContext(params=FakeParams(sku="a"))
+        # when
+        cached(context)
+        result = cached(context)
+        # then
+        assert result.is_error() is True
+        assert unit.call_count == 2
+
+    def test_cached_unit_should_terminate_compiled_flow(self) -> None:
+        # given
+        class PassUnit(ConditionalUnit[FakeContext, str]):
+            def condition(self, context: FakeContext) -> bool:
+                return True
+
+        unit = Mock(return_value=Result.ok("test"))
+        flow = (
+            PassUnit(on_failure=Mock()) >> CachedUnit[FakeContext, str](unit)
+        ).build()
+        context = FakeContext(params=FakeParams(sku="a"))
+        # when
+        results = [flow(context), flow(context)]
+        # then
+        assert [result.get() for result in results] == ["test", "test"]
+        unit.assert_called_once()
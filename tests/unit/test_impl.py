@@ -1,3 +1,4 @@
+import sys
 import typing as t
 from dataclasses import dataclass
 from unittest.mock import Mock
@@ -15,13 +16,18 @@ from pyuow.result import Result
 from pyuow.types import MISSING
 from pyuow.unit import (
     CannotReassignUnitError,
+    CompiledFlow,
     ConditionalUnit,
     ErrorUnit,
     FinalUnit,
     FinalUnitError,
+    FlowIsFrozenError,
     FlowNotTerminatedError,
+    FlowObserver,
     FlowUnit,
+    NoOpFlowObserver,
     RunUnit,
+    UnitOutcome,
 )
 
 
@@ -54,6 +60,28 @@ class TestUnits:
         with pytest.raises(CannotReassignUnitError):
             unit1 >> unit2 >> unit1
 
+    def test_flow_unit_rshift_should_raise_after_build(self) -> None:
+        # given
+        class FakeUnit(RunUnit[Mock, None]):
+            def run(self, context: Mock) -> None:
+                pass
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        unit = FakeUnit()
+        terminal = TerminalUnit()
+        flow = (unit >> terminal).build()
+        # when / then
+        with pytest.raises(FlowIsFrozenError):
+            FakeUnit() >> unit
+        with pytest.raises(FlowIsFrozenError):
+            unit >> FakeUnit()
+        with pytest.raises(FlowIsFrozenError):
+            flow >> FakeUnit()
+        assert unit._next is terminal
+
     def test_flow_unit_build_should_return_flow_root(self) -> None:
         # given
         class FakeUnit(FlowUnit[Mock, None]):
@@ -69,7 +97,114 @@ class TestUnits:
         # when
         flow = unit1 >> unit2 >> TerminalUnit()
         # then
-        assert flow.build() == unit1
+        assert flow.build().root == unit1
+
+    def test_flow_unit_build_should_compile_flat_plan(self) -> None:
+        # given
+        mock_logic = Mock()
+
+        class FakeUnit(RunUnit[Mock, None]):
+            def run(self, context: Mock) -> None:
+                mock_logic(context)
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        mock_context = Mock()
+        flow: FlowUnit[Mock, None] = FakeUnit()
+        for _ in range(sys.getrecursionlimit() * 2):
+            flow = flow >> FakeUnit()
+        # when
+        compiled = (flow >> TerminalUnit()).build()
+        result = compiled(mock_context)
+        # then
+        assert isinstance(compiled, CompiledFlow)
+        assert len(compiled) == sys.getrecursionlimit() * 2 + 2
+        assert result.is_empty() is True
+        assert mock_logic.call_count == sys.getrecursionlimit() * 2 + 1
+
+    def test_flow_unit_build_should_resolve_on_failure_branch(self) -> None:
+        # given
+        mock_logic = Mock()
+
+        class FakeConditionalUnit(ConditionalUnit[Mock, str]):
+            def condition(self, context: Mock) -> bool:
+                return False
+
+        class FakeRunUnit(RunUnit[Mock, str]):
+            def run(self, context: Mock) -> None:
+                mock_logic(context)
+
+        class TerminalUnit(FinalUnit[Mock, str]):
+            def __init__(self, out: str) -> None:
+                super().__init__()
+                self._out = out
+
+            def finish(self, context: Mock) -> Result[str]:
+                return Result.ok(self._out)
+
+        mock_context = Mock()
+        on_failure = FakeRunUnit()
+        on_failure >> TerminalUnit("failure")
+        # when
+        flow = (
+            FakeConditionalUnit(on_failure=on_failure)
+            >> TerminalUnit("success")
+        ).build()
+        result = flow(mock_context)
+        # then
+        assert len(flow) == 4
+        assert result.get() == "failure"
+        mock_logic.assert_called_once_with(mock_context)
+
+    def test_flow_unit_build_should_raise_if_on_failure_not_terminated(
+        self,
+    ) -> None:
+        # given
+        class FakeConditionalUnit(ConditionalUnit[Mock, None]):
+            def condition(self, context: Mock) -> bool:
+                return False
+
+        class FakeRunUnit(RunUnit[Mock, None]):
+            def run(self, context: Mock) -> None: ...
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        # when / then
+        with pytest.raises(FlowNotTerminatedError):
+            (
+                FakeConditionalUnit(on_failure=FakeRunUnit()) >> TerminalUnit()
+            ).build()
+
+    def test_compiled_flow_should_match_recursive_dispatch(self) -> None:
+        # given
+        class FakeConditionalUnit(ConditionalUnit[Mock, str]):
+            def condition(self, context: Mock) -> bool:
+                return bool(context.passed)
+
+        class TerminalUnit(FinalUnit[Mock, str]):
+            def finish(self, context: Mock) -> Result[str]:
+                return Result.ok("success")
+
+        flow = (
+            FakeConditionalUnit(on_failure=ErrorUnit(exc=Exception("test")))
+            >> TerminalUnit()
+        ).build()
+        passed_context = Mock(passed=True)
+        failed_context = Mock(passed=False)
+        # when
+        compiled_results = (flow(passed_context), flow(failed_context))
+        recursive_results = (
+            flow.root(passed_context),
+            flow.root(failed_context),
+        )
+        # then
+        assert compiled_results[0].get() == recursive_results[0].get()
+        assert compiled_results[1].is_error() is True
+        assert recursive_results[1].is_error() is True
 
     def test_complex_units_flow_should_behave_properly(self) -> None:
         # given
@@ -283,3 +418,82 @@ class TestUnits:
         # then
         assert result.is_error() is True
         mock_context.assert_not_called()
+
+    def test_compiled_flow_should_notify_observer(self) -> None:
+        # given
+        class FakeConditionalUnit(ConditionalUnit[Mock, None]):
+            def condition(self, context: Mock) -> bool:
+                return False
+
+        class FakeRunUnit(RunUnit[Mock, None]):
+            def run(self, context: Mock) -> None: ...
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        observer = Mock(spec=FlowObserver)
+        run_unit = FakeRunUnit()
+        on_failure = TerminalUnit()
+        conditional_unit = FakeConditionalUnit(on_failure=on_failure)
+        flow = (run_unit >> conditional_unit >> TerminalUnit()).build()
+        # when
+        result = flow.observed_by(observer)(Mock())
+        # then
+        assert result.is_empty() is True
+        assert [c.args[0] for c in observer.on_unit_start.call_args_list] == [
+            run_unit,
+            conditional_unit,
+            on_failure,
+        ]
+        assert [c.args[1] for c in observer.on_unit_end.call_args_list] == [
+            UnitOutcome.COMPLETED,
+            UnitOutcome.FAILED,
+            UnitOutcome.COMPLETED,
+        ]
+        assert all(
+            isinstance(c.args[2], int) and c.args[2] >= 0
+            for c in observer.on_unit_end.call_args_list
+        )
+        observer.on_branch.assert_called_once_with(
+            conditional_unit, on_failure
+        )
+        observer.on_exception.assert_not_called()
+
+    def test_compiled_flow_should_notify_observer_on_exception(self) -> None:
+        # given
+        error = Exception("test")
+
+        class FakeRunUnit(RunUnit[Mock, None]):
+            def run(self, context: Mock) -> None:
+                raise error
+
+        class TerminalUnit(FinalUnit[Mock, None]):
+            def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        observer = Mock(spec=FlowObserver)
+        run_unit = FakeRunUnit()
+        flow = (run_unit >> TerminalUnit()).build()
+        # when
+        result = flow.observed_by(observer)(Mock())
+        # then
+        assert result.is_error() is True
+        observer.on_exception.assert_called_once_with(run_unit, error)
+        assert observer.on_unit_end.call_args.args[:2] == (
+            run_unit,
+            UnitOutcome.ERROR,
+        )
+
+    def test_compiled_flow_should_skip_noop_observer(self) -> None:
+        # given
+        class TerminalUnit(FinalUnit[Mock, None]):
+            def finish(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        flow = TerminalUnit().build()
+        # when
+        observed = flow.observed_by(NoOpFlowObserver())
+        # then
+        assert observed._observer is None
+        assert observed(Mock()).is_empty() is True
@@ -0,0 +1,55 @@
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.result import Result
+from pyuow.unit import LoggingFlowObserver, UnitOutcome
+
+
+class FakeUnit(Mock):
+    pass
+
+
+class TestLoggingFlowObserver:
+    def test_on_unit_end_should_log_completed_unit(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # given
+        observer = LoggingFlowObserver()
+        # when
+        with caplog.at_level(logging.DEBUG):
+            observer.on_unit_end(
+                FakeUnit(), UnitOutcome.COMPLETED, 10, Result.ok(1)
+            )
+        # then
+        assert caplog.messages == [
+            "[FakeUnit] completed",
+            "[FakeUnit] result [Result.ok(1)]",
+        ]
+
+    def test_on_unit_end_should_log_failed_unit(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # given
+        observer = LoggingFlowObserver()
+        # when
+        with caplog.at_level(logging.DEBUG):
+            observer.on_unit_end(FakeUnit(), UnitOutcome.FAILED, 10)
+        # then
+        assert caplog.messages == ["[FakeUnit] failed"]
+
+    def test_on_exception_should_log_exception(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # given
+        logger = logging.getLogger("test")
+        observer = LoggingFlowObserver(logger=logger)
+        # when
+        with caplog.at_level(logging.DEBUG):
+            observer.on_exception(FakeUnit(), Exception("test"))
+            observer.on_unit_end(FakeUnit(), UnitOutcome.ERROR, 10)
+        # then
+        assert caplog.messages == ["[FakeUnit] failed with exception"]
+        assert caplog.records[0].name == "test"
+        assert caplog.records[0].exc_info is not None
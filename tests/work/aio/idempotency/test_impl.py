@@ -0,0 +1,204 @@
+import asyncio
+import typing as t
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from pyuow.context import BaseImmutableContext, BaseParams
+from pyuow.result import Result
+from pyuow.unit.aio import BaseUnit
+from pyuow.work import IdempotencyKeyInUseError, RetryPolicy
+from pyuow.work.aio.idempotency import (
+    IdempotencyWorkManager,
+    InMemoryIdempotencyStore,
+)
+from pyuow.work.aio.noop import NoOpWorkManager
+from pyuow.work.aio.transactional import (
+    BaseTransaction,
+    BaseTransactionManager,
+    TransactionalWorkManager,
+)
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    request_id: str
+
+
+@dataclass(frozen=True)
+class FakeContext(BaseImmutableContext[FakeParams]):
+    pass
+
+
+def context_of(request_id: str) -> FakeContext:
+    return FakeContext(params=FakeParams(request_id=request_id))
+
+
+class ConflictError(Exception):
+    pass
+
+
+class FakeTransaction(BaseTransaction[Mock]):
+    async def rollback(self) -> None:
+        await self._transaction_provider.rollback()
+
+    async def commit(self) -> None:
+        await self._transaction_provider.commit()
+
+
+class FakeTransactionManager(BaseTransactionManager[FakeTransaction]):
+    def __init__(self, transaction: Mock) -> None:
+        self._transaction = transaction
+
+    @asynccontextmanager
+    async def transaction(self) -> t.AsyncIterator[FakeTransaction]:
+        yield FakeTransaction(self._transaction)
+
+
+class TestIdempotencyWorkManager:
+    async def test_do_with_should_return_stored_result_for_repeated_key(
+        self,
+    ) -> None:
+        # given
+        unit_mock = AsyncMock(side_effect=[Result.ok(1), Result.ok(2)])
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        work = IdempotencyWorkManager(
+            work_manager=NoOpWorkManager(),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        results = [
+            await work.by(unit).do_with(context_of(request_id))
+            for request_id in ("a", "a", "b")
+        ]
+        # then
+        assert [result.get() for result in results] == [1, 1, 2]
+        assert unit_mock.await_count == 2
+
+    async def test_do_with_should_not_store_error_results(self) -> None:
+        # given
+        unit_mock = AsyncMock(
+            side_effect=[Result.error(Exception("test")), Result.ok(1)]
+        )
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        work = IdempotencyWorkManager(
+            work_manager=NoOpWorkManager(),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        first = await work.by(unit).do_with(context_of("a"))
+        second = await work.by(unit).do_with(context_of("a"))
+        # then
+        assert first.is_error() is True
+        assert second.get() == 1
+
+    async def test_do_with_should_reject_concurrent_call_with_same_key(
+        self,
+    ) -> None:
+        # given
+        started, finished = asyncio.Event(), asyncio.Event()
+
+        async def slow(context: FakeContext) -> Result[int]:
+            started.set()
+            await finished.wait()
+            return Result.ok(1)
+
+        unit_mock = AsyncMock(side_effect=slow)
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        work = IdempotencyWorkManager(
+            work_manager=NoOpWorkManager(),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        first = asyncio.ensure_future(work.by(unit).do_with(context_of("a")))
+        await started.wait()
+        second = await work.by(unit).do_with(context_of("a"))
+        finished.set()
+        await first
+        third = await work.by(unit).do_with(context_of("a"))
+        # then
+        assert first.result().get() == 1
+        with pytest.raises(IdempotencyKeyInUseError):
+            second.raise_for_error()
+        assert third.get() == 1
+        assert unit_mock.await_count == 1
+
+    async def test_do_with_should_not_store_result_when_commit_fails(
+        self,
+    ) -> None:
+        # given
+        unit_mock = AsyncMock(side_effect=[Result.ok(1), Result.ok(2)])
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        transaction = AsyncMock()
+        transaction.commit.side_effect = [ConflictError(), None]
+        work = IdempotencyWorkManager(
+            work_manager=TransactionalWorkManager(
+                transaction_manager=FakeTransactionManager(transaction)
+            ),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        with pytest.raises(ConflictError):
+            await work.by(unit).do_with(context_of("a"))
+        second = await work.by(unit).do_with(context_of("a"))
+        # then
+        assert second.get() == 2
+        assert unit_mock.await_count == 2
+
+    async def test_do_with_retry_should_reclaim_key_after_failed_commit(
+        self,
+    ) -> None:
+        # given
+        unit_mock = AsyncMock(side_effect=[Result.ok(1), Result.ok(2)])
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        transaction = AsyncMock()
+        transaction.commit.side_effect = [ConflictError(), None, None]
+        work = IdempotencyWorkManager(
+            work_manager=TransactionalWorkManager(
+                transaction_manager=FakeTransactionManager(transaction),
+                retry_policy=RetryPolicy(
+                    retry_on=(ConflictError,), jitter=lambda low, high: 0.0
+                ),
+            ),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        result = await work.by(unit).do_with_retry(lambda: context_of("a"))
+        repeated = await work.by(unit).do_with(context_of("a"))
+        # then
+        assert result.get() == 2
+        assert repeated.get() == 2
+        assert unit_mock.await_count == 2
+
+
+class TestInMemoryIdempotencyStore:
+    async def test_purge_should_remove_expired_results(self) -> None:
+        # given
+        store = InMemoryIdempotencyStore(ttl=timedelta(microseconds=1))
+        await store.claim("a")
+        await store.complete("a", Result.ok(1))
+        await store.settle("a", committed=True)
+        # when
+        purged = await store.purge()
+        # then
+        assert purged == 1
+        assert await store.get("a") is None
+
+    async def test_settle_should_drop_result_when_not_committed(self) -> None:
+        # given
+        store = InMemoryIdempotencyStore()
+        await store.claim("a")
+        await store.complete("a", Result.ok(1))
+        # when
+        await store.settle("a", committed=False)
+        # then
+        assert await store.get("a") is None
+        assert await store.claim("a") is None
@@ -0,0 +1,163 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from pyuow.context import BaseImmutableContext, BaseParams
+from pyuow.result import Result
+from pyuow.unit.aio import BaseUnit
+from pyuow.work.aio.noop import NoOpWorkManager
+from pyuow.work.aio.singleflight import SingleFlightWorkManager
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    sku: str
+
+
+@dataclass(frozen=True)
+class FakeContext(BaseImmutableContext[FakeParams]):
+    pass
+
+
+class GatedUnit(BaseUnit[FakeContext, str]):
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self, context: FakeContext) -> Result[str]:
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return Result.ok(context.params.sku)
+
+
+def context_of(sku: str) -> FakeContext:
+    return FakeContext(params=FakeParams(sku=sku))
+
+
+class TestSingleFlightWorkManager:
+    async def test_do_with_should_share_execution_for_equal_params(
+        self,
+    ) -> None:
+        # given
+        unit = GatedUnit()
+        work = SingleFlightWorkManager(work_manager=NoOpWorkManager())
+        # when
+        tasks = [
+            asyncio.ensure_future(work.by(unit).do_with(context_of(sku)))
+            for sku in ("a", "a", "b")
+        ]
+        await asyncio.sleep(0)
+        in_flight = work.in_flight
+        unit.release.set()
+        results = await asyncio.gather(*tasks)
+        # then
+        assert [result.get() for result in results] == ["a", "a", "b"]
+        assert unit.started == 2
+        assert in_flight == 2
+        assert work.in_flight == 0
+
+    async def test_do_with_should_use_custom_key(self) -> None:
+        # given
+        unit = GatedUnit()
+        work = SingleFlightWorkManager(
+            work_manager=NoOpWorkManager(), key=lambda context: "all"
+        )
+        # when
+        tasks = [
+            asyncio.ensure_future(work.by(unit).do_with(context_of(sku)))
+            for sku in ("a", "b")
+        ]
+        await asyncio.sleep(0)
+        unit.release.set()
+        results = await asyncio.gather(*tasks)
+        # then
+        assert [result.get() for result in results] == ["a", "a"]
+        assert unit.started == 1
+
+    async def test_do_with_should_keep_execution_when_leader_is_cancelled(
+        self,
+    ) -> None:
+        # given
+        unit = GatedUnit()
+        work = SingleFlightWorkManager(work_manager=NoOpWorkManager())
+        leader = asyncio.ensure_future(work.by(unit).do_with(context_of("a")))
+        follower = asyncio.ensure_future(
+            work.by(unit).do_with(context_of("a"))
+        )
+        await asyncio.sleep(0)
+        # when
+        leader.cancel()
+        await asyncio.sleep(0)
+        unit.release.set()
+        result = await follower
+        # then
+        assert leader.cancelled() is True
+        assert result.get() == "a"
+        assert (unit.started, unit.cancelled) == (1, 0)
+
+    async def test_do_with_should_cancel_execution_when_all_callers_leave(
+        self,
+    ) -> None:
+        # given
+        unit = GatedUnit()
+        work = SingleFlightWorkManager(work_manager=NoOpWorkManager())
+        task = asyncio.ensure_future(work.by(unit).do_with(context_of("a")))
+        await asyncio.sleep(0)
+        # when
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+        # then
+        assert unit.cancelled == 1
+        assert work.in_flight == 0
+
+    async def test_do_with_should_not_reuse_finished_execution(self) -> None:
+        # given
+        unit = GatedUnit()
+        unit.release.set()
+        work = SingleFlightWorkManager(work_manager=NoOpWorkManager())
+        # when
+        await work.by(unit).do_with(context_of("a"))
+        await work.by(unit).do_with(context_of("a"))
+        # then
+        assert unit.started == 2
+
+    async def test_do_with_should_start_new_execution_after_all_callers_left(
+        self,
+    ) -> None:
+        # given
+        unit = GatedUnit()
+        work = SingleFlightWorkManager(work_manager=NoOpWorkManager())
+        task = asyncio.ensure_future(work.by(unit).do_with(context_of("a")))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0)
+        unit.release.set()
+        # when
+        result = await work.by(unit).do_with(context_of("a"))
+        # then
+        assert result.get() == "a"
+        assert unit.started == 2
+
+    async def test_do_with_should_apply_follower_timeout(self) -> None:
+        # given
+        unit = GatedUnit()
+        work = SingleFlightWorkManager(work_manager=NoOpWorkManager())
+        leader = asyncio.ensure_future(work.by(unit).do_with(context_of("a")))
+        await asyncio.sleep(0)
+        # when
+        result = await work.by(unit).do_with(context_of("a"), timeout=0.01)
+        unit.release.set()
+        leader_result = await leader
+        # then
+        assert result.is_error()
+        with pytest.raises(TimeoutError):
+            result.raise_for_error()
+        assert leader_result.get() == "a"
+        assert unit.started == 1
@@ -0,0 +1,168 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from pyuow.work import WorkRejectedError
+from pyuow.work.aio import AdmissionController, AdmissionPolicy
+
+
+async def hold(
+    controller: AdmissionController,
+    release: asyncio.Event,
+    order: t.List[int],
+    index: int,
+) -> None:
+    async with controller.admit():
+        order.append(index)
+        await release.wait()
+
+
+class TestAdmissionController:
+    async def test_admit_should_track_in_flight_and_queued_work(self) -> None:
+        # given
+        controller = AdmissionController(max_in_flight=2)
+        release = asyncio.Event()
+        order: t.List[int] = []
+        # when
+        tasks = [
+            asyncio.ensure_future(hold(controller, release, order, index))
+            for index in range(3)
+        ]
+        await asyncio.sleep(0)
+        in_flight, queued = controller.in_flight, controller.queued
+        release.set()
+        await asyncio.gather(*tasks)
+        # then
+        assert (in_flight, queued) == (2, 1)
+        assert order == [0, 1, 2]
+        assert (controller.in_flight, controller.queued) == (0, 0)
+
+    async def test_admit_should_reject_when_queue_is_full(self) -> None:
+        # given
+        controller = AdmissionController(max_in_flight=1, max_queued=0)
+        release = asyncio.Event()
+        task = asyncio.ensure_future(hold(controller, release, [], 0))
+        await asyncio.sleep(0)
+        # when / then
+        with pytest.raises(WorkRejectedError):
+            async with controller.admit():
+                pass
+        assert controller.rejected == 1
+        release.set()
+        await task
+
+    async def test_admit_should_reject_after_queue_timeout(self) -> None:
+        # given
+        controller = AdmissionController(max_in_flight=1, queue_timeout=0.01)
+        release = asyncio.Event()
+        task = asyncio.ensure_future(hold(controller, release, [], 0))
+        await asyncio.sleep(0)
+        # when / then
+        with pytest.raises(WorkRejectedError):
+            async with controller.admit():
+                pass
+        assert controller.queued == 0
+        release.set()
+        await task
+
+    async def test_admit_should_serve_newest_waiter_first_with_lifo_policy(
+        self,
+    ) -> None:
+        # given
+        controller = AdmissionController(
+            max_in_flight=1, policy=AdmissionPolicy.LIFO
+        )
+        release = asyncio.Event()
+        order: t.List[int] = []
+        # when
+        tasks = []
+        for index in range(3):
+            tasks.append(
+                asyncio.ensure_future(hold(controller, release, order, index))
+            )
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+        # then
+        assert order == [0, 2, 1]
+
+    async def test_admit_should_shed_oldest_waiter_with_lifo_policy(
+        self,
+    ) -> None:
+        # given
+        controller = AdmissionController(
+            max_in_flight=1, max_queued=1, policy=AdmissionPolicy.LIFO
+        )
+        release = asyncio.Event()
+        order: t.List[int] = []
+        tasks = []
+        for index in range(3):
+            tasks.append(
+                asyncio.ensure_future(hold(controller, release, order, index))
+            )
+            await asyncio.sleep(0)
+        # when
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # then
+        assert order == [0, 2]
+        assert isinstance(results[1], WorkRejectedError)
+
+    async def test_admit_should_use_codel_target_when_queue_stays_busy(
+        self,
+    ) -> None:
+        # given
+        controller = AdmissionController(
+            max_in_flight=1,
+            policy=AdmissionPolicy.CODEL,
+            codel_target=0.01,
+            codel_interval=0.02,
+        )
+        release = asyncio.Event()
+        holder = asyncio.ensure_future(hold(controller, release, [], 0))
+        waiter = asyncio.ensure_future(hold(controller, release, [], 1))
+        await asyncio.sleep(0.05)
+        # when / then
+        with pytest.raises(WorkRejectedError):
+            async with controller.admit():
+                pass
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+    async def test_acquire_should_drop_cancelled_waiter(self) -> None:
+        # given
+        controller = AdmissionController(max_in_flight=1)
+        release = asyncio.Event()
+        holder = asyncio.ensure_future(hold(controller, release, [], 0))
+        waiter = asyncio.ensure_future(hold(controller, release, [], 1))
+        await asyncio.sleep(0)
+        # when
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await holder
+        # then
+        assert (controller.in_flight, controller.queued) == (0, 0)
+
+    async def test_acquire_should_skip_cancelled_waiter_when_shedding(
+        self,
+    ) -> None:
+        # given
+        controller = AdmissionController(
+            max_in_flight=1, max_queued=1, policy=AdmissionPolicy.LIFO
+        )
+        release = asyncio.Event()
+        holder = asyncio.ensure_future(hold(controller, release, [], 0))
+        waiter = asyncio.ensure_future(hold(controller, release, [], 1))
+        await asyncio.sleep(0)
+        # when
+        waiter.cancel()
+        asyncio.get_running_loop().call_soon(release.set)
+        granted = await controller.acquire()
+        controller.release()
+        await holder
+        # then
+        assert granted
+        assert waiter.cancelled()
+        assert (controller.in_flight, controller.queued) == (0, 0)
@@ -1,14 +1,22 @@
+import asyncio
 import typing as t
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import pytest
 
 from pyuow.context import BaseImmutableContext, BaseParams
 from pyuow.result import Result
-from pyuow.unit.aio import BaseUnit
+from pyuow.unit import FlowObserver
+from pyuow.unit.aio import BaseUnit, FinalUnit, remaining_time
+from pyuow.work import RetryPolicy, WorkRejectedError
+from pyuow.work.aio import AdmissionController
 from pyuow.work.aio.transactional import (
     BaseTransaction,
     BaseTransactionManager,
+    GroupCommit,
     TransactionalUnitProxy,
     TransactionalWorkManager,
 )
@@ -60,6 +68,30 @@ class FakeTransactionManager(BaseTransactionManager[FakeTransaction]):
         yield FakeTransaction(self._trx_provider_factory())
 
 
+class JoiningTransactionManager(BaseTransactionManager[FakeTransaction]):
+    def __init__(self) -> None:
+        self.opened = 0
+        self._current: ContextVar[t.Optional[FakeTransaction]] = ContextVar(
+            "fake_transaction", default=None
+        )
+
+    @asynccontextmanager
+    async def transaction(self) -> t.AsyncIterator[FakeTransaction]:
+        current = self._current.get()
+
+        if current is not None:
+            yield current
+            return
+
+        self.opened += 1
+        token = self._current.set(FakeTransaction(AsyncMock()))
+
+        try:
+            yield t.cast(FakeTransaction, self._current.get())
+        finally:
+            self._current.reset(token)
+
+
 class TestTransactionalUnitProxy:
     async def test_do_with_should_commit_on_success(self) -> None:
         # given
@@ -93,6 +125,231 @@ class TestTransactionalUnitProxy:
         assert result.is_error()
         transaction.rollback.assert_awaited_once()
 
+    async def test_do_with_should_return_flush_error_and_rollback(
+        self,
+    ) -> None:
+        # given
+        class FlushingTransaction(FakeTransaction):
+            async def flush(self) -> None:
+                await self._transaction_provider.flush()
+
+        class FlushingTransactionManager(FakeTransactionManager):
+            @asynccontextmanager
+            async def transaction(self) -> t.AsyncIterator[FakeTransaction]:
+                yield FlushingTransaction(self._trx_provider_factory())
+
+        error = Exception("conflict")
+        transaction = AsyncMock()
+        transaction.flush.side_effect = error
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FlushingTransactionManager(
+                lambda: transaction
+            ),
+            unit=SuccessUnit(),
+        )
+        # when
+        result = await work_proxy.do_with(FakeContext(params=FakeParams()))
+        # then
+        assert result.is_error()
+        assert transaction.mock_calls == [call.flush(), call.rollback()]
+
+    async def test_do_with_should_run_flow_in_savepoint(self) -> None:
+        # given
+        transaction_manager = FakeTransactionManager(AsyncMock)
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=transaction_manager, unit=SuccessUnit()
+        )
+        # when
+        with patch.object(
+            transaction_manager,
+            "savepoint",
+            wraps=transaction_manager.savepoint,
+        ) as savepoint:
+            result = await work_proxy.do_with(
+                context=FakeContext(params=FakeParams())
+            )
+        # then
+        assert result.is_ok()
+        savepoint.assert_called_once_with()
+
+    async def test_do_with_should_rollback_and_return_error_on_timeout(
+        self,
+    ) -> None:
+        # given
+        class SlowUnit(BaseUnit[FakeContext, FakeOut]):
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                await asyncio.sleep(10)
+                return Result.ok(FakeOut())
+
+        transaction = AsyncMock()
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(lambda: transaction),
+            unit=SlowUnit(),
+        )
+        # when
+        result = await work_proxy.do_with(
+            FakeContext(params=FakeParams()), timeout=0.01
+        )
+        # then
+        with pytest.raises(TimeoutError):
+            result.raise_for_error()
+        transaction.rollback.assert_awaited_once()
+        transaction.commit.assert_not_awaited()
+
+    async def test_do_with_should_return_error_when_admission_rejects(
+        self,
+    ) -> None:
+        # given
+        admission = AdmissionController(max_in_flight=1, max_queued=0)
+        trx_provider_factory = Mock(return_value=AsyncMock())
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(trx_provider_factory),
+            unit=SuccessUnit(),
+            admission=admission,
+        )
+        # when
+        async with admission.admit():
+            result = await work_proxy.do_with(FakeContext(params=FakeParams()))
+        # then
+        with pytest.raises(WorkRejectedError):
+            result.raise_for_error()
+        trx_provider_factory.assert_not_called()
+
+    async def test_do_with_retry_should_rerun_flow_with_fresh_context_on_conflict(
+        self,
+    ) -> None:
+        # given
+        class ConflictError(Exception):
+            pass
+
+        class ConflictOnceUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self) -> None:
+                self.contexts: t.List[FakeContext] = []
+
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                self.contexts.append(context)
+                if len(self.contexts) == 1:
+                    return Result.error(ConflictError())
+                return Result.ok(FakeOut())
+
+        unit = ConflictOnceUnit()
+        transaction = AsyncMock()
+        policy = RetryPolicy(
+            retry_on=(ConflictError,), jitter=lambda low, high: 0.0
+        )
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(lambda: transaction),
+            retry_policy=policy,
+        )
+        # when
+        result = await work.by(unit).do_with_retry(
+            lambda: FakeContext(params=FakeParams())
+        )
+        # then
+        assert result.is_ok()
+        assert unit.contexts[0] is not unit.contexts[1]
+        assert transaction.mock_calls == [call.rollback(), call.commit()]
+        assert (policy.conflicts, policy.retries) == (1, 1)
+
+    async def test_do_with_retry_should_return_last_conflict_when_exhausted(
+        self,
+    ) -> None:
+        # given
+        class ConflictError(Exception):
+            pass
+
+        policy = RetryPolicy(
+            retry_on=(ConflictError,),
+            max_attempts=2,
+            jitter=lambda low, high: 0.0,
+        )
+        unit_mock = AsyncMock(return_value=Result.error(ConflictError()))
+        unit: BaseUnit[FakeContext, FakeOut] = unit_mock
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(AsyncMock),
+            retry_policy=policy,
+        )
+        # when
+        result = await work.by(unit).do_with_retry(
+            lambda: FakeContext(params=FakeParams())
+        )
+        # then
+        assert result.is_error()
+        assert unit_mock.await_count == 2
+        assert policy.exhausted == 1
+
+    async def test_do_with_many_should_use_one_transaction_per_chunk(
+        self,
+    ) -> None:
+        # given
+        class FailOnContextUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self, failing: FakeContext) -> None:
+                self._failing = failing
+
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                if context is self._failing:
+                    return Result.error(Exception("Something went wrong"))
+                return Result.ok(FakeOut())
+
+        contexts = [FakeContext(params=FakeParams()) for _ in range(3)]
+        transaction = AsyncMock()
+        trx_provider_factory = Mock(return_value=transaction)
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(trx_provider_factory),
+            unit=FailOnContextUnit(contexts[1]),
+        )
+        # when
+        results = await work_proxy.do_with_many(contexts, chunk_size=2)
+        # then
+        assert [result.is_ok() for result in results] == [True, False, True]
+        assert trx_provider_factory.call_count == 5
+        assert transaction.mock_calls == [
+            call.commit(),
+            call.rollback(),
+            call.commit(),
+            call.commit(),
+            call.commit(),
+        ]
+
+    async def test_do_with_many_should_keep_results_when_chunk_commit_fails(
+        self,
+    ) -> None:
+        # given
+        contexts = [FakeContext(params=FakeParams()) for _ in range(3)]
+        transaction = AsyncMock()
+        transaction.commit.side_effect = [
+            None,
+            None,
+            None,
+            RuntimeError("commit failed"),
+            None,
+            None,
+        ]
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(
+                Mock(return_value=transaction)
+            ),
+            unit=SuccessUnit(),
+        )
+        # when
+        results = await work_proxy.do_with_many(contexts, chunk_size=1)
+        # then
+        assert [result.is_ok() for result in results] == [True, False, True]
+        with pytest.raises(RuntimeError):
+            results[1].raise_for_error()
+
+    async def test_do_with_many_should_reject_non_positive_chunk_size(
+        self,
+    ) -> None:
+        # given
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(AsyncMock),
+            unit=SuccessUnit(),
+        )
+        # when / then
+        with pytest.raises(ValueError):
+            await work_proxy.do_with_many([], chunk_size=0)
+
 
 class TestTransactionalWorkManager:
     def test_by_should_delegate_unit_to_work_proxy(self) -> None:
@@ -122,3 +379,229 @@ class TestTransactionalWorkManager:
         # then
         assert result.is_ok()
         assert result.get() == FakeOut()
+
+    async def test_by_should_bind_observer_to_compiled_flow(self) -> None:
+        # given
+        class SuccessFinalUnit(FinalUnit[FakeContext, FakeOut]):
+            async def finish(self, context: FakeContext) -> Result[FakeOut]:
+                return Result.ok(FakeOut())
+
+        unit = SuccessFinalUnit()
+        observer = Mock(spec=FlowObserver)
+        transaction = AsyncMock()
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(lambda: transaction),
+            observer=observer,
+        )
+        # when
+        result = await work.by(unit.build()).do_with(FakeContext(FakeParams()))
+        # then
+        assert result.is_ok()
+        observer.on_unit_start.assert_called_once_with(unit)
+
+
+class TestGroupCommit:
+    async def test_do_with_should_share_one_commit_across_concurrent_flows(
+        self,
+    ) -> None:
+        # given
+        class FailOnContextUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self, failing: FakeContext) -> None:
+                self._failing = failing
+
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                if context is self._failing:
+                    return Result.error(Exception("Something went wrong"))
+                return Result.ok(FakeOut())
+
+        contexts = [FakeContext(params=FakeParams()) for _ in range(3)]
+        transaction = AsyncMock()
+        trx_provider_factory = Mock(return_value=transaction)
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(trx_provider_factory),
+            group_commit=GroupCommit(max_size=3, window=10),
+        )
+        proxy = work.by(FailOnContextUnit(contexts[1]))
+        # when
+        results = await asyncio.gather(
+            *(proxy.do_with(context) for context in contexts)
+        )
+        # then
+        assert [result.is_ok() for result in results] == [True, False, True]
+        assert trx_provider_factory.call_count == 4
+        assert transaction.mock_calls == [
+            call.commit(),
+            call.rollback(),
+            call.commit(),
+            call.commit(),
+        ]
+
+    async def test_do_with_should_flush_group_after_window(self) -> None:
+        # given
+        transaction = AsyncMock()
+        trx_provider_factory = Mock(return_value=transaction)
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(trx_provider_factory),
+            group_commit=GroupCommit(max_size=10, window=0.01),
+        )
+        proxy = work.by(SuccessUnit())
+        # when
+        results = await asyncio.gather(
+            proxy.do_with(FakeContext(params=FakeParams())),
+            proxy.do_with(FakeContext(params=FakeParams())),
+        )
+        # then
+        assert all(result.is_ok() for result in results)
+        assert trx_provider_factory.call_count == 3
+
+    async def test_do_with_should_return_error_when_group_commit_fails(
+        self,
+    ) -> None:
+        # given
+        group_transaction = AsyncMock()
+        group_transaction.commit.side_effect = Exception("commit failed")
+        trx_provider_factory = Mock(
+            side_effect=[group_transaction, AsyncMock(), AsyncMock()]
+        )
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(trx_provider_factory),
+            group_commit=GroupCommit(max_size=2),
+        )
+        proxy = work.by(SuccessUnit())
+        # when
+        results = await asyncio.gather(
+            proxy.do_with(FakeContext(params=FakeParams())),
+            proxy.do_with(FakeContext(params=FakeParams())),
+        )
+        # then
+        assert [result.is_error() for result in results] == [True, True]
+
+    async def test_do_with_should_join_batch_transaction_from_nested_flow(
+        self,
+    ) -> None:
+        # given
+        class NestedUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self, inner: BaseUnit[FakeContext, FakeOut]) -> None:
+                self._inner = inner
+
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                return await self._inner(context)
+
+        transaction_manager = JoiningTransactionManager()
+        work = TransactionalWorkManager(
+            transaction_manager=transaction_manager,
+            group_commit=GroupCommit(max_size=1),
+        )
+        proxy = work.by(NestedUnit(work.by(SuccessUnit())))
+        # when
+        result = await proxy.do_with(FakeContext(params=FakeParams()))
+        # then
+        assert result.is_ok()
+        assert transaction_manager.opened == 1
+
+    async def test_do_with_should_run_batch_in_submitter_context(
+        self,
+    ) -> None:
+        # given
+        request_id: ContextVar[t.Optional[str]] = ContextVar(
+            "request_id", default=None
+        )
+        seen: t.List[t.Optional[str]] = []
+
+        class RecordingUnit(BaseUnit[FakeContext, FakeOut]):
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                seen.append(request_id.get())
+                return Result.ok(FakeOut())
+
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(AsyncMock),
+            group_commit=GroupCommit(max_size=1),
+        )
+        proxy = work.by(RecordingUnit())
+        request_id.set("request-1")
+        # when
+        result = await proxy.do_with(FakeContext(params=FakeParams()))
+        # then
+        assert result.is_ok()
+        assert seen == ["request-1"]
+
+    async def test_do_with_should_isolate_callers_sharing_a_batch(
+        self,
+    ) -> None:
+        # given
+        transaction_manager = JoiningTransactionManager()
+        seen: t.List[t.Tuple[FakeTransaction, t.Optional[float]]] = []
+
+        class RecordingUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self, delay: float) -> None:
+                self._delay = delay
+
+            async def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                async with transaction_manager.transaction() as trx:
+                    seen.append((trx, remaining_time()))
+                await asyncio.sleep(self._delay)
+                return Result.ok(FakeOut())
+
+        work = TransactionalWorkManager(
+            transaction_manager=transaction_manager,
+            group_commit=GroupCommit(max_size=2, window=10),
+        )
+
+        async def owner() -> Result[FakeOut]:
+            async with transaction_manager.transaction() as trx:
+                owned.append(trx)
+                return await work.by(RecordingUnit(0)).do_with(
+                    FakeContext(params=FakeParams()), timeout=1.0
+                )
+
+        owned: t.List[FakeTransaction] = []
+        # when
+        fast, slow = await asyncio.gather(
+            owner(),
+            work.by(RecordingUnit(1.0)).do_with(
+                FakeContext(params=FakeParams()), timeout=0.05
+            ),
+        )
+        # then
+        assert fast.is_ok()
+        with pytest.raises(TimeoutError):
+            slow.raise_for_error()
+        assert seen[0][0] is seen[1][0]
+        assert seen[0][0] is not owned[0]
+        assert transaction_manager.opened == 2
+        assert (seen[0][1] or 0) > 0.5
+        assert (seen[1][1] or 1) <= 0.05
+
+    async def test_do_with_should_carry_commit_context_to_each_caller(
+        self,
+    ) -> None:
+        # given
+        committed: ContextVar[bool] = ContextVar("committed", default=False)
+
+        class MarkingTransactionManager(FakeTransactionManager):
+            @asynccontextmanager
+            async def transaction(self) -> t.AsyncIterator[FakeTransaction]:
+                yield FakeTransaction(self._trx_provider_factory())
+                committed.set(True)
+
+        work = TransactionalWorkManager(
+            transaction_manager=MarkingTransactionManager(AsyncMock),
+            group_commit=GroupCommit(max_size=2, window=10),
+        )
+        proxy = work.by(SuccessUnit())
+
+        async def call() -> bool:
+            await proxy.do_with(FakeContext(params=FakeParams()))
+            return committed.get()
+
+        # when
+        results = await asyncio.gather(call(), call())
+        # then
+        assert list(results) == [True, True]
+
+    def test_group_commit_should_reject_invalid_limits(self) -> None:
+        # when / then
+        with pytest.raises(ValueError):
+            GroupCommit(max_size=0)
+        with pytest.raises(ValueError):
+            GroupCommit(window=-1)
@@ -0,0 +1,220 @@
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.context import BaseImmutableContext, BaseParams
+from pyuow.result import Result
+from pyuow.unit import BaseUnit
+from pyuow.work import IdempotencyKeyInUseError, RetryPolicy
+from pyuow.work.idempotency import (
+    IdempotencyClaims,
+    IdempotencyWorkManager,
+    InMemoryIdempotencyStore,
+)
+from pyuow.work.noop import NoOpWorkManager
+from pyuow.work.transactional import (
+    BaseTransaction,
+    BaseTransactionManager,
+    TransactionalWorkManager,
+)
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    request_id: str
+
+
+@dataclass(frozen=True)
+class FakeContext(BaseImmutableContext[FakeParams]):
+    pass
+
+
+def context_of(request_id: str) -> FakeContext:
+    return FakeContext(params=FakeParams(request_id=request_id))
+
+
+class ConflictError(Exception):
+    pass
+
+
+class FakeTransaction(BaseTransaction[Mock]):
+    def rollback(self) -> None:
+        self._transaction_provider.rollback()
+
+    def commit(self) -> None:
+        self._transaction_provider.commit()
+
+
+class FakeTransactionManager(BaseTransactionManager[FakeTransaction]):
+    def __init__(self, transaction: Mock) -> None:
+        self._transaction = transaction
+
+    @contextmanager
+    def transaction(self) -> t.Iterator[FakeTransaction]:
+        yield FakeTransaction(self._transaction)
+
+
+class TestIdempotencyWorkManager:
+    def test_do_with_should_return_stored_result_for_repeated_key(
+        self,
+    ) -> None:
+        # given
+        unit_mock = Mock(side_effect=[Result.ok(1), Result.ok(2)])
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        work = IdempotencyWorkManager(
+            work_manager=NoOpWorkManager(),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        results = [
+            work.by(unit).do_with(context_of(request_id))
+            for request_id in ("a", "a", "b")
+        ]
+        # then
+        assert [result.get() for result in results] == [1, 1, 2]
+        assert unit_mock.call_count == 2
+
+    def test_do_with_should_not_store_error_results(self) -> None:
+        # given
+        unit_mock = Mock(
+            side_effect=[Result.error(Exception("test")), Result.ok(1)]
+        )
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        work = IdempotencyWorkManager(
+            work_manager=NoOpWorkManager(),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        first = work.by(unit).do_with(context_of("a"))
+        second = work.by(unit).do_with(context_of("a"))
+        # then
+        assert first.is_error() is True
+        assert second.get() == 1
+
+    def test_do_with_should_reject_concurrent_call_with_same_key(
+        self,
+    ) -> None:
+        # given
+        work = IdempotencyWorkManager(
+            work_manager=NoOpWorkManager(),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        nested: t.List[Result[int]] = []
+
+        def reentrant(context: FakeContext) -> Result[int]:
+            nested.append(work.by(unit).do_with(context_of("a")))
+            return Result.ok(1)
+
+        unit_mock = Mock(side_effect=reentrant)
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        # when
+        first = work.by(unit).do_with(context_of("a"))
+        second = work.by(unit).do_with(context_of("a"))
+        # then
+        assert first.get() == 1
+        with pytest.raises(IdempotencyKeyInUseError):
+            nested[0].raise_for_error()
+        assert second.get() == 1
+        assert unit_mock.call_count == 1
+
+    def test_do_with_should_not_store_result_when_commit_fails(self) -> None:
+        # given
+        unit_mock = Mock(side_effect=[Result.ok(1), Result.ok(2)])
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        transaction = Mock()
+        transaction.commit.side_effect = [ConflictError(), None]
+        work = IdempotencyWorkManager(
+            work_manager=TransactionalWorkManager(
+                transaction_manager=FakeTransactionManager(transaction)
+            ),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        with pytest.raises(ConflictError):
+            work.by(unit).do_with(context_of("a"))
+        second = work.by(unit).do_with(context_of("a"))
+        # then
+        assert second.get() == 2
+        assert unit_mock.call_count == 2
+
+    def test_do_with_retry_should_reclaim_key_after_failed_commit(
+        self,
+    ) -> None:
+        # given
+        unit_mock = Mock(side_effect=[Result.ok(1), Result.ok(2)])
+        unit: BaseUnit[FakeContext, int] = unit_mock
+        transaction = Mock()
+        transaction.commit.side_effect = [ConflictError(), None, None]
+        work = IdempotencyWorkManager(
+            work_manager=TransactionalWorkManager(
+                transaction_manager=FakeTransactionManager(transaction),
+                retry_policy=RetryPolicy(
+                    retry_on=(ConflictError,), jitter=lambda low, high: 0.0
+                ),
+            ),
+            store=InMemoryIdempotencyStore(),
+            key=lambda context: context.params.request_id,
+        )
+        # when
+        result = work.by(unit).do_with_retry(lambda: context_of("a"))
+        repeated = work.by(unit).do_with(context_of("a"))
+        # then
+        assert result.get() == 2
+        assert repeated.get() == 2
+        assert unit_mock.call_count == 2
+
+
+class TestInMemoryIdempotencyStore:
+    def test_purge_should_remove_expired_results(self) -> None:
+        # given
+        store = InMemoryIdempotencyStore(ttl=timedelta(microseconds=1))
+        store.claim("a")
+        store.complete("a", Result.ok(1))
+        store.settle("a", committed=True)
+        # when
+        purged = store.purge()
+        # then
+        assert purged == 1
+        assert store.get("a") is None
+
+    def test_settle_should_drop_result_when_not_committed(self) -> None:
+        # given
+        store = InMemoryIdempotencyStore()
+        store.claim("a")
+        store.complete("a", Result.ok(1))
+        # when
+        store.settle("a", committed=False)
+        # then
+        assert store.get("a") is None
+        assert store.claim("a") is None
+
+
+class TestIdempotencyClaims:
+    def test_abandon_should_collect_keys_from_concurrent_threads(
+        self,
+    ) -> None:
+        # given
+        claims = IdempotencyClaims()
+        contexts = [context_of(str(index)) for index in range(200)]
+
+        def abandon(context: FakeContext) -> None:
+            claims.hold(context, context.params.request_id)
+            claims.abandon(context)
+
+        # when
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(abandon, contexts))
+        # then
+        assert sorted(claims.abandoned()) == sorted(
+            context.params.request_id for context in contexts
+        )
+        assert claims.abandoned() == []
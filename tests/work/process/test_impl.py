@@ -0,0 +1,79 @@
+import os
+import typing as t
+from dataclasses import dataclass
+
+import pytest
+
+from pyuow.context import BaseImmutableContext, BaseParams
+from pyuow.result import Result
+from pyuow.unit import BaseUnit, FinalUnit
+from pyuow.work.process import ProcessPoolFlowRunner
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    value: int
+
+
+@dataclass(frozen=True)
+class FakeContext(BaseImmutableContext[FakeParams]):
+    pass
+
+
+class SquareUnit(FinalUnit[FakeContext, t.Tuple[int, int]]):
+    def finish(self, context: FakeContext) -> Result[t.Tuple[int, int]]:
+        if context.params.value < 0:
+            raise ValueError("negative")
+        return Result.ok((context.params.value**2, os.getpid()))
+
+
+def square_flow() -> BaseUnit[FakeContext, t.Tuple[int, int]]:
+    return SquareUnit().build()
+
+
+def contexts(count: int) -> t.Iterator[FakeContext]:
+    for value in range(count):
+        yield FakeContext(params=FakeParams(value=value))
+
+
+class TestProcessPoolFlowRunner:
+    def test_map_should_stream_results_in_order(self) -> None:
+        # given
+        with ProcessPoolFlowRunner(
+            square_flow, max_workers=2, chunk_size=3, max_in_flight=2
+        ) as runner:
+            # when
+            results = list(runner.map(contexts(20)))
+        # then
+        assert [result.get()[0] for result in results] == [
+            value**2 for value in range(20)
+        ]
+        assert all(result.get()[1] != os.getpid() for result in results)
+
+    def test_map_should_stream_results_as_completed(self) -> None:
+        # given
+        with ProcessPoolFlowRunner(
+            square_flow, max_workers=2, chunk_size=4
+        ) as runner:
+            # when
+            results = list(runner.map(contexts(20), ordered=False))
+        # then
+        assert sorted(result.get()[0] for result in results) == [
+            value**2 for value in range(20)
+        ]
+
+    def test_map_should_return_error_results(self) -> None:
+        # given
+        with ProcessPoolFlowRunner(square_flow, max_workers=1) as runner:
+            # when
+            results = list(
+                runner.map([FakeContext(params=FakeParams(value=-1))])
+            )
+        # then
+        with pytest.raises(ValueError):
+            results[0].raise_for_error()
+
+    def test_init_should_reject_non_positive_chunk_size(self) -> None:
+        # when / then
+        with pytest.raises(ValueError):
+            ProcessPoolFlowRunner(square_flow, chunk_size=0)
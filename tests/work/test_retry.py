@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.result import Result
+from pyuow.work import RetryPolicy
+
+
+class ConflictError(Exception):
+    pass
+
+
+class TestRetryPolicy:
+    def test_retry_after_should_back_off_exponentially_with_jitter(
+        self,
+    ) -> None:
+        # given
+        jitter = Mock(side_effect=lambda low, high: high)
+        policy = RetryPolicy(
+            retry_on=(ConflictError,),
+            max_attempts=4,
+            base_delay=0.1,
+            max_delay=0.3,
+            jitter=jitter,
+        )
+        # when
+        delays = [
+            policy.retry_after(ConflictError(), attempt)
+            for attempt in (1, 2, 3)
+        ]
+        # then
+        assert delays == [0.1, 0.2, 0.3]
+        assert jitter.call_args_list[0].args[0] == 0.0
+        assert (policy.conflicts, policy.retries) == (3, 3)
+
+    def test_retry_after_should_stop_when_attempts_are_exhausted(
+        self,
+    ) -> None:
+        # given
+        policy = RetryPolicy(retry_on=(ConflictError,), max_attempts=2)
+        # when
+        delay = policy.retry_after(Result.error(ConflictError()), 2)
+        # then
+        assert delay is None
+        assert (policy.conflicts, policy.exhausted) == (1, 1)
+
+    @pytest.mark.parametrize(
+        "outcome",
+        [Result.ok(1), Result.error(Exception("test")), Exception("test")],
+    )
+    def test_retry_after_should_ignore_non_conflicts(
+        self, outcome: object
+    ) -> None:
+        # given
+        policy = RetryPolicy(retry_on=(ConflictError,))
+        # when
+        delay = policy.retry_after(outcome, 1)  # type: ignore[arg-type]
+        # then
+        assert delay is None
+        assert policy.conflicts == 0
@@ -1,11 +1,14 @@
 import typing as t
 from contextlib import contextmanager
 from dataclasses import dataclass
-from unittest.mock import Mock
+from unittest.mock import Mock, call, patch
+
+import pytest
 
 from pyuow.context import BaseImmutableContext, BaseParams
 from pyuow.result import Result
-from pyuow.unit import BaseUnit
+from pyuow.unit import BaseUnit, FinalUnit, FlowObserver
+from pyuow.work import RetryPolicy
 from pyuow.work.transactional import (
     BaseTransaction,
     BaseTransactionManager,
@@ -93,6 +96,184 @@ class TestTransactionalUnitProxy:
         assert result.is_error()
         transaction.rollback.assert_called_once()
 
+    def test_do_with_should_return_flush_error_and_rollback(self) -> None:
+        # given
+        class FlushingTransaction(FakeTransaction):
+            def flush(self) -> None:
+                self._transaction_provider.flush()
+
+        class FlushingTransactionManager(FakeTransactionManager):
+            @contextmanager
+            def transaction(self) -> t.Iterator[FakeTransaction]:
+                yield FlushingTransaction(self._trx_provider_factory())
+
+        error = Exception("conflict")
+        transaction = Mock()
+        transaction.flush.side_effect = error
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FlushingTransactionManager(
+                lambda: transaction
+            ),
+            unit=SuccessUnit(),
+        )
+        # when
+        result = work_proxy.do_with(FakeContext(params=FakeParams()))
+        # then
+        assert result.is_error()
+        assert transaction.mock_calls == [call.flush(), call.rollback()]
+
+    def test_do_with_should_run_flow_in_savepoint(self) -> None:
+        # given
+        transaction_manager = FakeTransactionManager(Mock)
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=transaction_manager, unit=SuccessUnit()
+        )
+        # when
+        with patch.object(
+            transaction_manager,
+            "savepoint",
+            wraps=transaction_manager.savepoint,
+        ) as savepoint:
+            result = work_proxy.do_with(
+                context=FakeContext(params=FakeParams())
+            )
+        # then
+        assert result.is_ok()
+        savepoint.assert_called_once_with()
+
+    def test_do_with_retry_should_rerun_flow_with_fresh_context_on_conflict(
+        self,
+    ) -> None:
+        # given
+        class ConflictError(Exception):
+            pass
+
+        class ConflictOnceUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self) -> None:
+                self.contexts: t.List[FakeContext] = []
+
+            def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                self.contexts.append(context)
+                if len(self.contexts) == 1:
+                    return Result.error(ConflictError())
+                return Result.ok(FakeOut())
+
+        unit = ConflictOnceUnit()
+        transaction = Mock()
+        policy = RetryPolicy(
+            retry_on=(ConflictError,), jitter=lambda low, high: 0.0
+        )
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(lambda: transaction),
+            retry_policy=policy,
+        )
+        # when
+        result = work.by(unit).do_with_retry(
+            lambda: FakeContext(params=FakeParams())
+        )
+        # then
+        assert result.is_ok()
+        assert unit.contexts[0] is not unit.contexts[1]
+        assert transaction.mock_calls == [call.rollback(), call.commit()]
+        assert (policy.conflicts, policy.retries) == (1, 1)
+
+    def test_do_with_retry_should_return_last_conflict_when_exhausted(
+        self,
+    ) -> None:
+        # given
+        class ConflictError(Exception):
+            pass
+
+        policy = RetryPolicy(
+            retry_on=(ConflictError,),
+            max_attempts=2,
+            jitter=lambda low, high: 0.0,
+        )
+        unit_mock = Mock(return_value=Result.error(ConflictError()))
+        unit: BaseUnit[FakeContext, FakeOut] = unit_mock
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(Mock),
+            retry_policy=policy,
+        )
+        # when
+        result = work.by(unit).do_with_retry(
+            lambda: FakeContext(params=FakeParams())
+        )
+        # then
+        assert result.is_error()
+        assert unit_mock.call_count == 2
+        assert policy.exhausted == 1
+
+    def test_do_with_many_should_use_one_transaction_per_chunk(self) -> None:
+        # given
+        class FailOnContextUnit(BaseUnit[FakeContext, FakeOut]):
+            def __init__(self, failing: FakeContext) -> None:
+                self._failing = failing
+
+            def __call__(self, context: FakeContext) -> Result[FakeOut]:
+                if context is self._failing:
+                    return Result.error(Exception("Something went wrong"))
+                return Result.ok(FakeOut())
+
+        contexts = [FakeContext(params=FakeParams()) for _ in range(3)]
+        transaction = Mock()
+        trx_provider_factory = Mock(return_value=transaction)
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(trx_provider_factory),
+            unit=FailOnContextUnit(contexts[1]),
+        )
+        # when
+        results = work_proxy.do_with_many(contexts, chunk_size=2)
+        # then
+        assert [result.is_ok() for result in results] == [True, False, True]
+        assert trx_provider_factory.call_count == 5
+        assert transaction.mock_calls == [
+            call.commit(),
+            call.rollback(),
+            call.commit(),
+            call.commit(),
+            call.commit(),
+        ]
+
+    def test_do_with_many_should_keep_results_when_chunk_commit_fails(
+        self,
+    ) -> None:
+        # given
+        contexts = [FakeContext(params=FakeParams()) for _ in range(3)]
+        transaction = Mock()
+        transaction.commit.side_effect = [
+            None,
+            None,
+            None,
+            RuntimeError("commit failed"),
+            None,
+            None,
+        ]
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(
+                Mock(return_value=transaction)
+            ),
+            unit=SuccessUnit(),
+        )
+        # when
+        results = work_proxy.do_with_many(contexts, chunk_size=1)
+        # then
+        assert [result.is_ok() for result in results] == [True, False, True]
+        with pytest.raises(RuntimeError):
+            results[1].raise_for_error()
+
+    def test_do_with_many_should_reject_non_positive_chunk_size(
+        self,
+    ) -> None:
+        # given
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=FakeTransactionManager(Mock),
+            unit=SuccessUnit(),
+        )
+        # when / then
+        with pytest.raises(ValueError):
+            work_proxy.do_with_many([], chunk_size=0)
+
 
 class TestTransactionalWorkManager:
     def test_by_should_delegate_unit_to_work_proxy(self) -> None:
@@ -122,3 +303,22 @@ class TestTransactionalWorkManager:
         # then
         assert result.is_ok()
         assert result.get() == FakeOut()
+
+    def test_by_should_bind_observer_to_compiled_flow(self) -> None:
+        # given
+        class SuccessFinalUnit(FinalUnit[FakeContext, FakeOut]):
+            def finish(self, context: FakeContext) -> Result[FakeOut]:
+                return Result.ok(FakeOut())
+
+        unit = SuccessFinalUnit()
+        observer = Mock(spec=FlowObserver)
+        transaction = Mock()
+        work = TransactionalWorkManager(
+            transaction_manager=FakeTransactionManager(lambda: transaction),
+            observer=observer,
+        )
+        # when
+        result = work.by(unit.build()).do_with(FakeContext(FakeParams()))
+        # then
+        assert result.is_ok()
+        observer.on_unit_start.assert_called_once_with(unit)